@@ -1,10 +1,187 @@
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from components.base_blade import BaseBlade
+from components.base_blade import ACTIVE_SLIDE_FUNCTION, PROGRESS_STOP_FUNCTION, BaseBlade
+from utils.locators import to_css
+
+
+# Index of the active slide (see ACTIVE_SLIDE_FUNCTION)
+ACTIVE_INDEX_SCRIPT = ACTIVE_SLIDE_FUNCTION + """
+const [root, selectors] = arguments;
+return activeSlideIndex([...root.querySelectorAll(selectors.slide)], root.querySelector(selectors.carousel));
+"""
+
+# Active slide index and every slide's card data: title, link, category, date, image, visibility
+CAROUSEL_SLIDES_SCRIPT = ACTIVE_SLIDE_FUNCTION + """
+const [root, selectors] = arguments;
+const slides = [...root.querySelectorAll(selectors.slide)];
+const viewport = root.querySelector(selectors.carousel);
+const bounds = (viewport || root).getBoundingClientRect();
+const text = (slide, selector) => {
+    const element = slide.querySelector(selector);
+    return element && element.textContent.trim() ? element.textContent.trim() : null;
+};
+
+return {
+    active_index: activeSlideIndex(slides, viewport),
+    slides: slides.map((slide, index) => {
+        const link = slide.matches('a[href]') ? slide : slide.querySelector('a[href]');
+        const image = slide.querySelector('img');
+        const date = slide.querySelector(selectors.date);
+        const rect = slide.getBoundingClientRect();
+        return {
+            index,
+            title: text(slide, selectors.title) || (link && link.textContent.trim()) || null,
+            href: link ? link.href : null,
+            target: link ? link.getAttribute('target') : null,
+            category: text(slide, selectors.category),
+            date: date ? date.getAttribute('datetime') || date.textContent.trim() || null : null,
+            image: image ? image.currentSrc || image.src || null : null,
+            in_viewport: rect.width > 0 && rect.left < bounds.right && rect.right > bounds.left,
+        };
+    }),
+};
+"""
+
+# Clicks the next/previous control and resolves once the active slide has changed and every
+# transition/animation it started inside the blade (progress bar excluded) has ended and the
+# carousel has stopped scrolling. Only the first change seen after the click counts, so a later
+# autoplay advance does not move "to". Duration runs from the click to the last of those
+CAROUSEL_STEP_SCRIPT = ACTIVE_SLIDE_FUNCTION + """
+const [root, selectors, forward, timeoutMs, done] = arguments;
+const slides = [...root.querySelectorAll(selectors.slide)];
+const viewport = root.querySelector(selectors.carousel);
+const progress = root.querySelector(selectors.progress);
+const button = root.querySelector(forward ? selectors.next : selectors.previous);
+if (!button) { done({error: `no ${forward ? 'next' : 'previous'} button`}); return; }
+
+const from = activeSlideIndex(slides, viewport);
+const counted = event => !(progress && progress.contains(event.target));
+let running = 0, transitions = 0, changedAt = null, lastMotion = null, to = from;
+const onStart = event => { if (counted(event)) { running += 1; transitions += 1; } };
+const onEnd = event => { if (counted(event)) { running = Math.max(running - 1, 0); lastMotion = performance.now(); } };
+const onScroll = () => { lastMotion = performance.now(); };
+const listeners = [
+    [root, 'transitionrun', onStart], [root, 'animationstart', onStart],
+    [root, 'transitionend', onEnd], [root, 'transitioncancel', onEnd],
+    [root, 'animationend', onEnd], [root, 'animationcancel', onEnd],
+    [viewport || root, 'scroll', onScroll],
+];
+listeners.forEach(([target, type, listener]) => target.addEventListener(type, listener, true));
+
+const started = performance.now();
+button.click();
+
+(function poll() {
+    const now = performance.now();
+    if (changedAt === null) {
+        const index = activeSlideIndex(slides, viewport);
+        if (index !== from) { changedAt = now; to = index; }
+    }
+    const settled = changedAt !== null && running === 0 && (lastMotion === null || now - lastMotion > 100);
+    if (settled || now - started >= timeoutMs) {
+        listeners.forEach(([target, type, listener]) => target.removeEventListener(type, listener, true));
+        const end = settled ? Math.max(changedAt, lastMotion === null ? changedAt : lastMotion) : now;
+        done({
+            from,
+            to,
+            duration_ms: Math.round(end - started),
+            transitions,
+            timed_out: !settled,
+        });
+    } else {
+        setTimeout(poll, 20);
+    }
+})();
+"""
+
+# Pauses (true) or resumes (false) autoplay by stopping only this blade's progress bar (see PROGRESS_STOP_FUNCTION)
+CAROUSEL_PAUSE_SCRIPT = PROGRESS_STOP_FUNCTION + """
+const [root, progressSelector, paused] = arguments;
+stopProgress(root, progressSelector, paused);
+"""
+
+# Declared duration of the progress bar's animation/transition (Web Animations API), null without one
+PROGRESS_PERIOD_FUNCTION = """
+const progressPeriod = progress => (progress && progress.getAnimations
+    ? progress.getAnimations({subtree: true})
+        .map(animation => animation.effect && animation.effect.getComputedTiming().duration)
+        .find(duration => typeof duration === 'number' && duration > 0)
+    : null) || null;
+"""
+
+# Declared autoplay period of the blade's progress bar (see PROGRESS_PERIOD_FUNCTION)
+AUTOPLAY_PERIOD_SCRIPT = PROGRESS_PERIOD_FUNCTION + """
+const [root, progressSelector] = arguments;
+return progressPeriod(root.querySelector(progressSelector));
+"""
+
+# Watches autoplay without interacting: records when the active slide changes and reads the
+# progress bar's declared duration
+CAROUSEL_AUTOPLAY_SCRIPT = ACTIVE_SLIDE_FUNCTION + PROGRESS_PERIOD_FUNCTION + """
+const [root, selectors, advances, timeoutMs, done] = arguments;
+const slides = [...root.querySelectorAll(selectors.slide)];
+const viewport = root.querySelector(selectors.carousel);
+const declared = progressPeriod(root.querySelector(selectors.progress));
+
+const started = performance.now();
+const changes = [];
+let last = activeSlideIndex(slides, viewport);
+
+(function poll() {
+    const now = performance.now();
+    const index = activeSlideIndex(slides, viewport);
+    if (index !== last) {
+        changes.push({at_ms: Math.round(now - started), from: last, to: index});
+        last = index;
+    }
+    if (changes.length > advances || now - started >= timeoutMs) {
+        const intervals = changes.slice(1).map((change, i) => change.at_ms - changes[i].at_ms);
+        const sorted = [...intervals].sort((a, b) => a - b);
+        done({
+            declared_ms: declared ? Math.round(declared) : null,
+            changes,
+            intervals_ms: intervals,
+            period_ms: sorted.length ? sorted[Math.floor(sorted.length / 2)] : null,
+            timed_out: changes.length <= advances,
+        });
+    } else {
+        setTimeout(poll, 20);
+    }
+})();
+"""
 
 
 class ArticleCardCarouselBlade(BaseBlade):
     """Article Card Carousel blade component"""
-    
+
+    # Card locators (inside each slide)
+
+    CARD_TITLE = (By.CSS_SELECTOR, "[data-testid='card-title']")
+    CARD_CATEGORY = (By.CSS_SELECTOR, "[data-testid='card-category']")
+    CARD_DATE = (By.CSS_SELECTOR, "time")
+
+    CRITICAL_LOCATORS = (BaseBlade.CAROUSEL, BaseBlade.SLIDES, BaseBlade.CONTROLS_CONTAINER)
+    OPTIONAL_LOCATORS = (CARD_TITLE, CARD_CATEGORY, CARD_DATE)
+    CAPABILITIES = {
+        "header": {"title": BaseBlade.HEADER_TITLE},
+        "ctas": {"tertiary": (BaseBlade.CTA_TERTIARY, None)},
+        "backdrop": (BaseBlade.BACKDROP_ANY, BaseBlade.BACKDROP_BACKGROUND, None),
+        "carousel": {
+            "carousel": BaseBlade.CAROUSEL,
+            "slides": BaseBlade.SLIDES,
+            "controls": BaseBlade.CONTROLS_CONTAINER,
+            "progress_bar": BaseBlade.PROGRESS_BAR,
+            "previous_button": BaseBlade.PREVIOUS_BUTTON,
+            "next_button": BaseBlade.NEXT_BUTTON,
+        },
+    }
+
+    # Timing expectations: a step slower than the budget, or an autoplay period further than the
+    # tolerance (share) from the progress bar's duration, is a carousel performance regression
+
+    TRANSITION_BUDGET_MS = 1000
+    AUTOPLAY_TOLERANCE = 0.15
+
     def __init__(self, driver, blade_element):
         """
         Args:
@@ -12,4 +189,107 @@ class ArticleCardCarouselBlade(BaseBlade):
             blade_element: The WebElement representing this blade
         """
         super().__init__(driver, blade_element)
-       
\ No newline at end of file
+
+    def _selectors(self):
+        """CSS selectors passed to the carousel scripts"""
+        return {
+            "carousel": to_css(self.CAROUSEL),
+            "slide": to_css(self.SLIDES),
+            "progress": to_css(self.PROGRESS_BAR),
+            "next": to_css(self.NEXT_BUTTON),
+            "previous": to_css(self.PREVIOUS_BUTTON),
+            "title": to_css(self.CARD_TITLE),
+            "category": to_css(self.CARD_CATEGORY),
+            "date": to_css(self.CARD_DATE),
+        }
+
+    # Carousel state methods
+
+    def get_active_index(self):
+        """Get index of the active slide (None for an empty carousel)"""
+        return self.driver.execute_script(ACTIVE_INDEX_SCRIPT, self.blade, self._selectors())
+
+    def get_slides_data(self):
+        """Get every slide's card data in one script
+
+        Returns:
+            list of dicts with index, title, href, target, category, date, image and in_viewport
+        """
+        return self.driver.execute_script(CAROUSEL_SLIDES_SCRIPT, self.blade, self._selectors())["slides"]
+
+    # Carousel navigation methods
+
+    def next_slide(self, timeout=5):
+        """Click next and wait for the transition to end
+
+        Returns:
+            dict with from/to active index, duration_ms, transitions started and timed_out
+        """
+        return self._step(True, timeout)
+
+    def previous_slide(self, timeout=5):
+        """Click previous and wait for the transition to end (same result as next_slide)"""
+        return self._step(False, timeout)
+
+    def go_to_slide(self, index, timeout=5):
+        """Step with next/previous until the slide at index is active
+
+        Returns:
+            list of step results (see next_slide), empty if the slide was already active
+        """
+        count = self.get_slide_count()
+        if not 0 <= index < count:
+            raise IndexError(f"Slide index {index} out of range (0-{count-1})")
+        steps = []
+        current = self.get_active_index()
+        while current != index:
+            if len(steps) >= 2 * count:
+                raise TimeoutException(f"Carousel did not reach slide {index} in {len(steps)} steps, at {current}")
+            step = self._step(current is None or index > current, timeout)
+            if step["timed_out"]:
+                raise TimeoutException(f"Carousel step from slide {step['from']} did not finish in {timeout}s")
+            steps.append(step)
+            current = step["to"]
+        return steps
+
+    def restore_active_slide(self, index, current):
+        """Step back to the recorded slide, waiting for each transition (see BasePage.restore)"""
+        self.go_to_slide(index)
+
+    def _step(self, forward, timeout):
+        """Run one next/previous step in the page"""
+        result = self.driver.execute_async_script(
+            CAROUSEL_STEP_SCRIPT, self.blade, self._selectors(), forward, int(timeout * 1000)
+        )
+        if "error" in result:
+            raise RuntimeError(f"Carousel step failed: {result['error']}")
+        return result
+
+    # Autoplay methods
+
+    def pause_autoplay(self):
+        """Stop autoplay by removing only this blade's progress-bar animation"""
+        self.driver.execute_script(CAROUSEL_PAUSE_SCRIPT, self.blade, to_css(self.PROGRESS_BAR), True)
+
+    def resume_autoplay(self):
+        """Let the progress bar run again, restarting autoplay from a full period"""
+        self.driver.execute_script(CAROUSEL_PAUSE_SCRIPT, self.blade, to_css(self.PROGRESS_BAR), False)
+
+    def get_autoplay_period(self):
+        """Get the progress bar's declared duration in ms (None when it is not animating)"""
+        return self.driver.execute_script(AUTOPLAY_PERIOD_SCRIPT, self.blade, to_css(self.PROGRESS_BAR))
+
+    def measure_autoplay(self, advances=1, timeout=25):
+        """Watch autoplay until it has advanced advances + 1 times, without clicking anything
+
+        Args:
+            advances: Periods to measure; each needs one autoplay advance after the first
+            timeout: Seconds to watch (stay under the driver's script timeout, 30s by default)
+
+        Returns:
+            dict with declared_ms (progress bar duration), changes, intervals_ms,
+            period_ms (median interval) and timed_out
+        """
+        return self.driver.execute_async_script(
+            CAROUSEL_AUTOPLAY_SCRIPT, self.blade, self._selectors(), advances, int(timeout * 1000)
+        )
@@ -1,7 +1,233 @@
+import time
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
+from utils.locators import to_css
+
+
+# Shared by carousel and checkpoint scripts: index of the active slide. A slide is active when it
+# (or a descendant) is aria-selected/current or has an active/selected/current class or data state;
+# unmarked carousels fall back to the slide aligned with the viewport's left edge (null without one)
+ACTIVE_SLIDE_FUNCTION = """
+function activeSlideIndex(slides, viewport) {
+    const ACTIVE_CLASS = /(^|[\\s_-])(active|selected|current)($|[\\s_-])/i;
+    const ACTIVE_DESCENDANT = "[aria-selected='true'], [aria-current]:not([aria-current='false'])";
+    const isActive = element => element.getAttribute('aria-selected') === 'true'
+        || (element.hasAttribute('aria-current') && element.getAttribute('aria-current') !== 'false')
+        || ACTIVE_CLASS.test(element.getAttribute('class') || '')
+        || ['true', 'active', 'selected'].includes(element.dataset.state || element.dataset.active || element.dataset.selected);
+
+    let index = slides.findIndex(isActive);
+    if (index < 0) index = slides.findIndex(slide => slide.querySelector(ACTIVE_DESCENDANT));
+    if (index >= 0) return index;
+    if (!viewport || !slides.length) return null;
+    const left = viewport.getBoundingClientRect().left;
+    const offsets = slides.map(slide => Math.abs(slide.getBoundingClientRect().left - left));
+    return offsets.indexOf(Math.min(...offsets));
+}
+"""
+
+# Shared by freeze and autoplay-pause scripts: stops (or lets run again) the progress-bar animations
+# under root, CSS and script-driven. Their end is what advances a slide, so autoplay stops with them.
+# A style rule keeps animations restarted by the carousel removed too; dropping it restarts the bar
+PROGRESS_STOP_FUNCTION = """
+function stopProgress(root, progressSelector, stopped) {
+    if (!document.getElementById('progress-stopped')) {
+        const style = document.createElement('style');
+        style.id = 'progress-stopped';
+        style.textContent = ['', ' *', '::before', '::after']
+            .map(suffix => `[data-progress-stopped] ${progressSelector}${suffix}`).join(', ')
+            + ' { animation: none !important; transition: none !important; }';
+        document.head.appendChild(style);
+    }
+    root.toggleAttribute('data-progress-stopped', stopped);
+    if (!stopped) return;
+    for (const progress of root.querySelectorAll(progressSelector)) {
+        if (progress.getAnimations) progress.getAnimations({subtree: true}).forEach(animation => animation.cancel());
+    }
+}
+"""
+
+# Samples every video under the given selector for a fixed window and returns playback metrics:
+# readyState, currentTime progression, buffered ranges, dropped frames and first-frame timing.
+# With restart, each video is reloaded first so time to first frame is measured from that load
+# (a video already playing when the probe attaches has no first frame left to observe); load()
+# resets the playback-quality counters, so frames are then counted from zero
+VIDEO_PLAYBACK_SCRIPT = """
+const [root, selector, sampleMs, restart, done] = arguments;
+const videos = [...root.querySelectorAll(selector)];
+if (!videos.length) { done([]); return; }
+
+const now = () => Math.round(performance.now());
+const quality = video => video.getVideoPlaybackQuality ? video.getVideoPlaybackQuality() : null;
+const buffered = video => [...Array(video.buffered.length).keys()].map(i => [video.buffered.start(i), video.buffered.end(i)]);
+
+const samples = videos.map(video => {
+    const loadStarted = restart ? now() : 0;
+    if (restart) {
+        video.load();
+        video.play().catch(() => {});
+    }
+    const sample = {
+        video,
+        loadStarted,
+        readyStateStart: video.readyState,
+        timeStart: video.currentTime,
+        qualityStart: restart ? null : quality(video),
+        firstFrameMs: null,
+        firstFrameBeforeProbe: video.readyState >= 2,
+        progress: 0,
+        lastTime: video.currentTime,
+    };
+    // Accumulate progress across loop restarts (currentTime jumps back to 0)
+    sample.track = () => {
+        const time = video.currentTime;
+        sample.progress += time >= sample.lastTime ? time - sample.lastTime : time;
+        sample.lastTime = time;
+    };
+    video.addEventListener('timeupdate', sample.track);
+    if (!sample.firstFrameBeforeProbe) {
+        const markFirstFrame = () => { if (sample.firstFrameMs === null) sample.firstFrameMs = now(); };
+        if (video.requestVideoFrameCallback) video.requestVideoFrameCallback(markFirstFrame);
+        video.addEventListener('loadeddata', markFirstFrame, {once: true});
+    }
+    return sample;
+});
+const sampleStarted = now();
+
+setTimeout(() => {
+    done(samples.map(sample => {
+        const {video, loadStarted, readyStateStart, timeStart, qualityStart, firstFrameMs, firstFrameBeforeProbe} = sample;
+        sample.track();
+        video.removeEventListener('timeupdate', sample.track);
+        const src = video.currentSrc || video.src;
+        const resources = src ? performance.getEntriesByName(src).filter(entry => entry.startTime >= loadStarted) : [];
+        const resource = resources[resources.length - 1];
+        const qualityEnd = quality(video);
+        const ranges = buffered(video);
+        const ahead = ranges.find(([start, end]) => start <= video.currentTime && video.currentTime <= end);
+        const totalFrames = qualityEnd ? qualityEnd.totalVideoFrames - (qualityStart ? qualityStart.totalVideoFrames : 0) : null;
+        const droppedFrames = qualityEnd ? qualityEnd.droppedVideoFrames - (qualityStart ? qualityStart.droppedVideoFrames : 0) : null;
+        const playingFrom = firstFrameBeforeProbe ? sampleStarted : firstFrameMs;
+        return {
+            src,
+            restarted: restart,
+            ready_state_start: readyStateStart,
+            ready_state: video.readyState,
+            paused: video.paused,
+            error: video.error ? video.error.code : null,
+            current_time_start: timeStart,
+            current_time_end: video.currentTime,
+            advanced_seconds: sample.progress,
+            sample_seconds: sampleMs / 1000,
+            playing_seconds: playingFrom === null ? null : (now() - playingFrom) / 1000,
+            buffered: ranges,
+            buffered_ahead_seconds: ahead ? ahead[1] - video.currentTime : 0,
+            total_frames: totalFrames,
+            dropped_frames: droppedFrames,
+            dropped_frame_ratio: totalFrames ? droppedFrames / totalFrames : null,
+            first_frame_ms: firstFrameMs === null ? null : firstFrameMs - loadStarted,
+            first_frame_before_probe: firstFrameBeforeProbe,
+            first_byte_ms: resource ? Math.round(resource.responseStart - loadStarted) : null,
+        };
+    }));
+}, sampleMs);
+"""
+
+
+# Audits every <img> (including <picture> sources) in the blade: intrinsic vs rendered pixels,
+# decode() result, loading attribute, srcset selection and Resource Timing transfer size
+IMAGE_AUDIT_SCRIPT = """
+const [root, maxPixelRatio, decodeTimeoutMs, done] = arguments;
+const dpr = window.devicePixelRatio || 1;
+const foldY = window.innerHeight;
+
+function decode(img) {
+    if (!img.decode) return Promise.resolve('unsupported');
+    const timeout = new Promise(resolve => setTimeout(() => resolve('timeout'), decodeTimeoutMs));
+    return Promise.race([img.decode().then(() => 'ok', () => 'failed'), timeout]);
+}
+
+const images = [...root.querySelectorAll('img')];
+Promise.all(images.map(decode)).then(decodeResults => done(images.map((img, i) => {
+    const rect = img.getBoundingClientRect();
+    const picture = img.parentElement && img.parentElement.tagName === 'PICTURE' ? img.parentElement : null;
+    const src = img.currentSrc || img.src;
+    const resource = src ? performance.getEntriesByName(src)[0] : null;
+    const neededPixels = rect.width * dpr * rect.height * dpr;
+    const naturalPixels = img.naturalWidth * img.naturalHeight;
+    const aboveFold = rect.width > 0 && rect.top + window.scrollY < foldY;
+    const flags = [];
+
+    if (neededPixels > 0 && naturalPixels > maxPixelRatio * neededPixels) flags.push('oversized');
+    if (aboveFold && img.loading === 'lazy') flags.push('lazy_above_fold');
+    if (decodeResults[i] === 'failed') flags.push('decode_failed');
+
+    return {
+        src,
+        alt: img.alt,
+        natural_width: img.naturalWidth,
+        natural_height: img.naturalHeight,
+        rendered_width: Math.round(rect.width),
+        rendered_height: Math.round(rect.height),
+        device_pixel_ratio: dpr,
+        pixel_ratio: neededPixels > 0 ? naturalPixels / neededPixels : null,
+        decode: decodeResults[i],
+        loading: img.getAttribute('loading'),
+        above_fold: aboveFold,
+        srcset: img.getAttribute('srcset'),
+        sizes: img.getAttribute('sizes'),
+        in_picture: !!picture,
+        picture_sources: picture ? [...picture.querySelectorAll('source')].map(source => ({
+            srcset: source.getAttribute('srcset'), type: source.type, media: source.media,
+        })) : [],
+        transfer_bytes: resource ? resource.transferSize : null,
+        encoded_bytes: resource ? resource.encodedBodySize : null,
+        flags,
+    };
+})));
+"""
+
+# One-round-trip extraction of everything the conformance suite checks: blade visibility, header
+# texts, CTA text/href/target/visibility, backdrop layers and media, and carousel part counts
+CONFORMANCE_SNAPSHOT_SCRIPT = """
+const [root, spec] = arguments;
+const visible = element => !!element && element.getClientRects().length > 0 && getComputedStyle(element).visibility !== 'hidden';
+const text = element => element && element.innerText.trim() ? element.innerText.trim() : null;
+
+const ctas = {};
+for (const [slot, selector] of Object.entries(spec.ctas)) {
+    const cta = root.querySelector(selector);
+    const link = cta && (cta.closest('a[href]') || cta.querySelector('a[href]'));
+    ctas[slot] = cta ? {
+        visible: visible(cta),
+        text: text(cta),
+        href: link ? link.href : null,
+        target: link ? link.getAttribute('target') : null,
+    } : null;
+}
+
+let backdrop = null;
+if (spec.backdrop) {
+    const layer = root.querySelector(spec.backdrop[0]);
+    const background = root.querySelector(spec.backdrop[1]);
+    backdrop = {
+        present: !!layer,
+        background: !!background,
+        video: !!(background && background.querySelector('video')),
+        image: !!(background && background.querySelector('img')),
+    };
+}
+
+return {
+    visible: visible(root),
+    header: Object.fromEntries(Object.entries(spec.header).map(([field, selector]) => [field, text(root.querySelector(selector))])),
+    ctas,
+    backdrop,
+    carousel: Object.fromEntries(Object.entries(spec.carousel).map(([part, selector]) => [part, root.querySelectorAll(selector).length])),
+};
+"""
 
 
 class BaseBlade:
@@ -15,10 +241,33 @@ class BaseBlade:
     PROGRESS_BAR = (By.CSS_SELECTOR, "[data-testid='progress-bar']")
     PREVIOUS_BUTTON = (By.CSS_SELECTOR, "[data-testid='previous-button']")
     NEXT_BUTTON = (By.CSS_SELECTOR, "[data-testid='next-button']")
+    BACKDROP_ANY = (By.CSS_SELECTOR, "[data-testid*='backdrop']")
+    BACKDROP_BACKGROUND = (By.CSS_SELECTOR, "[data-testid='backdrop-background']")
     BLADE_HEADER = (By.CSS_SELECTOR, "[data-testid='bladeheader']")
+    HEADER_TITLE = (By.CSS_SELECTOR, "[data-testid='title']")
+    HEADER_SUPERTITLE = (By.CSS_SELECTOR, "[data-testid='supertitle']")
+    HEADER_DESCRIPTION = (By.CSS_SELECTOR, "[data-testid='description']")
     CTA_PRIMARY = (By.CSS_SELECTOR, "[data-testid='cta-primary']")
     CTA_SECONDARY = (By.CSS_SELECTOR, "[data-testid='cta-secondary']")
     CTA_TERTIARY = (By.CSS_SELECTOR, "[data-testid='cta-tertiary']")
+
+    # Selectors that must exist for the blade's tests to be meaningful (checked by the health probe)
+
+    CRITICAL_LOCATORS = ()
+
+    # Own locators that only some instances of the blade use (not reported as drift when unmatched)
+
+    OPTIONAL_LOCATORS = ()
+
+    # What the blade offers, checked by the conformance suite (see utils/conformance.py):
+    # "header": field -> locator, "ctas": slot -> (locator, expected target, None for same tab),
+    # "backdrop": (layer locator, background locator, "video"/"image"/None), "carousel": part -> locator
+
+    CAPABILITIES = {}
+
+    # Seconds to let transitions finish after scrolling or clicking (skipped when animations are frozen)
+
+    SETTLE_DELAY = 0.3
     
     def __init__(self, driver, blade_element):
         """
@@ -68,21 +317,57 @@ class BaseBlade:
     def scroll_into_view(self):
         """Scroll blade into viewport"""
         self.driver.execute_script("arguments[0].scrollIntoView(true);", self.blade)
+
+    def settle(self):
+        """Wait SETTLE_DELAY for transitions to finish, unless animations are frozen"""
+        if not self.driver.execute_script("return !!window.__animationsFrozen;"):
+            time.sleep(self.SETTLE_DELAY)
     
+    # Checkpoint methods
+
+    def restore_active_slide(self, index, current):
+        """Step from the current active slide back to index with the next/previous controls (see BasePage.restore)"""
+        button = self.NEXT_BUTTON if index > current else self.PREVIOUS_BUTTON
+        for _ in range(abs(index - current)):
+            self.find_element_in_blade(button).click()
+            self.settle()
+
+    # Conformance methods
+
+    def get_conformance_snapshot(self, capabilities=None):
+        """Extract everything the blade's capabilities declare in one script
+
+        Args:
+            capabilities: Capabilities to extract, defaults to the class's CAPABILITIES
+
+        Returns:
+            dict with visible, header (field -> text), ctas (slot -> visible/text/href/target,
+            None when missing), backdrop (present/background/video/image) and carousel (part -> count)
+        """
+        capabilities = self.CAPABILITIES if capabilities is None else capabilities
+        backdrop = capabilities.get("backdrop")
+        spec = {
+            "header": {field: to_css(locator) for field, locator in capabilities.get("header", {}).items()},
+            "ctas": {slot: to_css(locator) for slot, (locator, _) in capabilities.get("ctas", {}).items()},
+            "backdrop": [to_css(backdrop[0]), to_css(backdrop[1])] if backdrop else None,
+            "carousel": {part: to_css(locator) for part, locator in capabilities.get("carousel", {}).items()},
+        }
+        return self.driver.execute_script(CONFORMANCE_SNAPSHOT_SCRIPT, self.blade, spec)
+
     # Backdrop methods
 
     def has_backdrop(self):
         """Check if blade has backdrop"""
-        return self.element_exists_in_blade((By.CSS_SELECTOR, "[data-testid*='backdrop']"))
+        return self.element_exists_in_blade(self.BACKDROP_ANY)
     
     def has_backdrop_background(self):
         """Check if backdrop has background layer"""
-        return self.element_exists_in_blade((By.CSS_SELECTOR, "[data-testid='backdrop-background']"))
+        return self.element_exists_in_blade(self.BACKDROP_BACKGROUND)
     
     def get_backdrop_background(self):
         """Get backdrop background element"""
         try:
-            return self.find_element_in_blade((By.CSS_SELECTOR, "[data-testid='backdrop-background']"))
+            return self.find_element_in_blade(self.BACKDROP_BACKGROUND)
         except NoSuchElementException:
             return None
     
@@ -107,7 +392,38 @@ class BaseBlade:
             except NoSuchElementException:
                 pass
         return False
+
+    def get_backdrop_video_playback(self, sample_seconds=2, restart=False):
+        """Sample backdrop background video playback (progress, buffering, dropped frames) in one in-page script
+
+        Args:
+            sample_seconds: Sampling window
+            restart: Reload each video first to measure first_frame_ms and first_byte_ms (only on a page of your own)
+
+        Returns:
+            list of metrics dicts, one per video (empty if backdrop has no video)
+        """
+        selector = f"{to_css(self.BACKDROP_BACKGROUND)} video"
+        return self.driver.execute_async_script(
+            VIDEO_PLAYBACK_SCRIPT, self.blade, selector, int(sample_seconds * 1000), restart
+        )
     
+    # Image delivery methods
+
+    def audit_images(self, max_pixel_ratio=2, decode_timeout=3):
+        """Audit every image in the blade in one in-page script
+
+        Args:
+            max_pixel_ratio: Intrinsic/needed pixel ratio above which an image is flagged oversized
+            decode_timeout: Seconds to wait for each img.decode()
+
+        Returns:
+            list of per-image dicts; flags lists 'oversized', 'lazy_above_fold', 'decode_failed'
+        """
+        return self.driver.execute_async_script(
+            IMAGE_AUDIT_SCRIPT, self.blade, max_pixel_ratio, int(decode_timeout * 1000)
+        )
+
     # Header methods
 
     def has_blade_header(self):
@@ -118,19 +434,19 @@ class BaseBlade:
         - has_blade_header_direct_child() - for direct children of section
         - has_blade_header_in_content() - for headers within blade-content
         """
-        return self.element_exists_in_blade((By.CSS_SELECTOR, "[data-testid='bladeheader']"))
+        return self.element_exists_in_blade(self.BLADE_HEADER)
 
     def get_blade_header_element(self):
         """Get blade header element"""
         try:
-            return self.find_element_in_blade((By.CSS_SELECTOR, "[data-testid='bladeheader']"))
+            return self.find_element_in_blade(self.BLADE_HEADER)
         except NoSuchElementException:
             return None
     
     def get_title(self):
         """Get main title"""
         try:
-            element = self.find_element_in_blade((By.CSS_SELECTOR, "[data-testid='title']"))
+            element = self.find_element_in_blade(self.HEADER_TITLE)
             return element.text if element.text.strip() else None
         except NoSuchElementException:
             return None
@@ -138,7 +454,7 @@ class BaseBlade:
     def get_super_title(self):
         """Get super title (text above main title)"""
         try:
-            element = self.find_element_in_blade((By.CSS_SELECTOR, "[data-testid='supertitle']"))
+            element = self.find_element_in_blade(self.HEADER_SUPERTITLE)
             return element.text if element.text.strip() else None
         except NoSuchElementException:
             return None
@@ -146,7 +462,7 @@ class BaseBlade:
     def get_description(self):
         """Get description from blade header"""
         try:
-            desc_element = self.find_element_in_blade((By.CSS_SELECTOR, "[data-testid='description']"))
+            desc_element = self.find_element_in_blade(self.HEADER_DESCRIPTION)
             text = desc_element.text.strip()
             return text if text else None
         except NoSuchElementException:
@@ -9,6 +9,12 @@ class CenteredPromotionBlade(BaseBlade):
 
     LINKS = (By.CSS_SELECTOR, "[data-testid='links']")
     CTA_PRIMARY = (By.CSS_SELECTOR, "[data-testid='cta-0']")
+
+    CRITICAL_LOCATORS = (LINKS, CTA_PRIMARY)
+    CAPABILITIES = {
+        "ctas": {"primary": (CTA_PRIMARY, "_blank")},
+        "backdrop": (BaseBlade.BACKDROP_ANY, BaseBlade.BACKDROP_BACKGROUND, "video"),
+    }
     
     def __init__(self, driver, blade_element):
         """
@@ -10,6 +10,13 @@ class GameSimpleMastheadBlade(BaseBlade):
 
     MASTHEAD_LOGO = (By.CSS_SELECTOR, "[data-testid='masthead-logo']")
     H1_TITLE = (By.TAG_NAME, "h1")
+
+    CRITICAL_LOCATORS = (BaseBlade.BLADE_HEADER, MASTHEAD_LOGO, BaseBlade.CTA_PRIMARY)
+    CAPABILITIES = {
+        "header": {"title": H1_TITLE},
+        "ctas": {"primary": (BaseBlade.CTA_PRIMARY, "_blank")},
+        "backdrop": (BaseBlade.BACKDROP_ANY, BaseBlade.BACKDROP_BACKGROUND, "video"),
+    }
     
     def __init__(self, driver, blade_element):
         """
@@ -1,4 +1,3 @@
-import time
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from components.base_blade import BaseBlade
@@ -34,6 +33,19 @@ class IconTabBlade(BaseBlade):
     MEDIA_TITLE = (By.CSS_SELECTOR, ".icon-tab-media-title")
     MEDIA_SUBTITLE = (By.CSS_SELECTOR, ".icon-tab-media-subtitle")
     MEDIA_DESCRIPTION = (By.CSS_SELECTOR, ".icon-tab-media-description")
+
+    CRITICAL_LOCATORS = (ICON_TAB_MAIN, ICON_TAB_MEDIA, BaseBlade.BLADE_HEADER, BaseBlade.SLIDES)
+    OPTIONAL_LOCATORS = (MEDIA_SUBTITLE, MEDIA_DESCRIPTION)
+    CAPABILITIES = {
+        "header": {
+            "supertitle": BaseBlade.HEADER_SUPERTITLE,
+            "title": BaseBlade.HEADER_TITLE,
+            "description": BaseBlade.HEADER_DESCRIPTION,
+        },
+        "ctas": {"primary": (BaseBlade.CTA_PRIMARY, "_blank")},
+        "backdrop": (BACKDROP, BACKGROUND, None),
+        "carousel": {"carousel": BaseBlade.CAROUSEL, "slides": BaseBlade.SLIDES},
+    }
     
     def __init__(self, driver, blade_element):
         """
@@ -75,10 +87,14 @@ class IconTabBlade(BaseBlade):
         if 0 <= index < len(tabs):
          tab = tabs[index]
          self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-         time.sleep(0.3)
+         self.settle()
          tab.click()
         else:
             raise IndexError(f"Tab index {index} out of range (0-{len(tabs)-1})")
+
+    def restore_active_slide(self, index, current):
+        """Click the recorded tab again - tabs are selected directly, not stepped through"""
+        self.click_tab_by_index(index)
     
     # Media section methods (blade-specific)
 
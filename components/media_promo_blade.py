@@ -22,6 +22,13 @@ class MediaPromoBlade(BaseBlade):
     # Media locators
 
     FEATURED_MEDIA = (By.CSS_SELECTOR, "[data-testid='featured-media']")
+
+    CRITICAL_LOCATORS = (MEDIAPROMO_HEADING, MEDIAPROMO_LINKS, FEATURED_MEDIA)
+    CAPABILITIES = {
+        "header": {"supertitle": SUPERTITLE, "title": TITLE, "description": DESCRIPTION},
+        "ctas": {"primary": (HEADER_PRIMARY_CTA, "_blank")},
+        "backdrop": (BaseBlade.BACKDROP_ANY, BaseBlade.BACKDROP_BACKGROUND, "image"),
+    }
     
     def __init__(self, driver, blade_element):
         """
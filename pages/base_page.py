@@ -2,11 +2,93 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.by import By
+from components.base_blade import ACTIVE_SLIDE_FUNCTION, PROGRESS_STOP_FUNCTION, BaseBlade
+from utils.locators import to_css
 import time
 
 
+# Clicks consent/alert close buttons that are present and reports whether any overlay is still shown
+DISMISS_OVERLAYS_SCRIPT = """
+const visible = element => element.getClientRects().length > 0 && getComputedStyle(element).visibility !== 'hidden';
+
+const accept = document.querySelector('.osano-cm-accept-all');
+if (accept && visible(accept)) accept.click();
+const close = document.querySelector("[data-testid='riotbar:banner:button-close']");
+if (close && visible(close)) close.click();
+
+const shown = selector => [...document.querySelectorAll(selector)].some(visible);
+return !shown('.osano-cm-dialog') && !shown('.riotbar-alert-content-inner');
+"""
+
+# Zeroes transition/animation durations and stops carousel progress bars page-wide (see
+# PROGRESS_STOP_FUNCTION). Video/audio is paused, also when it starts later; the page's own timers keep running
+FREEZE_ANIMATIONS_SCRIPT = PROGRESS_STOP_FUNCTION + """
+const progressSelector = arguments[0];
+if (window.__animationsFrozen) return;
+window.__animationsFrozen = true;
+
+const style = document.createElement('style');
+style.id = 'freeze-animations';
+style.textContent = `
+*, *::before, *::after {
+    transition-duration: 0s !important; transition-delay: 0s !important;
+    animation-duration: 0s !important; animation-delay: 0s !important; animation-iteration-count: 1 !important;
+    scroll-behavior: auto !important; caret-color: transparent !important;
+}`;
+document.head.appendChild(style);
+stopProgress(document.documentElement, progressSelector, true);
+
+for (const media of document.querySelectorAll('video, audio')) media.pause();
+document.addEventListener('play', event => event.target.pause(), true);
+"""
+
+# Records URL, history length, window scroll and, per blade root, the active slide index
+# (see ACTIVE_SLIDE_FUNCTION) and carousel scroll offset
+CHECKPOINT_SCRIPT = ACTIVE_SLIDE_FUNCTION + """
+const [roots, slideSelector, carouselSelector] = arguments;
+window.__pageCheckpoint = window.__pageCheckpoint || Math.random().toString(36).slice(2);
+const blades = {};
+for (const [name, selector] of Object.entries(roots)) {
+    const root = document.querySelector(selector);
+    if (!root) continue;
+    const slides = [...root.querySelectorAll(slideSelector)];
+    const carousel = root.querySelector(carouselSelector);
+    blades[name] = {
+        active_index: activeSlideIndex(slides, carousel),
+        slide_count: slides.length,
+        carousel_scroll: carousel ? [carousel.scrollLeft, carousel.scrollTop] : null,
+    };
+}
+return {
+    document: window.__pageCheckpoint,
+    url: location.href,
+    history_length: history.length,
+    scroll: [scrollX, scrollY],
+    blades,
+};
+"""
+
+# Reapplies carousel scroll offsets and the window scroll position without smooth scrolling
+RESTORE_SCROLL_SCRIPT = """
+const [scroll, carousels, carouselSelector] = arguments;
+for (const [selector, [left, top]] of carousels) {
+    const root = document.querySelector(selector);
+    const carousel = root && root.querySelector(carouselSelector);
+    if (carousel) carousel.scrollTo({left, top, behavior: 'instant'});
+}
+window.scrollTo({left: scroll[0], top: scroll[1], behavior: 'instant'});
+return [scrollX, scrollY];
+"""
+
+
 class BasePage:
     """Base class for all page objects"""
+
+    # Registered blades: name -> (root locator, component class), set by pages that have blades
+    BLADES = {}
+
+    # Per-blade capability overrides merged over the component class's CAPABILITIES (see utils/conformance.py)
+    CAPABILITY_OVERRIDES = {}
     
     def __init__(self, driver):
         self.driver = driver
@@ -50,6 +132,87 @@ class BasePage:
         self.driver.save_screenshot(filepath)
         return filepath
 
+    # Animation methods
+
+    def freeze_animations(self):
+        """Make transitions and animations instant, stop carousel autoplay and pause media (timers are left alone)"""
+        self.driver.execute_script(FREEZE_ANIMATIONS_SCRIPT, to_css(BaseBlade.PROGRESS_BAR))
+
+    # Checkpoint methods
+
+    def checkpoint(self):
+        """Record URL, history, windows, scroll position and each registered blade's slide and carousel offset
+
+        Returns:
+            dict to pass to restore()
+        """
+        state = self.driver.execute_script(
+            CHECKPOINT_SCRIPT, self._blade_roots(), to_css(BaseBlade.SLIDES), to_css(BaseBlade.CAROUSEL)
+        )
+        state["window"] = self.driver.current_window_handle
+        state["windows"] = list(self.driver.window_handles)
+        return state
+
+    def restore(self, checkpoint, timeout=10):
+        """Bring the page back to a checkpoint with history steps and clicks, reloading only as a last resort
+
+        Returns:
+            True if the document was replaced and blade components must be re-resolved (see HomePage.refresh_blade)
+        """
+        for handle in self.driver.window_handles:
+            if handle not in checkpoint["windows"]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(checkpoint["window"])
+        self._restore_url(checkpoint, timeout)
+
+        roots = self._blade_roots()
+        current = self.driver.execute_script(
+            CHECKPOINT_SCRIPT, roots, to_css(BaseBlade.SLIDES), to_css(BaseBlade.CAROUSEL)
+        )
+        lost = [
+            name for name, recorded in checkpoint["blades"].items()
+            if recorded["active_index"] is not None and current["blades"].get(name, {}).get("active_index") is None
+        ]
+        if lost:
+            self.driver.get(checkpoint["url"])
+            self.wait_for_page_load(timeout)
+            current = self.driver.execute_script(
+                CHECKPOINT_SCRIPT, roots, to_css(BaseBlade.SLIDES), to_css(BaseBlade.CAROUSEL)
+            )
+        for name, recorded in checkpoint["blades"].items():
+            index = recorded["active_index"]
+            now = current["blades"].get(name, {}).get("active_index")
+            if index is not None and now is not None and now != index:
+                locator, blade_class = self.BLADES[name]
+                blade_class(self.driver, self.wait_for_element(locator, timeout)).restore_active_slide(index, now)
+
+        carousels = [
+            (roots[name], recorded["carousel_scroll"])
+            for name, recorded in checkpoint["blades"].items()
+            if recorded["carousel_scroll"] and name in roots
+        ]
+        self.driver.execute_script(RESTORE_SCROLL_SCRIPT, checkpoint["scroll"], carousels, to_css(BaseBlade.CAROUSEL))
+        return current["document"] != checkpoint["document"]
+
+    def _blade_roots(self):
+        """CSS selector of each registered blade's root"""
+        return {name: to_css(locator) for name, (locator, _) in self.BLADES.items()}
+
+    def _restore_url(self, checkpoint, timeout):
+        """Step back through history until the checkpoint URL is shown, loading it if that fails"""
+        url = checkpoint["url"]
+        # Forward entries left by an earlier restore are dropped by the next navigation,
+        # so a grown history is not the only sign of a navigation
+        steps = self.driver.execute_script("return history.length;") - checkpoint["history_length"]
+        for _ in range(max(steps, 1)):
+            if self.driver.current_url == url:
+                break
+            self.driver.back()
+        if self.driver.current_url != url:
+            self.driver.get(url)
+        self.wait_for_page_load(timeout)
+
     # Banner methods
 
     def dismiss_cookie_banner(self):
@@ -93,3 +256,7 @@ class BasePage:
                 return True
             except:
                 return False
+
+    def try_dismiss_overlays(self):
+        """Click any visible cookie/alert close buttons without waiting; True once no overlay is shown"""
+        return self.driver.execute_script(DISMISS_OVERLAYS_SCRIPT)
@@ -1,10 +1,119 @@
+import hashlib
+import time
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from pages.base_page import BasePage
 from components.game_simple_masthead_blade import GameSimpleMastheadBlade
 from components.article_card_carousel_blade import ArticleCardCarouselBlade
 from components.icon_tab_blade import IconTabBlade
 from components.media_promo_blade import MediaPromoBlade
 from components.centered_promotion_blade import CenteredPromotionBlade
+from utils.locators import to_css
+
+
+# Polls until every blade root and its critical selectors exist, or the timeout expires,
+# and reports what is still missing per blade
+BLADE_HEALTH_SCRIPT = """
+const [spec, timeoutMs, done] = arguments;
+const started = performance.now();
+
+function probe() {
+    const missing = {};
+    let healthy = true;
+    for (const [name, blade] of Object.entries(spec)) {
+        const root = document.querySelector(blade.root);
+        missing[name] = root ? blade.critical.filter(selector => !root.querySelector(selector)) : [blade.root];
+        if (missing[name].length) healthy = false;
+    }
+    return [healthy, missing];
+}
+
+(function poll() {
+    const [healthy, missing] = probe();
+    if (healthy || performance.now() - started >= timeoutMs) {
+        done(missing);
+    } else {
+        setTimeout(poll, 100);
+    }
+})();
+"""
+
+# Marks the current document so render polling can tell it apart from the next one
+START_LOAD_SCRIPT = """
+window.__bladeRenderPending = true;
+window.location.href = arguments[0];
+"""
+
+# Records performance.now() (ms since navigation start) at which each blade is first seen
+# rendered: root laid out, critical selectors present and in-view media loaded. After the
+# load event the first unrendered blade is scrolled into view, so lazy media is fetched
+# the way a reader scrolling down would fetch it
+BLADE_RENDER_SCRIPT = """
+const spec = arguments[0];
+if (window.__bladeRenderPending || location.href === 'about:blank') return null;
+const rendered = window.__bladeRendered || (window.__bladeRendered = {});
+
+const inView = element => {
+    const rect = element.getBoundingClientRect();
+    return rect.bottom > 0 && rect.top < innerHeight && rect.width > 0 && rect.height > 0;
+};
+const mediaReady = root =>
+    [...root.querySelectorAll('img')].every(img => !inView(img) || (img.complete && img.naturalWidth > 0)) &&
+    [...root.querySelectorAll('video')].every(video => !inView(video) || video.readyState >= 2);
+
+let next = null;
+for (const [name, blade] of Object.entries(spec)) {
+    if (rendered[name] !== undefined) continue;
+    const root = document.querySelector(blade.root);
+    const laidOut = root && root.getBoundingClientRect().height > 0;
+    if (laidOut && blade.critical.every(selector => root.querySelector(selector)) && inView(root) && mediaReady(root)) {
+        rendered[name] = Math.round(performance.now());
+    } else if (!next) {
+        next = root;
+    }
+}
+if (next && document.readyState === 'complete') next.scrollIntoView({block: 'center'});
+
+const navigation = performance.getEntriesByType('navigation')[0];
+return {rendered, load_ms: navigation && navigation.loadEventEnd ? Math.round(navigation.loadEventEnd) : null};
+"""
+
+# True once the blade has rendered according to the render timeline (see utils/render_timeline.py)
+# or, without one, once its root is attached and laid out
+BLADE_RENDERED_SCRIPT = """
+const [name, selector] = arguments;
+const timeline = window.__bladeTimeline;
+const blade = timeline && timeline.blades[name];
+if (blade && (blade.first_render_ms !== null || blade.first_visible_ms !== null)) return true;
+const root = document.querySelector(selector);
+return !!root && root.getClientRects().length > 0 && root.getBoundingClientRect().height > 0;
+"""
+
+# Normalized content of each blade subtree: collapsed text plus test ids, hrefs and media
+# sources in document order. Classes, styles and ARIA state are left out, so autoplaying
+# carousels and hover states do not change the result; missing blades map to null
+BLADE_FINGERPRINT_SCRIPT = """
+const roots = arguments[0];
+const collapse = value => (value || '').replace(/\\s+/g, ' ').trim();
+const result = {};
+for (const [name, selector] of Object.entries(roots)) {
+    const root = document.querySelector(selector);
+    if (!root) { result[name] = null; continue; }
+    const parts = [collapse(root.textContent)];
+    for (const element of [root, ...root.querySelectorAll('*')]) {
+        const tag = element.tagName.toLowerCase();
+        const testid = element.getAttribute('data-testid');
+        if (testid) parts.push(`t:${tag}:${testid}`);
+        if (element.hasAttribute('href')) parts.push(`h:${element.getAttribute('href')}`);
+        for (const attribute of ['src', 'srcset', 'poster']) {
+            if (element.hasAttribute(attribute)) parts.push(`s:${tag}:${collapse(element.getAttribute(attribute))}`);
+        }
+    }
+    result[name] = parts.join('\\n');
+}
+return result;
+"""
 
 
 class HomePage(BasePage):
@@ -20,20 +129,135 @@ class HomePage(BasePage):
     ICON_TAB_MULTIPLE_WAYS = (By.ID, "section-home-multiplewaystoplay")
     MEDIA_PROMO = (By.ID, "home-section-slaywithstyle")
     CENTERED_PROMOTION = (By.ID, "centered-promotion-play-for-free")
+
+    # Registered blades: name -> (root locator, component class)
+    BLADES = {
+        "game_simple_masthead": (GAME_SIMPLE_MASTHEAD, GameSimpleMastheadBlade),
+        "article_card_carousel": (ARTICLE_CARD_CAROUSEL, ArticleCardCarouselBlade),
+        "icon_tab_choose_champion": (ICON_TAB_CHOOSE_CHAMPION, IconTabBlade),
+        "icon_tab_multiple_ways": (ICON_TAB_MULTIPLE_WAYS, IconTabBlade),
+        "media_promo": (MEDIA_PROMO, MediaPromoBlade),
+        "centered_promotion": (CENTERED_PROMOTION, CenteredPromotionBlade),
+    }
+
+    # Capabilities of registered blades that differ from their component class
+    CAPABILITY_OVERRIDES = {
+        "icon_tab_choose_champion": {
+            "ctas": {
+                "primary": (IconTabBlade.CTA_PRIMARY, "_blank"),
+                "secondary": (IconTabBlade.CTA_SECONDARY, "_blank"),
+            },
+        },
+    }
     
     def __init__(self, driver):
         super().__init__(driver)
     
-    def load(self):
-        """Navigate to homepage and wait for page load"""
-        self.driver.get(self.URL)
-        self.wait_for_page_load()
+    def load(self, wait_for_page=True):
+        """Navigate to homepage and wait for page load
+
+        Args:
+            wait_for_page: Wait for readyState "complete"; pass False to gate on
+                wait_for_blade_rendered() per blade instead
+        """
+        if wait_for_page:
+            self.driver.get(self.URL)
+            self.wait_for_page_load()
+        else:
+            self.driver.execute_script("window.location.href = arguments[0];", self.URL)
+            self.wait_for_element(self.GAME_SIMPLE_MASTHEAD)
     
     def is_loaded(self):
         """Verify homepage is loaded"""
         return self.driver.current_url == self.URL
+
+    def check_blade_health(self, timeout=5):
+        """Probe all blade roots and their critical selectors in a single script
+
+        Returns:
+            dict of blade name -> list of missing CSS selectors (empty list when healthy)
+        """
+        spec = {
+            name: {
+                "root": to_css(locator),
+                "critical": [to_css(critical) for critical in blade_class.CRITICAL_LOCATORS],
+            }
+            for name, (locator, blade_class) in self.BLADES.items()
+        }
+        return self.driver.execute_async_script(BLADE_HEALTH_SCRIPT, spec, timeout * 1000)
+
+    def measure_blade_render_times(self, timeout=60, poll=0.1):
+        """Load the homepage without blocking and time when each blade finishes rendering
+
+        Returns:
+            dict with "blades" (name -> ms since navigation start, None if not rendered
+            before timeout) and "load_ms" (load event end)
+        """
+        spec = {
+            name: {
+                "root": to_css(locator),
+                "critical": [to_css(critical) for critical in blade_class.CRITICAL_LOCATORS],
+            }
+            for name, (locator, blade_class) in self.BLADES.items()
+        }
+        self.driver.execute_script(START_LOAD_SCRIPT, self.URL)
+
+        result = None
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            result = self.driver.execute_script(BLADE_RENDER_SCRIPT, spec) or result
+            if result and len(result["rendered"]) == len(spec):
+                break
+            time.sleep(poll)
+
+        rendered = result["rendered"] if result else {}
+        return {
+            "blades": {name: rendered.get(name) for name in spec},
+            "load_ms": result["load_ms"] if result else None,
+        }
+    
+    def wait_for_blade_rendered(self, name, timeout=10):
+        """Wait until a registered blade has rendered, without waiting for the whole page
+
+        Returns:
+            True once rendered, False on timeout
+        """
+        locator, _ = self.BLADES[name]
+        try:
+            return WebDriverWait(self.driver, timeout).until(
+                lambda d: d.execute_script(BLADE_RENDERED_SCRIPT, name, to_css(locator))
+            )
+        except TimeoutException:
+            return False
+    
+    def fingerprint_blades(self):
+        """Hash each registered blade's normalized content (text, test ids, hrefs, media sources) in one script
+
+        Returns:
+            dict of blade name -> sha256 hex digest, None for blades not on the page
+        """
+        roots = {name: to_css(locator) for name, (locator, _) in self.BLADES.items()}
+        contents = self.driver.execute_script(BLADE_FINGERPRINT_SCRIPT, roots)
+        return {
+            name: hashlib.sha256(content.encode("utf-8")).hexdigest() if content is not None else None
+            for name, content in contents.items()
+        }
+    
+    def refresh_blade(self, blade, name, scroll=False):
+        """Re-resolve a blade component's root element in place, e.g. after the blade re-rendered"""
+        locator, _ = self.BLADES[name]
+        blade.blade = self.wait_for_element(locator)
+        if scroll:
+            blade.scroll_into_view()
+        return blade
     
     # Blade retrieval methods - return blade component instances
+
+    def get_blade(self, name):
+        """Get registered blade component by name"""
+        locator, blade_class = self.BLADES[name]
+        blade_element = self.wait_for_element(locator)
+        return blade_class(self.driver, blade_element)
     
     def get_game_simple_masthead(self):
         """Get Game Simple Masthead blade component"""
@@ -3,10 +3,48 @@ import pytest
 import os
 import time
 import pytest_html
+import threading
 from datetime import datetime
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.proxy import Proxy, ProxyType
+from selenium.webdriver.remote.command import Command
+from utils.cache_comparison import collect_load_metrics
+from utils.command_timing import CommandRecorder, record_backend_run, render_backend_comparison
+from utils.devtools import DevToolsChannel
+from utils.flake import FlakeEngine
+from utils.fingerprints import IncrementalRun
+from utils.har_proxy import NETWORK_PROFILES, RecordingProxy
+from utils.metrics_exporter import MetricsExporter, SyntheticMetrics
+from utils.proc import driver_pid
+from utils.render_timeline import RenderTimeline
+from utils.stream_report import StreamingResults
+from utils.resource_monitor import ResourceMonitor, ResourceReportColumns, write_resource_report
+from utils.tab_pool import TabPool
+from utils.tracing import SessionTracing
 
 
+# Blade fixture name -> HomePage.BLADES name
+BLADE_FIXTURES = {
+    "masthead": "game_simple_masthead",
+    "carousel_blade": "article_card_carousel",
+    "icon_tab_choose_champion": "icon_tab_choose_champion",
+    "icon_tab_multiple_ways_to_play": "icon_tab_multiple_ways",
+    "media_promo": "media_promo",
+    "centered_promotion": "centered_promotion",
+}
+
+TAB_POOL_KEY = pytest.StashKey()
+INTERACTIVE_CLASSES_KEY = pytest.StashKey()
+HAR_PROXY_KEY = pytest.StashKey()
+RESOURCE_MONITOR_KEY = pytest.StashKey()
+METRICS_KEY = pytest.StashKey()
+TRACER_KEY = pytest.StashKey()
+INCREMENTAL_KEY = pytest.StashKey()
+CHECKPOINT_KEY = pytest.StashKey()
+
 
 def pytest_addoption(parser):
     """Add command line options for test execution"""
@@ -14,7 +52,7 @@ def pytest_addoption(parser):
         "--browser",
         action="store",
         default="firefox",
-        help="Browser to run tests on: firefox or edge"
+        help="Browser to run tests on: firefox, edge or chromium"
     )
     parser.addoption(
         "--headless",
@@ -22,32 +60,390 @@ def pytest_addoption(parser):
         default=False,
         help="Run browser in headless mode"
     )
+    parser.addoption(
+        "--bidi",
+        action="store_true",
+        default=False,
+        help="Open a WebDriver BiDi channel for batched evaluation and network events"
+    )
+    parser.addoption(
+        "--blade-health",
+        action="store",
+        default="fail",
+        choices=("fail", "skip", "off"),
+        help="What to do with a blade's tests when its health probe finds missing selectors: fail, skip or off"
+    )
+    parser.addoption(
+        "--crawl-depth",
+        action="store",
+        type=int,
+        default=1,
+        help="Link hops the live site crawler follows from the homepage"
+    )
+    parser.addoption(
+        "--crawl-tabs",
+        action="store",
+        type=int,
+        default=4,
+        help="Number of browser tabs the crawler loads pages in concurrently"
+    )
+    parser.addoption(
+        "--tabs",
+        action="store",
+        type=int,
+        default=1,
+        help="Load the homepage in N tabs of the session browser and spread test classes across them"
+    )
+    parser.addoption(
+        "--early-start",
+        action="store_true",
+        default=False,
+        help="Start blade tests once their blade has rendered instead of after the full page load"
+    )
+    parser.addoption(
+        "--render-timeline",
+        action="store_true",
+        default=False,
+        help="Install the per-blade render timeline before the homepage loads (render_timeline tests skip without it)"
+    )
+    parser.addoption(
+        "--freeze-animations",
+        action="store_true",
+        default=False,
+        help="Make transitions and animations instant and stop carousel autoplay after the homepage loads"
+    )
+    parser.addoption(
+        "--soak-minutes",
+        action="store",
+        type=float,
+        default=0,
+        help="Loop blade interaction scenarios for N minutes and check memory/latency drift (soak tests)"
+    )
+    parser.addoption(
+        "--resource-monitor",
+        action="store_true",
+        default=False,
+        help="Sample CPU/RSS/threads of the driver and browser processes per test phase from /proc"
+    )
+    parser.addoption(
+        "--metrics-textfile",
+        action="store",
+        default=None,
+        help="Write OpenMetrics/Prometheus metrics to this file (e.g. node_exporter's textfile directory)"
+    )
+    parser.addoption(
+        "--metrics-port",
+        action="store",
+        type=int,
+        default=None,
+        help="Serve OpenMetrics metrics at http://127.0.0.1:PORT/metrics while the suite runs"
+    )
+    parser.addoption(
+        "--trace-spans",
+        action="store_true",
+        default=False,
+        help="Record spans for pytest phases, page object methods, waits and WebDriver commands to reports/trace.*"
+    )
+    parser.addoption(
+        "--trace-endpoint",
+        action="store",
+        default=None,
+        help="Also POST the spans as OTLP/JSON to this collector URL (e.g. http://localhost:4318/v1/traces)"
+    )
+    parser.addoption(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="Carry over blades whose content fingerprint is unchanged since the last green run"
+    )
+    parser.addoption(
+        "--fingerprints",
+        action="store",
+        default=os.path.join("reports", "blade_fingerprints.json"),
+        help="File keeping blade fingerprints of the last green run for --incremental"
+    )
+    parser.addoption(
+        "--blade-reruns",
+        action="store",
+        type=int,
+        default=0,
+        help="Rerun a failed blade test up to N times in-session after re-resolving its blade element"
+    )
+    parser.addoption(
+        "--rerun-scroll",
+        action="store_true",
+        default=False,
+        help="Scroll the refreshed blade into view before a rerun"
+    )
+    parser.addoption(
+        "--flake-history",
+        action="store",
+        default=os.path.join("reports", "flake_history.json"),
+        help="File tracking per-test outcomes and flake rates across runs (used with --blade-reruns)"
+    )
+    parser.addoption(
+        "--quarantine-threshold",
+        action="store",
+        type=float,
+        default=0.3,
+        help="Quarantine tests (failures become xfail) whose flake rate reaches this share; 0 disables"
+    )
+    parser.addoption(
+        "--stream-report",
+        action="store",
+        default=None,
+        help="Append results to JSONL shards in this directory with attachments stored by content hash, "
+             "and render a paginated index.html at session end"
+    )
+    parser.addoption(
+        "--weight-budgets",
+        action="store",
+        default=os.path.join(os.path.dirname(__file__), "page_weight_budgets.json"),
+        help="JSON file with per-blade page weight budgets (transfer_bytes, requests, load_ms)"
+    )
+    parser.addoption(
+        "--third-party-budgets",
+        action="store",
+        default=os.path.join(os.path.dirname(__file__), "third_party_budgets.json"),
+        help="JSON file with third-party budgets per origin, 'default' for other origins and 'total'"
+    )
+    parser.addoption(
+        "--har",
+        action="store_true",
+        default=False,
+        help="Route the browser through a local recording proxy and write a HAR per page load to reports/har"
+    )
+    parser.addoption(
+        "--network-profiles",
+        action="store",
+        default="",
+        help="Comma-separated throttling profiles to run performance tests under (fast-3G, slow-4G, high-latency) or 'all'"
+    )
+    parser.addoption(
+        "--cache-comparison",
+        action="store_true",
+        default=False,
+        help="Compare a cold homepage load with warm visits and a revisit after clearing the HTTP cache"
+    )
+    parser.addoption(
+        "--warm-reloads",
+        action="store",
+        type=int,
+        default=3,
+        help="Warm (cached) homepage visits between the cold load and the revisit after a cache clear"
+    )
+    parser.addoption(
+        "--firefox-system-access",
+        action="store_true",
+        default=False,
+        help="Start Firefox with -remote-allow-system-access (added automatically with --cache-comparison or --network-profiles)"
+    )
+
+def pytest_configure(config):
+    """Register optional plugins (resource columns, metrics, tracing, incremental runs, reruns, streaming)"""
+    if config.getoption("--resource-monitor"):
+        columns = ResourceReportColumns(lambda: config.stash.get(RESOURCE_MONITOR_KEY, None))
+        config.pluginmanager.register(columns, "resource_report_columns")
+    textfile, port = config.getoption("--metrics-textfile"), config.getoption("--metrics-port")
+    if textfile or port is not None:
+        metrics = SyntheticMetrics(MetricsExporter(textfile=textfile, port=port).start(), blade_of)
+        config.stash[METRICS_KEY] = metrics
+        config.pluginmanager.register(metrics, "synthetic_metrics")
+    if config.getoption("--trace-spans") or config.getoption("--trace-endpoint"):
+        tracing = SessionTracing(config)
+        config.stash[TRACER_KEY] = tracing.tracer
+        config.pluginmanager.register(tracing, "session_tracing")
+    if config.getoption("--incremental"):
+        incremental = IncrementalRun(config.getoption("--fingerprints"), blade_of)
+        config.stash[INCREMENTAL_KEY] = incremental
+        config.pluginmanager.register(incremental, "incremental_run")
+    if config.getoption("--blade-reruns") > 0:
+        config.pluginmanager.register(FlakeEngine(config, BLADE_FIXTURES, restore_checkpoint), "flake_engine")
+    if config.getoption("--stream-report") and not config.option.collectonly:
+        config.pluginmanager.register(StreamingResults(config), "streaming_results")
+
+def blade_of(item):
+    """HomePage.BLADES name of the blade fixture item uses, None for page-level tests"""
+    fixture = next((name for name in BLADE_FIXTURES if name in item.fixturenames), None)
+    return BLADE_FIXTURES[fixture] if fixture else None
+
+def running_monitor(config):
+    """ResourceMonitor of the session while it is sampling, else None"""
+    monitor = config.stash.get(RESOURCE_MONITOR_KEY, None)
+    return monitor if monitor and monitor.running else None
+
+# Browser backends
+
+def firefox_options(headless):
+    """Options for Firefox via geckodriver"""
+    options = webdriver.FirefoxOptions()
+    if os.getenv('CI'):
+        options.binary_location = '/usr/bin/firefox'
+    if headless:
+        options.add_argument("--headless")
+    return options
+
+def edge_options(headless):
+    """Options for Edge via msedgedriver"""
+    options = webdriver.EdgeOptions()
+    if headless:
+        options.add_argument("--headless")
+    return options
+
+def chromium_options(headless):
+    """Options for Chromium/Chrome via chromedriver"""
+    options = webdriver.ChromeOptions()
+    if os.getenv('CHROME_BIN'):
+        options.binary_location = os.getenv('CHROME_BIN')
+    if headless:
+        options.add_argument("--headless=new")
+    if os.getenv('CI'):
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+    return options
+
+# Backend name -> (options builder, driver class)
+BROWSER_BACKENDS = {
+    "firefox": (firefox_options, webdriver.Firefox),
+    "edge": (edge_options, webdriver.Edge),
+    "chromium": (chromium_options, webdriver.Chrome),
+}
+
+def needs_system_access(request):
+    """Whether Firefox needs system access to clear the HTTP cache (only the cache_clear options do)"""
+    return any(
+        request.config.getoption(option)
+        for option in ("--firefox-system-access", "--cache-comparison", "--network-profiles")
+    )
+
+def selected_network_profiles(config):
+    """Profile names chosen with --network-profiles ('all' or a comma-separated list)"""
+    option = config.getoption("--network-profiles")
+    names = list(NETWORK_PROFILES) if option == "all" else [name.strip() for name in option.split(",") if name.strip()]
+    unknown = [name for name in names if name not in NETWORK_PROFILES]
+    if unknown:
+        raise pytest.UsageError(f"Unknown network profiles {unknown}, choose from: {', '.join(NETWORK_PROFILES)}")
+    return names
+
+def pytest_generate_tests(metafunc):
+    """With --network-profiles, run performance tests once unthrottled and once per selected profile"""
+    if "network_profile" not in metafunc.fixturenames or not metafunc.definition.get_closest_marker("performance"):
+        return
+    profiles = selected_network_profiles(metafunc.config)
+    if profiles:
+        metafunc.parametrize(
+            "network_profile", [None] + profiles, ids=["unthrottled"] + profiles, indirect=True, scope="session"
+        )
+
+@pytest.fixture(scope="session")
+def network_profile(request, recording_proxy):
+    """Throttling profile the shared homepage is loaded and tested under (None = unthrottled)"""
+    profile = getattr(request, "param", None)
+    if recording_proxy:
+        recording_proxy.set_profile(NETWORK_PROFILES.get(profile))
+    return profile
+
+@pytest.fixture(scope="session")
+def recording_proxy(request):
+    """Local recording/throttling proxy (--har or --network-profiles); with --har, HARs go to reports/har"""
+    har = request.config.getoption("--har")
+    if not har and not request.config.getoption("--network-profiles"):
+        yield None
+        return
+
+    proxy = RecordingProxy().start()
+    request.config.stash[HAR_PROXY_KEY] = proxy
+
+    yield proxy
+
+    del request.config.stash[HAR_PROXY_KEY]
+    if har:
+        try:
+            os.makedirs(os.path.join("reports", "har"), exist_ok=True)
+            for index, page in enumerate(proxy.pages, start=1):
+                proxy.write_har(os.path.join("reports", "har", f"page_{index:03d}.har"), page["id"])
+        except Exception as e:
+            print(f"\n❌ HAR export error: {e}")
+    proxy.stop()
 
 @pytest.fixture(scope="session")
-def session_browser(request):
+def session_browser(request, recording_proxy):
     """Session-scoped browser - one browser for entire test run"""
-    browser_name = request.config.getoption("--browser")
+    browser_name = request.config.getoption("--browser").lower()
     headless = request.config.getoption("--headless")
-    driver = None
-    
-    if browser_name.lower() == "firefox":
-        options = webdriver.FirefoxOptions()
-        if os.getenv('CI'):
-            options.binary_location = '/usr/bin/firefox'
-        if headless:
-            options.add_argument("--headless")
-        driver = webdriver.Firefox(options=options)
-        
-    elif browser_name.lower() == "edge":
-        options = webdriver.EdgeOptions()
-        if headless:
-            options.add_argument("--headless")
-        driver = webdriver.Edge(options=options)
+    bidi = request.config.getoption("--bidi")
+    har = request.config.getoption("--har")
+    started = time.perf_counter()
+
+    if browser_name not in BROWSER_BACKENDS:
+        raise pytest.UsageError(f"Unsupported browser '{browser_name}', choose from: {', '.join(BROWSER_BACKENDS)}")
+    build_options, driver_class = BROWSER_BACKENDS[browser_name]
+    options = build_options(headless)
+    if bidi or har:
+        # HAR entries are built from BiDi network events (the proxy cannot see inside HTTPS)
+        options.enable_bidi = True
+    if browser_name == "firefox" and needs_system_access(request):
+        # Chrome-context scripts (clearing the HTTP cache) need system access on recent Firefox
+        options.add_argument("-remote-allow-system-access")
+    if recording_proxy:
+        options.proxy = Proxy({
+            "proxyType": ProxyType.MANUAL,
+            "httpProxy": recording_proxy.address,
+            "sslProxy": recording_proxy.address,
+        })
+    driver = driver_class(options=options)
     
     driver.set_window_size(1920, 1080)
     driver.implicitly_wait(10)
+
+    recorder = CommandRecorder().install(driver)
+    driver.command_recorder = recorder
+    driver.devtools_channel = DevToolsChannel(driver)
+
+    if recording_proxy:
+        def mark_page_load(command, params, started, elapsed):
+            if command == Command.GET:
+                try:
+                    context = driver.current_window_handle
+                except WebDriverException:
+                    context = None
+                recording_proxy.mark_page(params["url"], started, elapsed * 1000, context)
+
+        recorder.add_listener(mark_page_load)
+
+    if har and not driver.devtools_channel.start_network_capture(recording_proxy.record_browser_event):
+        print("\n⚠️ Browser has no BiDi network events, HAR keeps HTTPS as opaque tunnels")
+
+    metrics = request.config.stash.get(METRICS_KEY, None)
+    if metrics:
+        recorder.add_listener(metrics.record_command)
+
+    tracer = request.config.stash.get(TRACER_KEY, None)
+    if tracer:
+        recorder.add_listener(tracer.record_command)
+
+    monitor = None
+    if request.config.getoption("--resource-monitor"):
+        monitor = ResourceMonitor(driver_pid(driver)).start()
+        request.config.stash[RESOURCE_MONITOR_KEY] = monitor
     
     yield driver
+
+    if monitor:
+        monitor.stop()
+        try:
+            write_resource_report(monitor.records, os.path.join("reports", "resource_monitor.json"))
+        except Exception as e:
+            print(f"\n❌ Resource monitor error: {e}")
+
+    backend = f"{browser_name}+bidi" if bidi or har else browser_name
+    try:
+        runs = record_backend_run(
+            os.path.join("reports", "backend_comparison.json"), backend, recorder, time.perf_counter() - started
+        )
+        render_backend_comparison(runs, os.path.join("reports", "backend_comparison.html"))
+    except Exception as e:
+        print(f"\n❌ Backend comparison error: {e}")
     
     try:
         driver.quit()
@@ -55,15 +451,222 @@ def session_browser(request):
         pass
 
 @pytest.fixture(scope="session")
-def home_page(session_browser):
-    """Shared homepage fixture - loads once for all tests"""
+def devtools(session_browser):
+    """BiDi/CDP channel for batched evaluation and network events (falls back to classic WebDriver)"""
+    return session_browser.devtools_channel
+
+@pytest.fixture(scope="session")
+def render_timeline(request):
+    """Per-blade render timeline, injected at the start of every navigation over BiDi/CDP (--render-timeline)"""
     from pages.home_page import HomePage
+    if not request.config.getoption("--render-timeline"):
+        pytest.skip("Run with --render-timeline to install the render timeline before the homepage loads")
+    timeline = RenderTimeline(request.getfixturevalue("devtools"), HomePage.BLADES)
+    timeline.install()
+    yield timeline
+    try:
+        timeline.uninstall()
+    except Exception:
+        pass
+
+@pytest.fixture(scope="session")
+def home_page(request, session_browser, network_profile):
+    """Shared homepage fixture - loads once for all tests (once per network profile with --network-profiles)"""
+    from pages.home_page import HomePage
+    if request.config.getoption("--render-timeline"):
+        # Installed before the load so the timeline starts with the navigation
+        request.getfixturevalue("render_timeline")
     home = HomePage(session_browser)
-    home.load()
+    early_start = request.config.getoption("--early-start")
+    home.load(wait_for_page=not early_start)
+    metrics = request.config.stash.get(METRICS_KEY, None)
+    if metrics:
+        # Single attempt with --early-start: the load event may not have fired yet
+        metrics.record_page_load(collect_load_metrics(home.driver, timeout=0 if early_start else 30))
+    home.blade_health = home.check_blade_health()
+    incremental = request.config.stash.get(INCREMENTAL_KEY, None)
+    if incremental:
+        incremental.fingerprint(home)
     home.dismiss_cookie_banner()
     home.dismiss_riot_alert()
+    if request.config.getoption("--freeze-animations"):
+        home.freeze_animations()
     return home
 
+@pytest.fixture(scope="session", autouse=True)
+def tab_pool(request):
+    """Tab pool - with --tabs N, loads the homepage in N tabs of one browser and pins test classes to tabs"""
+    size = request.config.getoption("--tabs")
+    if size <= 1:
+        yield None
+        return
+    if request.config.getoption("--network-profiles"):
+        raise pytest.UsageError("--tabs cannot be combined with --network-profiles, pooled tabs keep one profile's load")
+
+    from pages.home_page import HomePage
+    home_page = request.getfixturevalue("home_page")
+    pool = TabPool(home_page.driver, size, include_current=True).open()
+    extra_handles = pool.handles[1:]
+
+    for handle in extra_handles:
+        pool.start_navigation(handle, HomePage.URL)
+    pool.wait_until_ready(extra_handles)
+    pool.dispatch(
+        [(handle, lambda driver: HomePage(driver).try_dismiss_overlays()) for handle in extra_handles],
+        timeout=5
+    )
+    if request.config.getoption("--freeze-animations"):
+        for handle in extra_handles:
+            pool.switch_to(handle)
+            HomePage(home_page.driver).freeze_animations()
+    pool.switch_to(pool.handles[0])
+    request.config.stash[TAB_POOL_KEY] = pool
+
+    yield pool
+
+    del request.config.stash[TAB_POOL_KEY]
+    pool.close()
+
+def class_key(cls):
+    """Unique name of a test class across modules"""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+def pytest_collection_finish(session):
+    """Remember test classes with interactive tests; they stay on the tab pool's first tab"""
+    session.config.stash[INTERACTIVE_CLASSES_KEY] = {
+        class_key(item.cls) for item in session.items if item.cls and item.get_closest_marker("interactive")
+    }
+
+def tab_key(item):
+    """Tab pool key of item's class, None for module-level tests and classes with interactive tests"""
+    if not item.cls or class_key(item.cls) in item.config.stash.get(INTERACTIVE_CLASSES_KEY, set()):
+        return None
+    return class_key(item.cls)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    """Switch to the test class's tab and apply its network profile before its fixtures resolve"""
+    pool = item.config.stash.get(TAB_POOL_KEY, None)
+    key = tab_key(item)
+    if pool:
+        pool.switch_to(pool.handle_for(key) if key else pool.handles[0])
+    proxy = item.config.stash.get(HAR_PROXY_KEY, None)
+    if proxy:
+        # Tests outside the --network-profiles parametrization run unthrottled
+        callspec = getattr(item, "callspec", None)
+        proxy.set_profile(NETWORK_PROFILES.get(callspec.params.get("network_profile")) if callspec else None)
+    monitor = running_monitor(item.config)
+    if monitor:
+        monitor.begin(item.nodeid, "setup")
+
+    yield
+
+    # The browser (and monitor) may have started during this setup
+    monitor = running_monitor(item.config)
+    if monitor:
+        monitor.end()
+
+    # The first test runs before the pool exists; pin its class to the tab it was set up in
+    pool = item.config.stash.get(TAB_POOL_KEY, None)
+    if pool and key and key not in pool.assignments:
+        pool.assign(key, pool.driver.current_window_handle)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Attribute browser resource usage to the test call"""
+    monitor = running_monitor(item.config)
+    if monitor:
+        monitor.begin(item.nodeid, "call")
+    yield
+    if monitor:
+        monitor.end()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Attribute browser resource usage to the test teardown"""
+    monitor = running_monitor(item.config)
+    if monitor:
+        monitor.begin(item.nodeid, "teardown")
+    yield
+    if monitor:
+        monitor.end()
+
+@pytest.fixture(scope="session")
+def blade_gate(request, home_page):
+    """Health gate for blade fixtures - stops a broken blade's tests before they burn implicit waits"""
+    mode = request.config.getoption("--blade-health")
+    incremental = request.config.stash.get(INCREMENTAL_KEY, None)
+
+    def check(blade_name):
+        if incremental and incremental.carry_over(blade_name):
+            pytest.skip(f"Blade '{blade_name}' carried over: unchanged since the last green run")
+        missing = home_page.blade_health.get(blade_name, [])
+        if mode == "off" or not missing:
+            home_page.wait_for_blade_rendered(blade_name)
+            return
+        reason = f"Blade '{blade_name}' failed health probe, missing: {', '.join(missing)}"
+        if mode == "skip":
+            pytest.skip(reason)
+        pytest.fail(reason, pytrace=False)
+
+    return check
+
+def restore_checkpoint(item):
+    """Restore the shared homepage to item's checkpoint, handling overlays and animations again if it reloaded
+
+    Returns:
+        True if the document was replaced, None when item has no checkpoint
+    """
+    if CHECKPOINT_KEY not in item.stash:
+        return None
+    home_page, checkpoint = item.stash[CHECKPOINT_KEY]
+    replaced = home_page.restore(checkpoint)
+    if replaced:
+        home_page.dismiss_cookie_banner()
+        home_page.dismiss_riot_alert()
+        if item.config.getoption("--freeze-animations"):
+            home_page.freeze_animations()
+    return replaced
+
+@pytest.fixture(autouse=True)
+def page_checkpoint(request):
+    """Checkpoint the shared homepage before an interactive test and restore it afterwards"""
+    if not request.node.get_closest_marker("interactive"):
+        yield
+        return
+
+    home_page = request.getfixturevalue("home_page")
+    request.node.stash[CHECKPOINT_KEY] = (home_page, home_page.checkpoint())
+
+    yield
+
+    try:
+        replaced = restore_checkpoint(request.node)
+    finally:
+        del request.node.stash[CHECKPOINT_KEY]
+    fixture = next((name for name in BLADE_FIXTURES if name in request.node.funcargs), None)
+    if replaced and fixture:
+        home_page.refresh_blade(request.node.funcargs[fixture], BLADE_FIXTURES[fixture])
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that keeps request logging out of test output"""
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture(scope="session")
+def replay_server():
+    """Local replay stand-in for the site - serves tests/replay over HTTP, yields base URL"""
+    directory = os.path.join(os.path.dirname(__file__), "replay")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=directory))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
 @pytest.fixture(scope="session", autouse=True)
 def create_reports_folders():
     """Create necessary folders for reports and screenshots"""
@@ -77,6 +680,11 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     extras = getattr(report, "extras", [])
+
+    monitor = item.config.stash.get(RESOURCE_MONITOR_KEY, None)
+    record = monitor.record_for(item.nodeid, report.when) if monitor else None
+    if record:
+        report.user_properties.append(("browser_resources", record))
     
     if report.when == "call" and report.failed:
         driver = None
@@ -89,16 +697,7 @@ def pytest_runtest_makereport(item, call):
             driver = item.funcargs["home_page"].driver
         
         # Get blade fixture
-        blade_fixture_names = [
-            "masthead",
-            "carousel_blade", 
-            "icon_tab_choose_champion",
-            "icon_tab_multiple_ways_to_play",
-            "media_promo",
-            "centered_promotion"
-        ]
-        
-        for fixture_name in blade_fixture_names:
+        for fixture_name in BLADE_FIXTURES:
             if fixture_name in item.funcargs:
                 blade = item.funcargs[fixture_name]
                 break
@@ -107,7 +706,8 @@ def pytest_runtest_makereport(item, call):
         if blade and hasattr(blade, 'scroll_into_view'):
             try:
                 blade.scroll_into_view()
-                time.sleep(0.7)
+                if not blade.driver.execute_script("return !!window.__animationsFrozen;"):
+                    time.sleep(0.7)
             except:
                 pass
         
@@ -121,18 +721,30 @@ def pytest_runtest_makereport(item, call):
                 driver.save_screenshot(screenshot_path)
                 print(f"\n📸 Screenshot saved: {screenshot_path}")
                 
-                # Read image and encode to base64 STRING
-                with open(screenshot_path, 'rb') as f:
-                    image_bytes = f.read()
-                
-                import base64
-                image_base64 = base64.b64encode(image_bytes).decode('utf-8')
-                
-                # Pass base64 string to pytest-html
-                extras.append(pytest_html.extras.png(image_base64))
+                if item.config.pluginmanager.has_plugin("streaming_results"):
+                    # The streaming report stores the file itself; skip the base64 round trip
+                    extras.append(pytest_html.extras.png(os.path.abspath(screenshot_path)))
+                else:
+                    # Read image and encode to base64 STRING
+                    with open(screenshot_path, 'rb') as f:
+                        image_bytes = f.read()
+                    
+                    image_base64 = base64.b64encode(image_bytes).decode('utf-8')
+                    
+                    # Pass base64 string to pytest-html
+                    extras.append(pytest_html.extras.png(image_base64))
                 print(f"✓ Attached to HTML report")
                     
             except Exception as e:
                 print(f"\n❌ Screenshot error: {e}")
+
+        # Attach the network waterfall of the latest page load to failed performance tests
+        proxy = item.config.stash.get(HAR_PROXY_KEY, None)
+        if proxy and item.get_closest_marker("performance"):
+            try:
+                page_id = proxy.pages[-1]["id"] if proxy.pages else None
+                extras.append(pytest_html.extras.json(proxy.har(page_id), name="HAR"))
+            except Exception as e:
+                print(f"\n❌ HAR attach error: {e}")
     
     report.extras = extras
\ No newline at end of file
@@ -0,0 +1,85 @@
+import pytest
+from components.base_blade import BaseBlade
+from pages.home_page import HomePage
+from utils.conformance import blade_capabilities, check_conformance, conformance_checks
+
+
+# Every applicable check of every registered blade, generated from capabilities
+CASES = [
+    (name, check)
+    for name in HomePage.BLADES
+    for check in conformance_checks(blade_capabilities(HomePage, name))
+]
+
+
+class TestBladeConformance:
+    """Generic conformance suite: each blade's capability checks, run from one snapshot per blade"""
+
+    @pytest.fixture(scope="session")
+    def conformance_snapshot(self, home_page, blade_gate):
+        """Snapshot each blade once (one script round trip) and share it across its checks"""
+        snapshots = {}
+
+        def snapshot(name):
+            if name not in snapshots:
+                blade_gate(name)
+                snapshots[name] = home_page.get_blade(name).get_conformance_snapshot(blade_capabilities(HomePage, name))
+            return snapshots[name]
+
+        return snapshot
+
+    @pytest.mark.parametrize("blade_name, check", CASES, ids=[f"{name}-{check}" for name, check in CASES])
+    def test_conformance(self, conformance_snapshot, blade_name, check):
+        """Verify a blade meets one of its capability checks"""
+        problem = check_conformance(check, conformance_snapshot(blade_name), blade_capabilities(HomePage, blade_name))
+
+        assert problem is None, f"{blade_name}: {problem}"
+
+
+class TestConformanceChecks:
+    """Tests for generating and evaluating conformance checks from capabilities"""
+
+    CAPABILITIES = {
+        "header": {"title": BaseBlade.HEADER_TITLE},
+        "ctas": {"primary": (BaseBlade.CTA_PRIMARY, "_blank"), "tertiary": (BaseBlade.CTA_TERTIARY, None)},
+        "backdrop": (BaseBlade.BACKDROP_ANY, BaseBlade.BACKDROP_BACKGROUND, "video"),
+    }
+
+    SNAPSHOT = {
+        "visible": True,
+        "header": {"title": "FEATURED NEWS"},
+        "ctas": {
+            "primary": {"visible": True, "text": "PLAY", "href": "https://signup.leagueoflegends.com/", "target": "_blank"},
+            "tertiary": {"visible": True, "text": "VIEW ALL", "href": "https://www.leagueoflegends.com/en-us/news/", "target": "_blank"},
+        },
+        "backdrop": {"present": True, "background": True, "video": False, "image": True},
+        "carousel": {},
+    }
+
+    def test_checks_follow_capabilities(self):
+        """Verify only checks for declared capabilities are generated"""
+        checks = conformance_checks(self.CAPABILITIES)
+
+        assert checks[:5] == ["visible", "backdrop", "backdrop_background", "backdrop_video", "header_title"], \
+            f"Unexpected leading checks {checks[:5]}"
+        assert "cta_tertiary_target" in checks, "Every CTA slot should get its own checks"
+        assert not any(check.startswith("carousel_") for check in checks), "Blade without carousel has no carousel checks"
+
+    def test_failures_are_reported_per_check(self):
+        """Verify each check passes or fails on its own part of the snapshot"""
+        failures = {
+            check: check_conformance(check, self.SNAPSHOT, self.CAPABILITIES)
+            for check in conformance_checks(self.CAPABILITIES)
+        }
+
+        assert {check for check, problem in failures.items() if problem} == {"backdrop_video", "cta_tertiary_target"}, \
+            f"Unexpected failures {failures}"
+
+    def test_registry_overrides_replace_class_capabilities(self):
+        """Verify a registry override wins over the component class for that blade only"""
+        choose_champion = blade_capabilities(HomePage, "icon_tab_choose_champion")
+        multiple_ways = blade_capabilities(HomePage, "icon_tab_multiple_ways")
+
+        assert set(choose_champion["ctas"]) == {"primary", "secondary"}, "Override should add the secondary CTA"
+        assert set(multiple_ways["ctas"]) == {"primary"}, "Other IconTab blades should keep the class CTAs"
+        assert choose_champion["header"] == multiple_ways["header"], "Capabilities not overridden come from the class"
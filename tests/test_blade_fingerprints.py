@@ -0,0 +1,149 @@
+import pytest
+from pages.home_page import HomePage
+from utils.fingerprints import load_fingerprints, merge_green_fingerprints, save_fingerprints, unchanged_blades
+from utils.tab_pool import isolated_tab
+
+
+class TestFingerprintStore:
+    """Tests for carrying blade fingerprints over between incremental runs"""
+
+    def test_unchanged_blades(self):
+        """Verify only blades with an identical, present fingerprint count as unchanged"""
+        current = {"media_promo": "a", "centered_promotion": "b", "article_card_carousel": None}
+        previous = {"media_promo": "a", "centered_promotion": "x", "article_card_carousel": None}
+
+        assert unchanged_blades(current, previous) == {"media_promo"}, "Only media_promo is unchanged"
+
+    def test_failed_blades_dropped_and_skipped_blades_kept(self, tmp_path):
+        """Verify green blades are updated, failed ones dropped and unrun ones kept"""
+        path = str(tmp_path / "fingerprints.json")
+        previous = {"media_promo": "old", "centered_promotion": "old", "article_card_carousel": "old"}
+        current = {"media_promo": "new", "centered_promotion": "new", "article_card_carousel": "new"}
+        save_fingerprints(path, merge_green_fingerprints(current, previous, {"media_promo"}, {"centered_promotion"}))
+
+        stored = load_fingerprints(path)
+
+        assert stored == {"media_promo": "new", "article_card_carousel": "old"}, f"Unexpected fingerprints {stored}"
+
+    def test_missing_store_is_empty(self, tmp_path):
+        """Verify a first run starts without fingerprints"""
+        assert load_fingerprints(str(tmp_path / "missing.json")) == {}, "Missing file should give no fingerprints"
+
+
+class TestIncrementalRun:
+    """Tests for the --incremental plugin (carry-over and fingerprint saving) in an inner pytest run"""
+
+    # Inner test module: a fake homepage with fixed fingerprints and two gated blade fixtures
+    BLADE_TESTS = """
+import pytest
+from tests.conftest import INCREMENTAL_KEY
+
+class FakeHome:
+    driver = None
+    blade_health = {}
+
+    def fingerprint_blades(self):
+        return {"media_promo": "same", "centered_promotion": "new"}
+
+    def wait_for_blade_rendered(self, name):
+        return True
+
+@pytest.fixture(scope="session")
+def home_page(request):
+    home = FakeHome()
+    request.config.stash[INCREMENTAL_KEY].fingerprint(home)
+    return home
+
+@pytest.fixture(scope="session")
+def media_promo(blade_gate):
+    blade_gate("media_promo")
+
+@pytest.fixture(scope="session")
+def centered_promotion(blade_gate):
+    blade_gate("centered_promotion")
+
+def test_media_promo(media_promo):
+    pass
+
+def test_centered_promotion_title(centered_promotion):
+    pass
+
+def test_centered_promotion_cta(centered_promotion):
+    assert not FAIL_CTA
+"""
+
+    @pytest.fixture
+    def run(self, pytester):
+        """Run the inner suite with --incremental against a store holding last run's fingerprints"""
+        pytester.makeconftest("from tests.conftest import *")
+        store = pytester.path / "fingerprints.json"
+        save_fingerprints(str(store), {"media_promo": "same", "centered_promotion": "old"})
+
+        def run(*args, fail_cta=False):
+            pytester.makepyfile(test_blades=f"FAIL_CTA = {fail_cta}\n" + self.BLADE_TESTS)
+            result = pytester.runpytest_inprocess("--incremental", f"--fingerprints={store}", "-p", "no:cacheprovider", *args)
+            return result, load_fingerprints(str(store))
+
+        return run
+
+    def test_unchanged_blade_carried_over(self, run):
+        """Verify blade_gate skips an unchanged blade and its fingerprint is kept"""
+        result, stored = run()
+
+        result.assert_outcomes(passed=2, skipped=1)
+        result.stdout.fnmatch_lines(["*Carried over (unchanged since last green run): media_promo*"])
+        assert stored == {"media_promo": "same", "centered_promotion": "new"}, \
+            f"Carried-over and fully passed blades should be stored, got {stored}"
+
+    def test_partial_run_keeps_previous_fingerprint(self, run):
+        """Verify a blade with deselected tests is not recorded as green"""
+        result, stored = run("-k", "not cta")
+
+        result.assert_outcomes(passed=1, skipped=1, deselected=1)
+        assert stored["centered_promotion"] == "old", \
+            f"Partly run blade should keep its previous fingerprint, got {stored['centered_promotion']}"
+
+    def test_failed_blade_dropped(self, run):
+        """Verify a blade with a failing test loses its fingerprint"""
+        result, stored = run(fail_cta=True)
+
+        result.assert_outcomes(passed=1, failed=1, skipped=1)
+        assert "centered_promotion" not in stored, f"Failed blade should be dropped, got {stored}"
+
+
+class TestBladeFingerprints:
+    """Tests for HomePage.fingerprint_blades against the local replay homepage"""
+
+    @pytest.fixture(scope="class")
+    def replay_home(self, session_browser, replay_server):
+        """Load the replay homepage in a separate tab"""
+        with isolated_tab(session_browser, f"{replay_server}/"):
+            yield HomePage(session_browser)
+
+    def test_fingerprints_stable_between_calls(self, replay_home):
+        """Verify an unchanged page gives identical fingerprints"""
+        first = replay_home.fingerprint_blades()
+
+        assert first["media_promo"], "Blades on the page should be fingerprinted"
+        assert replay_home.fingerprint_blades() == first, "Fingerprints should be stable"
+
+    def test_content_change_affects_only_its_blade(self, replay_home):
+        """Verify editing one blade's text changes that blade's fingerprint only"""
+        before = replay_home.fingerprint_blades()
+        replay_home.driver.execute_script(
+            "document.getElementById(arguments[0]).querySelector('[data-testid=\"mediapromo-title\"]').textContent += ' NEW';",
+            HomePage.MEDIA_PROMO[1]
+        )
+        after = replay_home.fingerprint_blades()
+        changed = {name for name in before if before[name] != after[name]}
+
+        assert changed == {"media_promo"}, f"Only media_promo should change, changed: {changed}"
+
+    def test_class_changes_ignored(self, replay_home):
+        """Verify carousel state (classes) does not change fingerprints"""
+        before = replay_home.fingerprint_blades()
+        replay_home.driver.execute_script(
+            "document.getElementById(arguments[0]).classList.toggle('is-active');", HomePage.ARTICLE_CARD_CAROUSEL[1]
+        )
+
+        assert replay_home.fingerprint_blades() == before, "Class changes should not affect fingerprints"
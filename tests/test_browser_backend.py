@@ -0,0 +1,31 @@
+import pytest
+from pages.home_page import HomePage
+from utils.locators import to_css
+
+
+class TestBrowserBackend:
+    """Tests for the optional BiDi/CDP channel - same results as classic WebDriver on every backend"""
+
+    def test_batched_evaluation_matches_classic(self, home_page, devtools):
+        """Verify batched blade lookup returns the same result as classic execute_script"""
+        selectors = [to_css(locator) for locator, _ in HomePage.BLADES.values()]
+
+        classic = home_page.driver.execute_script(
+            "return arguments[0].map(selector => !!document.querySelector(selector));", selectors
+        )
+        batched = devtools.evaluate(
+            "(selectors) => selectors.map(selector => !!document.querySelector(selector))", selectors
+        )
+
+        assert batched == classic, \
+            f"{devtools.kind} channel should match classic WebDriver, got {batched} vs {classic}"
+
+    def test_network_capture_records_responses(self, home_page, devtools):
+        """Verify BiDi network capture records responses for a page load"""
+        if not devtools.start_network_capture():
+            pytest.skip(f"Network events need a BiDi session (--bidi), backend channel is '{devtools.kind}'")
+
+        home_page.driver.execute_script("return fetch(location.href, {cache: 'no-store'}).then(r => r.status);")
+
+        assert any(event["url"] and event["url"].startswith("https://") for event in devtools.network_events), \
+            "BiDi channel should record completed responses"
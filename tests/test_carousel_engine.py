@@ -0,0 +1,88 @@
+import pytest
+from selenium.webdriver.common.by import By
+from components.article_card_carousel_blade import ArticleCardCarouselBlade
+from utils.tab_pool import isolated_tab
+
+
+class TestCarouselEngine:
+    """Tests for the carousel engine against a local autoplaying carousel (300ms transitions, 1.5s autoplay)"""
+
+    @pytest.fixture(scope="class")
+    def carousel(self, session_browser, replay_server):
+        """Load the replay carousel page in a separate tab"""
+        with isolated_tab(session_browser, f"{replay_server}/carousel/"):
+            yield ArticleCardCarouselBlade(session_browser, session_browser.find_element(By.ID, "article-carousel-featured-news"))
+
+    @pytest.fixture
+    def paused_carousel(self, carousel):
+        """Pause autoplay for the test so it cannot advance slides between steps"""
+        carousel.pause_autoplay()
+        yield carousel
+        carousel.resume_autoplay()
+
+    def test_next_and_previous_step_one_slide(self, paused_carousel):
+        """Verify next and previous move the active slide by one and wrap around"""
+        paused_carousel.go_to_slide(0)
+        forward = paused_carousel.next_slide()
+        back = paused_carousel.previous_slide()
+        wrapped = paused_carousel.previous_slide()
+
+        assert (forward["from"], forward["to"]) == (0, 1), f"Next should advance one slide: {forward}"
+        assert (back["from"], back["to"]) == (1, 0), f"Previous should go back one slide: {back}"
+        assert wrapped["to"] == 2, f"Previous from the first slide should wrap to the last: {wrapped}"
+
+    def test_go_to_slide(self, paused_carousel):
+        """Verify go_to_slide steps until the requested slide is active"""
+        paused_carousel.go_to_slide(0)
+        steps = paused_carousel.go_to_slide(2)
+
+        assert paused_carousel.get_active_index() == 2, "Slide 2 should be active"
+        assert len(steps) == 2, f"Reaching slide 2 from 0 should take two steps, took {len(steps)}"
+        assert paused_carousel.go_to_slide(2) == [], "Going to the active slide should not step"
+
+    def test_go_to_slide_out_of_range(self, carousel):
+        """Verify an out-of-range slide is rejected before clicking"""
+        with pytest.raises(IndexError):
+            carousel.go_to_slide(3)
+
+    def test_step_waits_for_transition(self, paused_carousel):
+        """Verify a step resolves after the slide transition and measures its duration"""
+        step = paused_carousel.next_slide()
+
+        assert not step["timed_out"], f"Step should finish: {step}"
+        assert step["transitions"] >= 1, "Track transition should be observed"
+        assert 250 <= step["duration_ms"] <= ArticleCardCarouselBlade.TRANSITION_BUDGET_MS, \
+            f"300ms transition should measure within budget, got {step['duration_ms']}ms"
+
+    def test_slides_data(self, carousel):
+        """Verify card data of every slide is captured in one script"""
+        slides = carousel.get_slides_data()
+
+        assert [slide["title"] for slide in slides] == ["Article one", "Article two", "Article one comments"], \
+            f"Unexpected titles {[slide['title'] for slide in slides]}"
+        assert slides[0]["category"] == "Patch Notes" and slides[0]["date"] == "2025-01-07", \
+            f"First card should have category and date: {slides[0]}"
+        assert slides[1]["target"] == "_blank", "Second card link opens a new tab"
+        assert sum(slide["in_viewport"] for slide in slides) == 1, "One slide should be in the carousel viewport"
+
+    def test_paused_autoplay_stops_until_resumed(self, carousel):
+        """Verify pausing stops autoplay without clicking and resuming starts it again"""
+        carousel.pause_autoplay()
+        try:
+            paused = carousel.measure_autoplay(advances=0, timeout=2)
+        finally:
+            carousel.resume_autoplay()
+        resumed = carousel.measure_autoplay(advances=0, timeout=3)
+
+        assert paused["changes"] == [], f"Paused carousel should not advance in 2s: {paused['changes']}"
+        assert resumed["changes"], "Resumed carousel should advance within one 1.5s period"
+
+    def test_autoplay_period_matches_progress_bar(self, carousel):
+        """Verify the measured autoplay period matches the progress bar duration"""
+        autoplay = carousel.measure_autoplay(advances=1, timeout=5)
+
+        assert not autoplay["timed_out"], f"Autoplay should advance twice in 5s: {autoplay}"
+        assert autoplay["declared_ms"] == 1500, f"Progress bar declares 1500ms, got {autoplay['declared_ms']}"
+        assert abs(autoplay["period_ms"] - autoplay["declared_ms"]) <= \
+            autoplay["declared_ms"] * ArticleCardCarouselBlade.AUTOPLAY_TOLERANCE, \
+            f"Autoplay period {autoplay['period_ms']}ms should match the progress bar"
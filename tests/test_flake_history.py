@@ -0,0 +1,131 @@
+import pytest
+from utils.flake import HISTORY_WINDOW, FlakeHistory
+
+
+class TestFlakeHistory:
+    """Tests for per-test flake history and quarantine selection"""
+
+    def test_flake_rate_persists_between_runs(self, tmp_path):
+        """Verify outcomes recorded in one run are read back in the next"""
+        path = str(tmp_path / "history.json")
+        history = FlakeHistory(path)
+        for outcome in ("passed", "flaky", "passed", "failed"):
+            history.record("tests/test_a.py::test_b", outcome)
+        history.save()
+
+        rate = FlakeHistory(path).flake_rate("tests/test_a.py::test_b")
+
+        assert rate == 0.25, f"One flaky run in four should give 25%, got {rate}"
+
+    def test_quarantine_needs_threshold_and_min_runs(self, tmp_path):
+        """Verify only tests at or above the threshold with enough runs are quarantined"""
+        history = FlakeHistory(str(tmp_path / "history.json"))
+        for outcome in ("flaky", "flaky", "passed", "passed", "passed"):
+            history.record("tests/test_a.py::test_flaky", outcome)
+            history.record("tests/test_a.py::test_stable", "passed")
+        history.record("tests/test_a.py::test_new", "flaky")
+
+        quarantined = history.quarantined(threshold=0.3, min_runs=5)
+
+        assert quarantined == {"tests/test_a.py::test_flaky": 0.4}, f"Unexpected quarantine {quarantined}"
+
+    def test_history_window(self, tmp_path):
+        """Verify only the last HISTORY_WINDOW outcomes count"""
+        history = FlakeHistory(str(tmp_path / "history.json"))
+        history.record("tests/test_a.py::test_b", "flaky")
+        for _ in range(HISTORY_WINDOW):
+            history.record("tests/test_a.py::test_b", "passed")
+
+        assert history.flake_rate("tests/test_a.py::test_b") == 0, "Old flaky outcomes should age out"
+
+
+class TestFlakeEngine:
+    """Tests for the --blade-reruns plugin (in-session reruns and quarantine) in an inner pytest run"""
+
+    # Inner test module: tests failing only on their first attempt (by assertion and by
+    # pytest.fail), one always failing, and a page-level test without a blade fixture. Blade
+    # refreshes fail on the fake driver and are only logged, so reruns still happen
+    BLADE_TESTS = """
+import pytest
+from types import SimpleNamespace
+
+CALLS = {"flaky": 0, "flaky_fail": 0, "broken": 0, "page": 0}
+
+@pytest.fixture(scope="session")
+def media_promo():
+    return SimpleNamespace(driver=None)
+
+def test_flaky(media_promo):
+    CALLS["flaky"] += 1
+    assert CALLS["flaky"] > 1
+
+def test_flaky_fail(media_promo):
+    CALLS["flaky_fail"] += 1
+    if CALLS["flaky_fail"] == 1:
+        pytest.fail("first attempt")
+
+def test_broken(media_promo):
+    CALLS["broken"] += 1
+    assert False
+
+def test_page_level():
+    CALLS["page"] += 1
+    assert CALLS["page"] > 1
+
+def test_zz_calls():
+    assert CALLS == {"flaky": 2, "flaky_fail": 2, "broken": RERUNS + 1, "page": 1}, CALLS
+"""
+
+    @pytest.fixture
+    def run(self, pytester):
+        """Run the inner suite with --blade-reruns against a flake history file"""
+        pytester.makeconftest("from tests.conftest import *")
+        history = pytester.path / "flake_history.json"
+
+        def run(reruns=2, threshold=0.3):
+            pytester.makepyfile(test_blades=f"RERUNS = {reruns}\n" + self.BLADE_TESTS)
+            result = pytester.runpytest_inprocess(
+                f"--blade-reruns={reruns}", f"--flake-history={history}",
+                f"--quarantine-threshold={threshold}", "-p", "no:cacheprovider",
+            )
+            return result, FlakeHistory(str(history))
+
+        return run
+
+    @staticmethod
+    def call_report(result, name):
+        """Call-phase report of the inner test name"""
+        return next(
+            report for report in result.reprec.getreports("pytest_runtest_logreport")
+            if report.when == "call" and report.nodeid.endswith(f"::{name}")
+        )
+
+    def test_failed_blade_test_rerun_in_session(self, run):
+        """Verify blade tests are rerun through item.runtest (also after pytest.fail) and page-level tests are not"""
+        result, _ = run()
+
+        result.assert_outcomes(passed=3, failed=2)
+        assert self.call_report(result, "test_zz_calls").passed, \
+            "Flaky tests should run twice, broken test reruns + 1 times, page-level test once"
+
+    def test_pass_on_rerun_recorded_flaky(self, run):
+        """Verify a test passing on its rerun is recorded flaky with a reruns property"""
+        result, history = run()
+        report = self.call_report(result, "test_flaky")
+
+        assert report.passed, "Flaky test should pass on its rerun"
+        assert ("reruns", 1) in report.user_properties, f"Report should carry reruns=1, got {report.user_properties}"
+        assert history.tests["test_blades.py::test_flaky"]["outcomes"] == ["flaky"], "History should record flaky"
+        assert history.tests["test_blades.py::test_broken"]["outcomes"] == ["failed"], "History should record failed"
+        result.stdout.fnmatch_lines(["*test_blades.py::test_flaky (passed after 1 rerun(s))*"])
+
+    def test_quarantined_test_marked_xfail(self, run):
+        """Verify a test over the flake-rate threshold gets a non-strict xfail marker"""
+        for _ in range(5):
+            run(reruns=1)
+
+        result, history = run(reruns=1)
+
+        assert history.flake_rate("test_blades.py::test_flaky") == 1.0, "Every run of test_flaky was flaky"
+        assert hasattr(self.call_report(result, "test_flaky"), "wasxfail"), "Quarantined test should be xfail"
+        result.stdout.fnmatch_lines(["*quarantined tests*", "*test_blades.py::test_flaky: flake rate 100%*"])
@@ -0,0 +1,71 @@
+import time
+import pytest
+from selenium.webdriver.common.by import By
+from components.base_blade import BaseBlade
+from pages.base_page import BasePage
+from utils.tab_pool import isolated_tab
+
+
+class TestFreezeAnimations:
+    """Tests for animation freezing against a local animated page"""
+
+    @pytest.fixture(scope="class")
+    def frozen_page(self, session_browser, replay_server):
+        """Load the animated replay page in a separate tab and freeze it"""
+        with isolated_tab(session_browser, f"{replay_server}/animated/"):
+            page = BasePage(session_browser)
+            page.freeze_animations()
+            yield page
+
+    @staticmethod
+    def computed(page, locator, prop):
+        """Get computed style property of element"""
+        element = page.driver.find_element(*locator)
+        return page.driver.execute_script("return getComputedStyle(arguments[0])[arguments[1]];", element, prop)
+
+    def test_transitions_and_animations_zeroed(self, frozen_page):
+        """Verify transition and animation durations are zero"""
+        supertitle = (By.CSS_SELECTOR, "[data-testid='supertitle']")
+
+        assert self.computed(frozen_page, supertitle, "transitionDuration") == "0s", "Transitions should be instant"
+        assert self.computed(frozen_page, supertitle, "animationDuration") == "0s", "Animations should be instant"
+
+    def test_progress_bar_animation_removed(self, frozen_page):
+        """Verify carousel progress bar no longer animates"""
+        assert self.computed(frozen_page, BaseBlade.PROGRESS_BAR, "animationName") == "none", (
+            "Progress bar animation should be removed"
+        )
+
+    def test_autoplay_stopped(self, frozen_page):
+        """Verify the progress bar no longer advances autoplay"""
+        before = frozen_page.driver.execute_script("return window.autoplayTicks;")
+        time.sleep(0.3)
+        after = frozen_page.driver.execute_script("return window.autoplayTicks;")
+
+        assert before == after, f"Autoplay should be stopped, ticked from {before} to {after}"
+
+    def test_page_timers_keep_running(self, frozen_page):
+        """Verify timers unrelated to the carousel still fire"""
+        before = frozen_page.driver.execute_script("return window.pageTicks;")
+        time.sleep(0.3)
+        after = frozen_page.driver.execute_script("return window.pageTicks;")
+
+        assert after > before, "Page timers should keep running while animations are frozen"
+
+    def test_media_paused(self, frozen_page):
+        """Verify media started after freezing is paused again"""
+        video = frozen_page.driver.find_element(By.TAG_NAME, "video")
+        paused = frozen_page.driver.execute_async_script(
+            "const [video, done] = arguments; video.play().catch(() => {}); setTimeout(() => done(video.paused), 50);",
+            video
+        )
+
+        assert paused, "Video should be paused while animations are frozen"
+
+    def test_blade_skips_settle_delay(self, frozen_page):
+        """Verify blades do not sleep for transitions once animations are frozen"""
+        blade = BaseBlade(frozen_page.driver, frozen_page.driver.find_element(By.ID, "article-carousel-featured-news"))
+        started = time.perf_counter()
+        blade.settle()
+
+        assert time.perf_counter() - started < BaseBlade.SETTLE_DELAY, "Settle delay should be skipped"
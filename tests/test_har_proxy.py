@@ -0,0 +1,206 @@
+import http.client
+import socket
+import time
+import pytest
+from utils.har_proxy import RecordingProxy, browser_har_entry, cache_status
+
+
+class TestRecordingProxy:
+    """Tests for the HAR recording proxy against the local replay stand-in"""
+
+    @pytest.fixture(scope="class")
+    def proxy(self):
+        """Recording proxy running for the class"""
+        proxy = RecordingProxy().start()
+        yield proxy
+        proxy.stop()
+
+    @pytest.fixture(autouse=True)
+    def reset(self, proxy):
+        """Start every test with no entries and no throttling"""
+        proxy.clear()
+        proxy.set_profile(None)
+
+    @staticmethod
+    def fetch(proxy, url):
+        """GET url through the proxy, return (status, body, seconds)"""
+        host, port = proxy.address.split(":")
+        connection = http.client.HTTPConnection(host, int(port), timeout=30)
+        started = time.perf_counter()
+        connection.request("GET", url)
+        response = connection.getresponse()
+        body = response.read()
+        connection.close()
+        return response.status, body, time.perf_counter() - started
+
+    @staticmethod
+    def wait_for_entries(proxy, count, timeout=5):
+        """Wait for count entries (an exchange is recorded just after its body is sent)"""
+        deadline = time.perf_counter() + timeout
+        while len(proxy.entries) < count and time.perf_counter() < deadline:
+            time.sleep(0.01)
+
+    def test_forwards_and_records_entry(self, proxy, replay_server):
+        """Verify proxied response is unchanged and recorded with sizes and timings"""
+        status, body, _ = self.fetch(proxy, f"{replay_server}/")
+        self.wait_for_entries(proxy, 1)
+        entries = proxy.har()["log"]["entries"]
+
+        assert status == 200, f"Proxied request should succeed, got {status}"
+        assert b"section-home-hero" in body, "Proxied body should be the replay homepage"
+        assert len(entries) == 1, f"Proxy should record one entry, got {len(entries)}"
+        entry = entries[0]
+        assert entry["request"]["url"] == f"{replay_server}/", f"Entry URL mismatch: {entry['request']['url']}"
+        assert entry["response"]["content"]["size"] == len(body), "Entry size should match body length"
+        assert entry["response"]["content"]["mimeType"].startswith("text/html"), "Entry should keep content type"
+        assert set(entry["timings"]) >= {"blocked", "connect", "send", "wait", "receive"}, "Entry should have HAR timings"
+
+    def test_entries_grouped_by_page(self, proxy, replay_server):
+        """Verify entries after mark_page belong to that page"""
+        self.fetch(proxy, f"{replay_server}/")
+        self.wait_for_entries(proxy, 1)
+        page_id = proxy.mark_page(f"{replay_server}/news/")
+        self.fetch(proxy, f"{replay_server}/news/")
+        self.wait_for_entries(proxy, 2)
+
+        har = proxy.har(page_id)["log"]
+        urls = [entry["request"]["url"] for entry in har["entries"]]
+
+        assert [page["id"] for page in har["pages"]] == [page_id], "HAR should contain only the requested page"
+        assert urls == [f"{replay_server}/news/"], f"Page should only own requests made after it started, got {urls}"
+
+    def test_latency_profile_delays_requests(self, proxy, replay_server):
+        """Verify latency profile adds round-trip delay"""
+        proxy.set_profile({"latency_ms": 300})
+        _, _, seconds = self.fetch(proxy, f"{replay_server}/")
+
+        assert seconds >= 0.3, f"Request should take at least 300ms under latency profile, took {seconds:.3f}s"
+
+    def test_bandwidth_profile_limits_download(self, proxy, replay_server):
+        """Verify download bandwidth limit stretches the response"""
+        _, body, _ = self.fetch(proxy, f"{replay_server}/")
+        kbps = len(body) * 8 / 1000 / 0.5
+        proxy.set_profile({"download_kbps": kbps})
+
+        _, _, seconds = self.fetch(proxy, f"{replay_server}/")
+
+        assert seconds >= 0.4, f"Body should take ~0.5s at {kbps:.0f} kbit/s, took {seconds:.3f}s"
+
+    def test_open_tunnel_flushed_in_har(self, proxy, replay_server):
+        """Verify a tunnel still open is exported with its bytes so far, then recorded once closed"""
+        target = replay_server.split("//", 1)[1]
+        host, port = proxy.address.split(":")
+        client = socket.create_connection((host, int(port)), timeout=10)
+        try:
+            client.sendall(f"CONNECT {target} HTTP/1.1\r\nHost: {target}\r\n\r\n".encode())
+            assert b" 200 " in client.recv(1024), "Proxy should establish the tunnel"
+            client.sendall(f"GET / HTTP/1.1\r\nHost: {target}\r\n\r\n".encode())
+            received = client.recv(64 * 1024)
+
+            open_entries = proxy.har()["log"]["entries"]
+        finally:
+            client.close()
+        self.wait_for_entries(proxy, 1)
+        closed_entries = proxy.har()["log"]["entries"]
+
+        assert received, "Tunnel should carry the response"
+        assert len(open_entries) == 1 and open_entries[0].get("_open"), \
+            f"Open tunnel should be exported as one _open entry, got {open_entries}"
+        assert open_entries[0]["response"]["bodySize"] > 0, "Open tunnel entry should count bytes received so far"
+        assert len(closed_entries) == 1 and "_open" not in closed_entries[0], \
+            f"Closed tunnel should be recorded once without _open, got {closed_entries}"
+        assert closed_entries[0]["request"]["url"] == f"https://{target}/", "Tunnel entry should name the host"
+
+    def test_profile_change_applies_to_open_tunnel(self, proxy, replay_server):
+        """Verify a profile set while a tunnel is open throttles its next round trip"""
+        target = replay_server.split("//", 1)[1]
+        host, port = proxy.address.split(":")
+        client = socket.create_connection((host, int(port)), timeout=10)
+        try:
+            client.sendall(f"CONNECT {target} HTTP/1.1\r\nHost: {target}\r\n\r\n".encode())
+            assert b" 200 " in client.recv(1024), "Proxy should establish the tunnel"
+            proxy.set_profile({"latency_ms": 300})
+            started = time.perf_counter()
+            client.sendall(f"GET / HTTP/1.1\r\nHost: {target}\r\n\r\n".encode())
+            client.recv(64 * 1024)
+            seconds = time.perf_counter() - started
+        finally:
+            client.close()
+
+        assert seconds >= 0.3, f"Open tunnel should pick up the 300ms latency profile, took {seconds:.3f}s"
+
+    @pytest.mark.parametrize("status, headers, expected", [
+        (200, [("X-Cache", "Hit from cloudfront")], "hit"),
+        (200, [("CF-Cache-Status", "MISS")], "miss"),
+        (200, [("Age", "120")], "hit"),
+        (304, [], "revalidated"),
+        (200, [], "unknown"),
+    ])
+    def test_cache_status(self, status, headers, expected):
+        """Verify cache status is derived from response headers"""
+        assert cache_status(status, headers) == expected, f"Expected '{expected}' for {status} {headers}"
+
+
+class TestBrowserHarEntries:
+    """Tests for HAR entries built from browser network events"""
+
+    @staticmethod
+    def network_event(url, context="tab-1", started_ago=0.0, from_cache=False):
+        """Finished request as DevToolsChannel collects it, started started_ago seconds back"""
+        started = time.time() * 1000 - started_ago * 1000
+        return {
+            "url": url, "method": "GET", "status": 200, "mime_type": "text/css",
+            "from_cache": from_cache, "bytes_received": 0 if from_cache else 2400,
+            "timings": {
+                "timeOrigin": 0, "requestTime": 0, "fetchStart": 100, "dnsStart": 104, "dnsEnd": 110,
+                "connectStart": 110, "connectEnd": 150, "tlsStart": 120, "requestStart": 152,
+                "responseStart": 200, "responseEnd": 230,
+            },
+            "context": context, "started": started, "finished": started + 130,
+            "request_headers": [{"name": "Accept", "value": {"type": "string", "value": "text/css"}}],
+            "request_headers_size": 120, "request_body_size": 0,
+            "status_text": "OK", "protocol": "http/1.1",
+            "response_headers": [{"name": "X-Cache", "value": {"type": "string", "value": "Hit from cloudfront"}}],
+            "response_headers_size": 200, "response_body_size": 2200, "content_size": 9000, "error": None,
+        }
+
+    def test_entry_keeps_request_details(self):
+        """Verify an HTTPS request keeps its URL, headers, sizes, phases and CDN cache status"""
+        entry = browser_har_entry(self.network_event("https://www.leagueoflegends.com/app.css"))
+
+        assert entry["request"]["url"] == "https://www.leagueoflegends.com/app.css", "Entry should keep the HTTPS URL"
+        assert entry["request"]["headers"] == [{"name": "Accept", "value": "text/css"}], "Request headers lost"
+        assert entry["response"]["content"]["size"] == 9000, "Content size should be the decoded size"
+        assert entry["_transferSize"] == 2400, "Transfer size should be the bytes received"
+        assert entry["timings"] == {
+            "blocked": 4, "dns": 6, "connect": 40, "ssl": 30, "send": 0, "wait": 48, "receive": 30,
+        }, f"Phases should come from the fetch timings, got {entry['timings']}"
+        assert entry["_cacheStatus"] == "hit", f"CDN hit should be read from headers, got {entry['_cacheStatus']}"
+
+    def test_browser_cache_entry(self):
+        """Verify a response served from the browser cache is marked as such"""
+        entry = browser_har_entry(self.network_event("https://www.leagueoflegends.com/app.css", from_cache=True))
+
+        assert entry["_cacheStatus"] == "browser", f"Cached response should be 'browser', got {entry['_cacheStatus']}"
+
+    def test_browser_entries_grouped_by_own_start(self):
+        """Verify requests belong to the page started before them in their tab, not by connection"""
+        proxy = RecordingProxy()
+        try:
+            first = proxy.mark_page("https://www.leagueoflegends.com/", time.perf_counter() - 2, context="tab-1")
+            other_tab = proxy.mark_page("https://www.leagueoflegends.com/news/", time.perf_counter() - 1, context="tab-2")
+            proxy.record_browser_event(self.network_event("https://www.leagueoflegends.com/a.css", started_ago=1.5))
+            proxy.record_browser_event(self.network_event("https://www.leagueoflegends.com/b.css", started_ago=0.5))
+            proxy.record_browser_event(
+                self.network_event("https://www.leagueoflegends.com/news.css", context="tab-2", started_ago=0.5)
+            )
+
+            first_urls = [entry["request"]["url"] for entry in proxy.har(first)["log"]["entries"]]
+            other_urls = [entry["request"]["url"] for entry in proxy.har(other_tab)["log"]["entries"]]
+        finally:
+            proxy.stop()
+
+        assert first_urls == [
+            "https://www.leagueoflegends.com/a.css", "https://www.leagueoflegends.com/b.css",
+        ], f"First tab's page should keep its requests while another tab loads, got {first_urls}"
+        assert other_urls == ["https://www.leagueoflegends.com/news.css"], f"Other tab got {other_urls}"
@@ -1,29 +1,18 @@
+import time
 import pytest
 from pages.home_page import HomePage
+from utils.tab_pool import isolated_tab
 
 
 class TestArticleCardCarousel:
     """Tests for Article Card Carousel (Featured News) blade on Homepage"""
     
     @pytest.fixture(scope="session")
-    def carousel_blade(self, home_page):
+    def carousel_blade(self, home_page, blade_gate):
         """Get blade once for all tests"""
+        blade_gate("article_card_carousel")
         return home_page.get_article_card_carousel()
     
-    # Structural tests
-    
-    def test_blade_is_visible(self, carousel_blade):
-        """Verify blade is visible on page"""
-        assert carousel_blade.is_visible(), "Blade should be visible"
-    
-    def test_backdrop_exists(self, carousel_blade):
-        """Verify blade has backdrop"""
-        assert carousel_blade.has_backdrop(), "Blade should have backdrop"
-    
-    def test_backdrop_has_background(self, carousel_blade):
-        """Verify backdrop has background layer"""
-        assert carousel_blade.has_backdrop_background(), "Blade backdrop should have background layer"
-    
     # Title tests
     
     def test_title_text(self, carousel_blade):
@@ -35,10 +24,6 @@ class TestArticleCardCarousel:
     
     # CTA tests
     
-    def test_tertiary_cta_is_visible(self, carousel_blade):
-        """Verify tertiary CTA is visible"""
-        assert carousel_blade.is_tertiary_cta_visible(), "Blade should have tertiary CTA"
-    
     def test_tertiary_cta_text(self, carousel_blade):
         """Verify tertiary CTA has correct text"""
         cta_text = carousel_blade.get_tertiary_cta_text()
@@ -54,20 +39,8 @@ class TestArticleCardCarousel:
         
         assert href == expected_href, f"CTA href should be '{expected_href}', got '{href}'"
     
-    def test_tertiary_cta_opens_same_tab(self, carousel_blade):
-        """Verify tertiary CTA opens in the same tab (no target attribute)"""
-        tertiary_cta = carousel_blade.get_tertiary_cta_element()
-        target = tertiary_cta.get_attribute("target")
-        
-        assert not target, \
-            f"Blade tertiary CTA should have no target attribute, got '{target}'"
-    
     # Carousel tests
 
-    def test_carousel_exists(self, carousel_blade):
-        """Verify carousel exists"""
-        assert carousel_blade.has_carousel(), "Blade should have carousel"
-    
     def test_carousel_has_three_slides(self, carousel_blade):
         """Verify carousel has exactly 3 slides"""
         slide_count = carousel_blade.get_slide_count()
@@ -91,20 +64,85 @@ class TestArticleCardCarousel:
                 pytest.fail(f"Slide {i} does not have an anchor tag")
 
     
-    # Controls tests
-    
-    def test_controls_exist(self, carousel_blade):
-        """Verify carousel controls container exists"""
-        assert carousel_blade.has_controls(), "Carousel should have controls container"
-    
-    def test_progress_bar_exists(self, carousel_blade):
-        """Verify progress bar exists"""
-        assert carousel_blade.has_progress_bar(), "Carousel should have progress bar"
-    
-    def test_previous_button_exists(self, carousel_blade):
-        """Verify previous button exists"""
-        assert carousel_blade.has_previous_button(), "Carousel should have previous button"
-    
-    def test_next_button_exists(self, carousel_blade):
-        """Verify next button exists"""
-        assert carousel_blade.has_next_button(), "Carousel should have next button"
\ No newline at end of file
+    # Carousel engine tests
+
+    @pytest.fixture
+    def paused_carousel(self, carousel_blade):
+        """Pause autoplay for a step test so it cannot advance slides between steps"""
+        carousel_blade.pause_autoplay()
+        yield carousel_blade
+        carousel_blade.resume_autoplay()
+
+    def test_slides_have_card_data(self, carousel_blade):
+        """Verify every slide has a card title and link"""
+        slides = carousel_blade.get_slides_data()
+        assert slides, "Should have slides"  # Prevent silent pass
+
+        for slide in slides:
+            assert slide["title"], f"Slide {slide['index']} should have a title"
+            assert slide["href"], f"Slide {slide['index']} should have a link"
+
+    @pytest.mark.interactive
+    def test_next_slide_advances_active_slide(self, paused_carousel):
+        """Verify next makes the following slide active"""
+        paused_carousel.go_to_slide(0)
+        step = paused_carousel.next_slide()
+
+        assert (step["from"], step["to"]) == (0, 1), f"Next should move from slide 0 to 1, got {step}"
+
+    @pytest.mark.interactive
+    def test_previous_slide_returns_to_slide(self, paused_carousel):
+        """Verify previous makes the preceding slide active"""
+        paused_carousel.go_to_slide(1)
+        step = paused_carousel.previous_slide()
+
+        assert (step["from"], step["to"]) == (1, 0), f"Previous should move from slide 1 to 0, got {step}"
+
+    @pytest.mark.interactive
+    @pytest.mark.performance
+    def test_transition_within_budget(self, paused_carousel):
+        """Verify a slide transition finishes within the budget"""
+        paused_carousel.go_to_slide(0)
+        step = paused_carousel.next_slide()
+        budget = paused_carousel.TRANSITION_BUDGET_MS
+
+        assert not step["timed_out"], f"Transition should finish, got {step}"
+        assert step["duration_ms"] <= budget, f"Transition took {step['duration_ms']}ms, budget {budget}ms"
+
+    @pytest.mark.performance
+    def test_autoplay_period_matches_progress_bar(self, request, carousel_blade):
+        """Verify autoplay advances when the progress bar fills"""
+        if request.config.getoption("--freeze-animations"):
+            pytest.skip("Autoplay is stopped with --freeze-animations")
+        autoplay = carousel_blade.measure_autoplay()
+        declared = autoplay["declared_ms"]
+        if not declared:
+            pytest.skip("Progress bar declares no animation duration")
+
+        assert not autoplay["timed_out"], f"Autoplay should advance twice, got {autoplay['changes']}"
+        assert abs(autoplay["period_ms"] - declared) <= declared * carousel_blade.AUTOPLAY_TOLERANCE, \
+            f"Autoplay period {autoplay['period_ms']}ms should match the {declared}ms progress bar"
+
+    # Frozen autoplay tests
+
+    @pytest.fixture(scope="class")
+    def frozen_carousel(self, session_browser):
+        """Freeze a homepage in its own tab, return the carousel and its autoplay period read before freezing"""
+        with isolated_tab(session_browser, HomePage.URL):
+            home = HomePage(session_browser)
+            blade = home.get_article_card_carousel()
+            blade.scroll_into_view()
+            period = blade.get_autoplay_period()
+            home.freeze_animations()
+            yield blade, period
+
+    def test_freeze_stops_autoplay(self, frozen_carousel):
+        """Verify the live carousel keeps its active slide for a full autoplay period once frozen"""
+        blade, period = frozen_carousel
+        if not period:
+            pytest.skip("Progress bar declares no animation duration")
+        before = blade.get_active_index()
+        time.sleep(period / 1000 * (1 + blade.AUTOPLAY_TOLERANCE))
+        after = blade.get_active_index()
+
+        assert after == before, f"Frozen carousel should stay on slide {before} for {period}ms, moved to {after}"
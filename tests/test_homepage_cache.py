@@ -0,0 +1,63 @@
+import os
+import pytest
+from pages.home_page import HomePage
+from utils.cache_comparison import compare_cache_loads, write_cache_report
+from utils.tab_pool import isolated_tab
+
+
+@pytest.mark.performance
+@pytest.mark.cache_clear
+class TestCacheComparison:
+    """Cold vs warm cache loads of the Homepage"""
+
+    @pytest.fixture(scope="session")
+    def comparison_selected(self, request):
+        """Skip before a browser starts unless --cache-comparison is given"""
+        if not request.config.getoption("--cache-comparison"):
+            pytest.skip("Run with --cache-comparison to compare cold and warm homepage loads")
+
+    @pytest.fixture(scope="class")
+    def cache_report(self, request, comparison_selected, session_browser):
+        """Run cold, warm and post-clear loads in a separate tab and save the comparison"""
+        with isolated_tab(session_browser):
+            report = compare_cache_loads(
+                session_browser, HomePage.URL, request.config.getoption("--warm-reloads")
+            )
+
+        write_cache_report(
+            report,
+            os.path.join("reports", "cache_comparison.json"),
+            os.path.join("reports", "cache_comparison.html"),
+        )
+        if not report["loads"][0]["cache_cleared"]:
+            pytest.skip("Browser backend could not clear the HTTP cache, the first load would not be cold")
+        return report
+
+    def test_every_load_completes(self, cache_report):
+        """Verify each load reached its load event"""
+        incomplete = [load["kind"] for load in cache_report["loads"] if not load["navigation"]]
+
+        assert not incomplete, f"Loads should finish within 30s, did not: {incomplete}"
+
+    def test_warm_loads_served_from_cache(self, cache_report):
+        """Verify warm visits serve part of the page from cache"""
+        summary = cache_report["summary"]
+
+        assert summary["cacheable_share"], "Warm visits should serve some bytes from cache"
+        assert summary["warm_transfer_bytes"] < summary["cold_transfer_bytes"], (
+            f"Warm visits should transfer less than the cold load "
+            f"({summary['warm_transfer_bytes']} vs {summary['cold_transfer_bytes']} bytes)"
+        )
+
+    def test_cache_clear_restores_cold_load(self, cache_report):
+        """Verify the revisit after a cache clear is fetched from the network again"""
+        revisit = cache_report["loads"][-1]
+        if not revisit["cache_cleared"]:
+            pytest.skip("Browser backend offers no way to clear the HTTP cache")
+
+        cached = revisit["by_status"].get("cache", {}).get("encoded_bytes", 0)
+
+        assert cached < revisit["encoded_bytes"] / 2, (
+            f"Revisit after cache clear should mostly hit the network, {cached} of "
+            f"{revisit['encoded_bytes']} bytes came from cache"
+        )
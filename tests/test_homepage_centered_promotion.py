@@ -1,12 +1,17 @@
 import pytest
 from pages.home_page import HomePage
+from utils.tab_pool import isolated_tab
 
 class TestCenteredPromotion:
     """Tests for Centered Promotion blade on the Homepage"""
 
+    # Milliseconds from reloading the background video to its first rendered frame
+    FIRST_FRAME_BUDGET_MS = 3000
+
     @pytest.fixture(scope="session")
-    def centered_promotion(self, home_page):
+    def centered_promotion(self, home_page, blade_gate):
         """Get blade once for all tests"""
+        blade_gate("centered_promotion")
         return home_page.get_centered_promotion()
     
     @pytest.fixture(scope="class")
@@ -17,29 +22,36 @@ class TestCenteredPromotion:
             return background.find_element("tag name", "video")
         except:
             pytest.fail("Video element not found in backdrop background")
-    
-    # Structural tests
-    
-    def test_centered_promotion_is_visible(self, centered_promotion):
-        """Verify blade is visible on page"""
-        assert centered_promotion.is_visible(), "Blade should be visible"
-    
-    def test_backdrop_exists(self, centered_promotion):
-        """Verify blade has backdrop"""
-        assert centered_promotion.has_backdrop(), "Blade should have backdrop"
-    
-    def test_backdrop_has_background(self, centered_promotion):
-        """Verify backdrop has background layer"""
-        assert centered_promotion.has_backdrop_background(), \
-            "Blade backdrop should have background layer"
-        
+
+    @pytest.fixture(scope="class")
+    def video_playback(self, centered_promotion):
+        """Sample background video playback once, without reloading the shared page's video"""
+        if centered_promotion.driver.execute_script("return !!window.__animationsFrozen;"):
+            pytest.skip("Playback is not measured with --freeze-animations")
+        centered_promotion.scroll_into_view()
+        metrics = centered_promotion.get_backdrop_video_playback()
+        if not metrics:
+            pytest.fail("Video element not found in backdrop background")
+        return metrics[0]
+
+    @pytest.fixture(scope="class")
+    def video_first_frame(self, session_browser):
+        """Reload the background video on a homepage in its own tab and sample it from that load"""
+        with isolated_tab(session_browser, HomePage.URL):
+            blade = HomePage(session_browser).get_centered_promotion()
+            blade.scroll_into_view()
+            metrics = blade.get_backdrop_video_playback(restart=True)
+        if not metrics:
+            pytest.fail("Video element not found in backdrop background")
+        return metrics[0]
+
     # Video tests
 
     def test_video_is_displayed(self, video_element):
         """Verify video element is displayed"""
         assert video_element.is_displayed(), \
             "Video should be visible to displayed"
-
+    
     def test_video_has_src(self, video_element):
         """Verify video has valid source"""
         sources = video_element.find_elements("tag name", "source")
@@ -60,22 +72,61 @@ class TestCenteredPromotion:
         """Verify video is muted"""
         assert video_element.get_attribute("muted") is not None, \
             "Video should be muted"
-        
+    
     def test_video_is_looping(self, video_element):
         """Verify video is looping"""
         assert video_element.get_attribute("loop") is not None, \
             "Video should be looping"
-    
+
+    # Video playback tests
+
+    @pytest.mark.performance
+    def test_video_is_playing(self, video_playback):
+        """Verify video playback advances while sampled"""
+        advanced = video_playback["advanced_seconds"]
+
+        assert not video_playback["paused"], "Video should not be paused"
+        assert advanced > 0, f"Video currentTime should advance, advanced {advanced:.2f}s"
+
+    @pytest.mark.performance
+    def test_video_has_future_data(self, video_playback):
+        """Verify video has enough data buffered to keep playing"""
+        ready_state = video_playback["ready_state"]
+
+        assert ready_state >= 3, f"Video readyState should be at least 3 (HAVE_FUTURE_DATA), got {ready_state}"
+
+    @pytest.mark.performance
+    def test_video_keeps_up_with_real_time(self, video_playback):
+        """Verify video plays at close to real-time speed"""
+        rate = video_playback["advanced_seconds"] / video_playback["sample_seconds"]
+
+        assert rate >= 0.8, f"Video should play at least 0.8x real time, got {rate:.2f}x"
+
+    @pytest.mark.performance
+    def test_video_drops_few_frames(self, video_playback):
+        """Verify video drops less than 10% of frames while sampled"""
+        ratio = video_playback["dropped_frame_ratio"]
+        if ratio is None:
+            pytest.skip("Browser does not report video playback quality")
+
+        assert ratio < 0.1, \
+            f"Video should drop under 10% of frames, dropped {video_playback['dropped_frames']}/{video_playback['total_frames']}"
+
+    @pytest.mark.performance
+    def test_video_first_frame_within_budget(self, video_first_frame):
+        """Verify the reloaded video renders its first frame within budget"""
+        first_frame = video_first_frame["first_frame_ms"]
+
+        assert first_frame is not None, "Video should render a frame after reloading"
+        assert first_frame <= self.FIRST_FRAME_BUDGET_MS, \
+            f"Video first frame took {first_frame}ms, budget {self.FIRST_FRAME_BUDGET_MS}ms"
+
     # CTA tests
     
     def test_links_section_exists(self, centered_promotion):
         """Verify links section exist"""
         assert centered_promotion.has_links_section(), "Blade should have links section"
 
-    def test_primary_cta_is_visible(self, centered_promotion):
-        """Verify primary CTA is visible"""
-        assert centered_promotion.is_primary_cta_visible(), "Blade primary CTA should be visible"
-    
     def test_primary_cta_text(self, centered_promotion):
         """Verify primary CTA has correct text"""
         primary_cta_text = centered_promotion.get_primary_cta_text()
@@ -92,12 +143,3 @@ class TestCenteredPromotion:
         
         assert href == expected_href, \
             f"Blade primary CTA href should be '{expected_href}', got '{href}'"
-    
-    def test_primary_cta_opens_new_tab(self, centered_promotion):
-        """Verify primary CTA opens new tab"""
-        primary_cta = centered_promotion.get_primary_cta_element()
-        target = primary_cta.get_attribute("target")
-        expected_target = "_blank"
-        
-        assert target == expected_target, \
-            f"Blade primary CTA target should be '{expected_target}', got '{target}'"
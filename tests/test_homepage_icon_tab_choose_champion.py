@@ -6,25 +6,13 @@ class TestIconTabChooseChampion:
     """Tests for Icon Tab (Choose Champion)e blade on Homepage"""
 
     @pytest.fixture(scope="session")
-    def icon_tab_choose_champion(self, home_page):
+    def icon_tab_choose_champion(self, home_page, blade_gate):
         """Get blade once for all tests"""
+        blade_gate("icon_tab_choose_champion")
         return home_page.get_icon_tab_choose_champion()
 
     # Structural tests
     
-    def test_icon_tab_choose_champion_is_visible(self, icon_tab_choose_champion):
-        """Verify blade is visible on page"""
-        assert icon_tab_choose_champion.is_visible(), "Blade should be visible"
-    
-    def test_backdrop_exists(self, icon_tab_choose_champion):
-        """Verify blade has backdrop"""
-        assert icon_tab_choose_champion.has_icon_tab_main_backdrop(), "Blade should have backdrop"
-    
-    def test_backdrop_has_background(self, icon_tab_choose_champion):
-        """Verify backdrop has background layer"""
-        assert icon_tab_choose_champion.has_icon_tab_full_backdrop_background(), \
-            "Blade backdrop should have background layer"
-
     def test_main_section_exists(self, icon_tab_choose_champion):
         """Verify blade has main section"""
         assert icon_tab_choose_champion.has_main_section(), "Blade should have main section"
@@ -55,21 +43,12 @@ class TestIconTabChooseChampion:
 
         assert title_text == expected_title, f"Blade title should be '{expected_title}', got '{title_text}'"
 
-    def test_description_has_text(self, icon_tab_choose_champion):
-        """Verify description has text"""
-        description_text = icon_tab_choose_champion.get_description()
-        assert description_text is not None, "Blade description should have text"
-
     # CTA tests
     
     def test_header_links_exists(self, icon_tab_choose_champion):
         """Verify header links exists"""
         assert icon_tab_choose_champion.has_header_links(), "Blade should have header links section"
     
-    def test_primary_cta_is_visible(self, icon_tab_choose_champion):
-        """Verify primary CTA is visible"""
-        assert icon_tab_choose_champion.is_primary_cta_visible(), "Blade primary CTA should be visible"
-    
     def test_primary_cta_text(self, icon_tab_choose_champion):
         """Verify primary CTA has correct text"""
         primary_cta_text = icon_tab_choose_champion.get_primary_cta_text()
@@ -87,20 +66,6 @@ class TestIconTabChooseChampion:
         assert href == expected_href, \
             f"Blade primary CTA href should be '{expected_href}', got '{href}'"
     
-    def test_primary_cta_opens_new_tab(self, icon_tab_choose_champion):
-        """Verify primary CTA opens new tab"""
-        primary_cta = icon_tab_choose_champion.get_primary_cta_element()
-        target = primary_cta.get_attribute("target")
-        expected_target = "_blank"
-        
-        assert target == expected_target, \
-            f"Blade primary CTA target should be '{expected_target}', got '{target}'"
-    
-    def test_secondary_cta_is_visible(self, icon_tab_choose_champion):
-        """Verify secondary CTA is visible"""
-        assert icon_tab_choose_champion.is_secondary_cta_visible(), \
-            "Blade secondary CTA should be visible"
-    
     def test_secondary_cta_text(self, icon_tab_choose_champion):
         """Verify secondary CTA has correct text"""
         secondary_cta_text = icon_tab_choose_champion.get_secondary_cta_text()
@@ -118,21 +83,8 @@ class TestIconTabChooseChampion:
         assert href == expected_href, \
             f"Blade secondary CTA href should be '{expected_href}', got '{href}'"
     
-    def test_secondary_cta_opens_new_tab(self, icon_tab_choose_champion):
-        """Verify secondary CTA opens new tab"""
-        secondary_cta = icon_tab_choose_champion.get_secondary_cta_element()
-        target = secondary_cta.get_attribute("target")
-        expected_target = "_blank"
-        
-        assert target == expected_target, \
-            f"Blade secondary CTA target should be '{expected_target}', got '{target}'"
-    
     # Carousels tests
 
-    def test_carousel_exists(self, icon_tab_choose_champion):
-        """Verify carousel exists"""
-        assert icon_tab_choose_champion.has_carousel(), "Blade should have carousel"
-    
     def test_carousel_has_six_tabs(self, icon_tab_choose_champion):
         """Verify carousel has exactly 6 tabs"""
         tab_count = icon_tab_choose_champion.get_slide_count()
@@ -194,6 +146,7 @@ class TestIconTabChooseChampion:
         assert subtitle_text == expected_subtitle, \
             f"Blade initial media subtitle should be '{expected_subtitle}', got '{subtitle_text}'"
 
+    @pytest.mark.interactive
     def test_clicking_tab_changes_media_title_and_subtitle(self, icon_tab_choose_champion):
         """Verify title and subtitle change when clicking different tab"""
         tab_index = 2
@@ -208,5 +161,3 @@ class TestIconTabChooseChampion:
     
         assert current_title != previous_title, "Media title should change"
         assert current_subtitle != previous_subtitle, "Media subtitle should change"
-
-
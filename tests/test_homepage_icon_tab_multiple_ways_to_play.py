@@ -6,25 +6,13 @@ class TestIconTabMultipleWaysToPlay:
     """Tests for Icon Tab (Multiple Ways to Play) blade on the Homepage"""
 
     @pytest.fixture(scope="session")
-    def icon_tab_multiple_ways_to_play(self, home_page):
+    def icon_tab_multiple_ways_to_play(self, home_page, blade_gate):
         """Get blade once for all tests"""
+        blade_gate("icon_tab_multiple_ways")
         return home_page.get_icon_tab_multiple_ways()
 
     # Structural tests
     
-    def test_icon_tab_multiple_ways_to_play_is_visible(self, icon_tab_multiple_ways_to_play):
-        """Verify blade is visible on page"""
-        assert icon_tab_multiple_ways_to_play.is_visible(), "Blade should be visible"
-    
-    def test_backdrop_exists(self, icon_tab_multiple_ways_to_play):
-        """Verify blade has backdrop"""
-        assert icon_tab_multiple_ways_to_play.has_icon_tab_main_backdrop(), "Blade should have backdrop"
-    
-    def test_backdrop_has_background(self, icon_tab_multiple_ways_to_play):
-        """Verify backdrop has background layer"""
-        assert icon_tab_multiple_ways_to_play.has_icon_tab_full_backdrop_background(), \
-            "Blade backdrop should have background layer"
-
     def test_main_section_exists(self, icon_tab_multiple_ways_to_play):
         """Verify blade has main section"""
         assert icon_tab_multiple_ways_to_play.has_main_section(), "Blade should have main section"
@@ -54,11 +42,6 @@ class TestIconTabMultipleWaysToPlay:
 
         assert title_text == expected_title, f"Blade title should be '{expected_title}', got '{title_text}'"
 
-    def test_description_has_text(self, icon_tab_multiple_ways_to_play):
-        """Verify description has text"""
-        description_text = icon_tab_multiple_ways_to_play.get_description()
-        assert description_text is not None, "Blade description should have text"
-
     # CTA tests
     
     
@@ -66,10 +49,6 @@ class TestIconTabMultipleWaysToPlay:
         """Verify header links exists"""
         assert icon_tab_multiple_ways_to_play.has_header_links(), "Blade should have header links section"
 
-    def test_primary_cta_is_visible(self, icon_tab_multiple_ways_to_play):
-        """Verify primary CTA is visible"""
-        assert icon_tab_multiple_ways_to_play.is_primary_cta_visible(), "Blade primary CTA should be visible"
-    
     def test_primary_cta_text(self, icon_tab_multiple_ways_to_play):
         """Verify primary CTA has correct text"""
         primary_cta_text = icon_tab_multiple_ways_to_play.get_primary_cta_text()
@@ -87,22 +66,8 @@ class TestIconTabMultipleWaysToPlay:
         assert href == expected_href, \
             f"Blade primary CTA href should be '{expected_href}', got '{href}'"
     
-    def test_primary_cta_opens_new_tab(self, icon_tab_multiple_ways_to_play):
-        """Verify primary CTA opens new tab"""
-        primary_cta = icon_tab_multiple_ways_to_play.get_primary_cta_element()
-        target = primary_cta.get_attribute("target")
-        expected_target = "_blank"
-        
-        assert target == expected_target, \
-            f"Blade primary CTA target should be '{expected_target}', got '{target}'"
-    
-    
     # Carousels tests
 
-    def test_carousel_exists(self, icon_tab_multiple_ways_to_play):
-        """Verify carousel exists"""
-        assert icon_tab_multiple_ways_to_play.has_carousel(), "Blade should have carousel"
-    
     def test_carousel_has_three_tabs(self, icon_tab_multiple_ways_to_play):
         """Verify carousel has exactly 3 tabs"""
         tab_count = icon_tab_multiple_ways_to_play.get_slide_count()
@@ -170,6 +135,7 @@ class TestIconTabMultipleWaysToPlay:
         assert description_text.strip(), \
             "Blade initial media description should have non-whitespace text"
 
+    @pytest.mark.interactive
     def test_clicking_tab_changes_media_title_and_description(self, icon_tab_multiple_ways_to_play):
         """Verify title and description change when clicking different tab"""
         tab_index = 2
@@ -184,5 +150,3 @@ class TestIconTabMultipleWaysToPlay:
     
         assert current_title != previous_title, "Media title should change"
         assert current_description != previous_description, "Media description should change"
-
-
@@ -0,0 +1,47 @@
+import json
+import os
+import pytest
+from pages.home_page import HomePage
+
+
+@pytest.mark.performance
+class TestImageDelivery:
+    """Image delivery audit for every registered blade on the Homepage"""
+
+    @pytest.fixture(scope="session")
+    def image_audits(self, home_page):
+        """Audit images of all blades once and save results to the reports folder"""
+        audits = {name: home_page.get_blade(name).audit_images() for name in HomePage.BLADES}
+        with open(os.path.join("reports", "image_audit.json"), "w", encoding="utf-8") as f:
+            json.dump(audits, f, indent=2)
+        return audits
+
+    @staticmethod
+    def flagged(images, flag):
+        """Get src of images carrying flag"""
+        return [image["src"] for image in images if flag in image["flags"]]
+
+    @pytest.mark.parametrize("blade_name", list(HomePage.BLADES))
+    def test_images_are_not_oversized(self, image_audits, blade_name):
+        """Verify no image ships more than 2x the pixels it is rendered at"""
+        oversized = [
+            f"{image['src']} ({image['natural_width']}x{image['natural_height']} for "
+            f"{image['rendered_width']}x{image['rendered_height']} @{image['device_pixel_ratio']}x)"
+            for image in image_audits[blade_name] if "oversized" in image["flags"]
+        ]
+
+        assert not oversized, f"Blade '{blade_name}' has oversized images:\n" + "\n".join(oversized)
+
+    @pytest.mark.parametrize("blade_name", list(HomePage.BLADES))
+    def test_above_fold_images_are_not_lazy(self, image_audits, blade_name):
+        """Verify images in the initial viewport are not lazy-loaded"""
+        lazy = self.flagged(image_audits[blade_name], "lazy_above_fold")
+
+        assert not lazy, f"Blade '{blade_name}' lazy-loads above-the-fold images: {lazy}"
+
+    @pytest.mark.parametrize("blade_name", list(HomePage.BLADES))
+    def test_images_decode(self, image_audits, blade_name):
+        """Verify every image decodes successfully"""
+        failed = self.flagged(image_audits[blade_name], "decode_failed")
+
+        assert not failed, f"Blade '{blade_name}' has images that fail to decode: {failed}"
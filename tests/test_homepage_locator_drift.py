@@ -0,0 +1,69 @@
+import os
+from types import SimpleNamespace
+import pytest
+from selenium.webdriver.common.by import By
+from components.base_blade import BaseBlade
+from pages.home_page import HomePage
+from utils.locator_index import build_locator_index, format_misses, write_locator_index
+
+
+@pytest.mark.locators
+class TestLocatorDrift:
+    """Selector drift checks - every declared locator evaluated against the live DOM in one pass"""
+
+    @pytest.fixture(scope="session")
+    def locator_index(self, home_page):
+        """Build locator index once and save it to the reports folder"""
+        index = build_locator_index(home_page.driver, HomePage.BLADES)
+        write_locator_index(index, os.path.join("reports", "locator_index.json"))
+        return index
+
+    @pytest.mark.parametrize("blade_name", list(HomePage.BLADES))
+    def test_blade_locators_match(self, locator_index, blade_name):
+        """Verify every locator the blade relies on still matches its subtree"""
+        report = locator_index[blade_name]
+        misses = format_misses(report)
+
+        assert not misses, f"Blade '{blade_name}' has drifted locators:\n" + "\n".join(misses)
+
+
+class XPathBlade(BaseBlade):
+    """Blade declaring a locator that has no CSS form"""
+
+    HEADING = (By.XPATH, "//h2[contains(., 'News')]")
+
+
+class TestLocatorIndex:
+    """Tests for building the locator index from a recorded script result"""
+
+    def build_report(self, counts):
+        """Build the 'news' blade report from a script result with these locator counts"""
+        result = {
+            "blades": {"news": {"root_found": True, "counts": counts, "testids": ["title"], "classes": []}},
+            "document_ids": [],
+        }
+        specs = []
+
+        def execute_script(script, spec):
+            specs.append(spec)
+            return result
+
+        driver = SimpleNamespace(execute_script=execute_script)
+        return build_locator_index(driver, {"news": ((By.ID, "news"), XPathBlade)})["news"], specs[0]
+
+    def test_xpath_locator_evaluated_in_page(self):
+        """Verify an XPath locator is sent to the page as XPath and a match is not reported as drift"""
+        report, spec = self.build_report({"HEADING": 1})
+
+        assert spec["news"]["locators"]["HEADING"] == ("xpath", XPathBlade.HEADING[1]), \
+            "XPath locator should be evaluated with document.evaluate"
+        assert all(miss["locator"] != "HEADING" for miss in report["misses"]), \
+            "Matching XPath locator should not be a miss"
+
+    def test_xpath_miss_reported_without_suggestions(self):
+        """Verify a required XPath locator that matches nothing is a miss without CSS suggestions"""
+        report, _ = self.build_report({"HEADING": 0})
+        miss = next(miss for miss in report["misses"] if miss["locator"] == "HEADING")
+
+        assert miss["selector"] == XPathBlade.HEADING[1], "Miss should show the XPath expression"
+        assert miss["suggestions"] == [], "No suggestions for XPath locators"
@@ -0,0 +1,93 @@
+import json
+import os
+import pytest
+from pages.home_page import HomePage
+from utils.cache_comparison import clear_browser_cache
+from utils.har_proxy import NETWORK_PROFILES
+from utils.tab_pool import isolated_tab
+
+
+# Unthrottled load every profile is compared against
+BASELINE = "unthrottled"
+
+
+@pytest.mark.performance
+@pytest.mark.cache_clear
+class TestNetworkProfiles:
+    """Blade render times on the Homepage under throttled network profiles"""
+
+    @pytest.fixture(scope="session")
+    def profiles_selected(self, request):
+        """Skip before a browser starts unless --network-profiles is given"""
+        if not request.config.getoption("--network-profiles"):
+            pytest.skip("Run with --network-profiles=all (or a comma-separated list) to measure throttled loads")
+
+    @pytest.fixture(scope="class")
+    def profile_tab(self, session_browser):
+        """Separate tab for cold loads so the shared homepage tab keeps its state"""
+        with isolated_tab(session_browser) as handle:
+            yield handle
+
+    @pytest.fixture(scope="session")
+    def render_times(self):
+        """Collect render times per profile and save them with slowdown vs the unthrottled load"""
+        results = {}
+        yield results
+        if not results:
+            return
+
+        baseline = results.get(BASELINE, {}).get("blades", {})
+        for profile, result in results.items():
+            result["slowdown"] = {
+                name: round(ms / baseline[name], 2) if ms and baseline.get(name) else None
+                for name, ms in result["blades"].items()
+            }
+        with open(os.path.join("reports", "network_profiles.json"), "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    def test_blades_render_under_profile(self, profiles_selected, session_browser, network_profile, profile_tab,
+                                         render_times):
+        """Verify every blade renders cold under the network profile and record its render time"""
+        profile = network_profile or BASELINE
+        session_browser.switch_to.window(profile_tab)
+        # Every profile loads cold; otherwise later profiles would mostly measure the cache
+        if not clear_browser_cache(session_browser):
+            pytest.skip("Browser backend offers no way to clear the HTTP cache, throttled loads would be warm")
+        result = HomePage(session_browser).measure_blade_render_times(timeout=120)
+        render_times[profile] = {"profile": NETWORK_PROFILES.get(network_profile), **result}
+
+        not_rendered = [name for name, ms in result["blades"].items() if ms is None]
+
+        assert not not_rendered, f"Blades did not render under '{profile}' within 120s: {not_rendered}"
+
+
+class TestProfileParametrization:
+    """Tests for running performance checks under each selected network profile"""
+
+    MODULE = """
+import pytest
+
+@pytest.mark.performance
+def test_budget(home_page):
+    pass
+
+def test_content(home_page):
+    pass
+
+@pytest.mark.performance
+def test_own_tab(session_browser):
+    pass
+"""
+
+    def test_performance_tests_run_per_profile(self, pytester):
+        """Verify only performance tests on the shared homepage are repeated per profile, unthrottled first"""
+        pytester.makeconftest("from tests.conftest import *")
+        pytester.makepyfile(test_budgets=self.MODULE)
+        items, _ = pytester.inline_genitems("-p", "no:cacheprovider", "--network-profiles=fast-3G,slow-4G")
+        names = [item.name for item in items]
+
+        assert [name for name in names if name.startswith("test_budget")] == [
+            "test_budget[unthrottled]", "test_budget[fast-3G]", "test_budget[slow-4G]",
+        ], f"Performance test should run unthrottled then per profile, got {names}"
+        assert "test_content" in names and "test_own_tab" in names, \
+            f"Tests off the shared homepage or not performance should run once, got {names}"
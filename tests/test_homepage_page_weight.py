@@ -0,0 +1,40 @@
+import os
+import pytest
+from pages.home_page import HomePage
+from utils.page_weight import build_page_weight_report, check_budget, load_budgets, write_page_weight_report
+
+
+@pytest.mark.performance
+class TestPageWeight:
+    """Per-blade page weight and asset attribution on the Homepage"""
+
+    @pytest.fixture(scope="session")
+    def budgets(self, request):
+        """Load per-blade budgets (--weight-budgets)"""
+        return load_budgets(request.config.getoption("--weight-budgets"))
+
+    @pytest.fixture(scope="session")
+    def page_weight(self, home_page, budgets):
+        """Attribute loaded resources to blades once and save JSON/HTML reports"""
+        report = build_page_weight_report(home_page.driver, HomePage.BLADES)
+        write_page_weight_report(
+            report,
+            os.path.join("reports", "page_weight.json"),
+            os.path.join("reports", "page_weight.html"),
+            budgets,
+        )
+        return report
+
+    def test_resources_are_recorded(self, page_weight):
+        """Verify Resource Timing entries were collected"""
+        assert page_weight["resources"], "Page should have Resource Timing entries"
+
+    @pytest.mark.parametrize("blade_name", list(HomePage.BLADES))
+    def test_blade_within_budget(self, page_weight, budgets, blade_name):
+        """Verify blade transfer size, request count and load duration stay within budget"""
+        if blade_name not in budgets:
+            pytest.skip(f"No page weight budget for '{blade_name}'")
+
+        violations = check_budget(page_weight["blades"][blade_name], budgets[blade_name])
+
+        assert not violations, f"Blade '{blade_name}' is over budget: {'; '.join(violations)}"
@@ -0,0 +1,51 @@
+import os
+import time
+import pytest
+import pytest_html
+from pages.home_page import HomePage
+from utils.render_timeline import render_timeline_html, write_render_timeline
+
+
+@pytest.mark.performance
+@pytest.mark.render_timeline
+class TestRenderTimeline:
+    """Per-blade render timeline of the Homepage"""
+
+    @pytest.fixture(scope="session")
+    def timeline(self, render_timeline, home_page):
+        """Bring every blade into view once, then collect and save the timeline (skips without --render-timeline)"""
+        for name in HomePage.BLADES:
+            home_page.get_blade(name).scroll_into_view()
+            time.sleep(0.5)
+        timeline = render_timeline.collect()
+        write_render_timeline(
+            timeline,
+            os.path.join("reports", "render_timeline.json"),
+            os.path.join("reports", "render_timeline.html"),
+        )
+        return timeline
+
+    def test_timeline_starts_with_navigation(self, timeline, extras):
+        """Verify the timeline script ran before the page's own scripts and attach it to the report"""
+        extras.append(pytest_html.extras.html(render_timeline_html(timeline)))
+        if not timeline["preloaded"]:
+            pytest.skip("Backend cannot inject scripts before navigation, timeline starts after load")
+
+        assert timeline["installed_ms"] <= min(
+            blade["attached_ms"] for blade in timeline["blades"].values() if blade["attached_ms"] is not None
+        ), "Timeline script should be installed before any blade is parsed"
+
+    @pytest.mark.parametrize("blade_name", list(HomePage.BLADES))
+    def test_blade_renders(self, timeline, blade_name):
+        """Verify blade recorded a first render"""
+        blade = timeline["blades"][blade_name]
+
+        assert blade["attached_ms"] is not None, f"Blade '{blade_name}' root was never attached"
+        assert blade["first_render_ms"] is not None, f"Blade '{blade_name}' never rendered"
+
+    @pytest.mark.parametrize("blade_name", list(HomePage.BLADES))
+    def test_blade_media_completes(self, timeline, blade_name):
+        """Verify blade's eager images and videos finished loading and decoding"""
+        blade = timeline["blades"][blade_name]
+
+        assert blade["media_complete_ms"] is not None, f"Blade '{blade_name}' media never completed"
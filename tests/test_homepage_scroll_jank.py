@@ -0,0 +1,56 @@
+import json
+import os
+import pytest
+from pages.home_page import HomePage
+from utils.jank import measure_scroll_jank
+
+
+@pytest.mark.performance
+class TestScrollJank:
+    """Main-thread jank while scrolling through every registered blade on the Homepage"""
+
+    # Per-blade limits (TBT and CLS follow the Web Vitals "good" thresholds)
+    MAX_TOTAL_BLOCKING_TIME_MS = 200
+    MAX_LAYOUT_SHIFT = 0.1
+    MAX_DROPPED_FRAME_RATIO = 0.25
+
+    @pytest.fixture(scope="session")
+    def scroll_jank(self, home_page):
+        """Scroll through all blades once and save per-blade jank to the reports folder"""
+        blades = [(name, home_page.get_blade(name)) for name in HomePage.BLADES]
+        jank = measure_scroll_jank(home_page.driver, blades)
+        with open(os.path.join("reports", "scroll_jank.json"), "w", encoding="utf-8") as f:
+            json.dump(jank, f, indent=2)
+        return jank
+
+    @pytest.mark.parametrize("blade_name", list(HomePage.BLADES))
+    def test_blade_total_blocking_time(self, scroll_jank, blade_name):
+        """Verify long tasks (or long frames where unsupported) while the blade is in view stay within budget"""
+        segment = scroll_jank["segments"][blade_name]
+
+        assert segment["total_blocking_time_ms"] <= self.MAX_TOTAL_BLOCKING_TIME_MS, (
+            f"Blade '{blade_name}' blocked the main thread for {segment['total_blocking_time_ms']}ms "
+            f"({segment['long_tasks']} long tasks from {scroll_jank['sources']['blocking']})"
+        )
+
+    @pytest.mark.parametrize("blade_name", list(HomePage.BLADES))
+    def test_blade_layout_shift(self, scroll_jank, blade_name):
+        """Verify layout shift (or blade movement where unsupported) while the blade is in view stays below 0.1"""
+        segment = scroll_jank["segments"][blade_name]
+
+        assert segment["layout_shift"] <= self.MAX_LAYOUT_SHIFT, (
+            f"Blade '{blade_name}' caused layout shift {segment['layout_shift']} "
+            f"(from {scroll_jank['sources']['layout_shift']})"
+        )
+
+    @pytest.mark.parametrize("blade_name", list(HomePage.BLADES))
+    def test_blade_dropped_frames(self, scroll_jank, blade_name):
+        """Verify most animation frames are delivered while the blade is in view"""
+        segment = scroll_jank["segments"][blade_name]
+        expected = segment["frames"] + segment["dropped_frames"]
+
+        assert expected, f"No animation frames sampled for blade '{blade_name}'"
+        assert segment["dropped_frames"] / expected <= self.MAX_DROPPED_FRAME_RATIO, (
+            f"Blade '{blade_name}' dropped {segment['dropped_frames']} of {expected} frames "
+            f"(worst frame {segment['worst_frame_ms']}ms)"
+        )
@@ -0,0 +1,147 @@
+import os
+from types import SimpleNamespace
+import pytest
+from utils.page_weight import check_budget, load_budgets
+from utils.third_party import build_third_party_report, write_third_party_report
+
+
+@pytest.mark.performance
+class TestThirdPartyCost:
+    """Network and main-thread cost of third-party origins on the Homepage"""
+
+    # Budget metrics measured on the main thread (unavailable without LoAF or longtask entries)
+    MAIN_THREAD_METRICS = ("main_thread_ms", "main_thread_share")
+
+    @pytest.fixture(scope="session")
+    def budgets(self, request):
+        """Load third-party budgets (--third-party-budgets)"""
+        return load_budgets(request.config.getoption("--third-party-budgets"))
+
+    @pytest.fixture(scope="session")
+    def third_party(self, home_page):
+        """Group resource and script cost by origin once and save JSON/HTML reports"""
+        report = build_third_party_report(home_page.driver)
+        write_third_party_report(
+            report,
+            os.path.join("reports", "third_party.json"),
+            os.path.join("reports", "third_party.html"),
+        )
+        return report
+
+    def test_third_party_origins_found(self, third_party):
+        """Verify third-party origins (consent, riotbar, analytics) are detected"""
+        assert third_party["third_party"]["origins"], "Homepage should load resources from third-party origins"
+
+    # Network budget tests
+
+    def test_each_third_party_within_network_budget(self, third_party, budgets):
+        """Verify every third-party origin stays within the network part of its own or the default budget"""
+        over = self.origin_violations(third_party, budgets, main_thread=False)
+
+        assert not over, "Third-party origins over network budget:\n" + "\n".join(over)
+
+    def test_third_party_total_within_network_budget(self, third_party, budgets):
+        """Verify combined third-party network cost stays within the total budget"""
+        violations = self.total_violations(third_party, budgets, main_thread=False)
+
+        assert not violations, f"Third parties combined are over network budget: {'; '.join(violations)}"
+
+    # Main-thread budget tests
+
+    def test_each_third_party_within_main_thread_budget(self, third_party, budgets):
+        """Verify every third-party origin stays within the main-thread part of its own or the default budget"""
+        self.skip_unmeasured_main_thread(third_party)
+        over = self.origin_violations(third_party, budgets, main_thread=True)
+
+        assert not over, "Third-party origins over main-thread budget:\n" + "\n".join(over)
+
+    def test_third_party_total_within_main_thread_budget(self, third_party, budgets):
+        """Verify combined third-party main-thread time stays within the total budget"""
+        self.skip_unmeasured_main_thread(third_party)
+        violations = self.total_violations(third_party, budgets, main_thread=True)
+
+        assert not violations, f"Third parties combined are over main-thread budget: {'; '.join(violations)}"
+
+    # Helpers
+
+    @classmethod
+    def split_budget(cls, budget, measured, main_thread):
+        """Limits of budget for the main-thread or network metrics that were measured"""
+        return {
+            metric: limit for metric, limit in budget.items()
+            if (metric in cls.MAIN_THREAD_METRICS) == main_thread and measured.get(metric) is not None
+        }
+
+    def origin_violations(self, third_party, budgets, main_thread):
+        """Budget violations of every third-party origin, prefixed with the origin"""
+        over = []
+        for origin, entry in third_party["origins"].items():
+            if not entry["third_party"]:
+                continue
+            budget = self.split_budget(budgets.get(origin, budgets.get("default", {})), entry, main_thread)
+            over += [f"{origin}: {violation}" for violation in check_budget(entry, budget)]
+        return over
+
+    def total_violations(self, third_party, budgets, main_thread):
+        """Budget violations of the combined third-party cost"""
+        totals = third_party["third_party"]
+        return check_budget(totals, self.split_budget(budgets.get("total", {}), totals, main_thread))
+
+    @staticmethod
+    def skip_unmeasured_main_thread(third_party):
+        """Skip when the browser reports no entries to measure main-thread time from"""
+        if third_party["main_thread_source"] is None:
+            pytest.skip(
+                "Main-thread budgets not checked, browser reports neither "
+                f"long-animation-frame nor longtask entries ({third_party['supported']})"
+            )
+
+
+class TestThirdPartyAttribution:
+    """Tests for main-thread attribution from recorded entries, without a browser"""
+
+    ORIGIN = "https://www.leagueoflegends.com"
+    PAGE = f"{ORIGIN}/en-us/"
+    THIRD = "https://cdn.analytics.example"
+
+    def report(self, scripts=(), long_tasks=(), loaf=True, longtask=True):
+        """Build a report from canned script data"""
+        data = {
+            "page_url": self.PAGE,
+            "load_ms": 1000,
+            "supported": {"long_animation_frame": loaf, "longtask": longtask},
+            "resources": [],
+            "scripts": list(scripts),
+            "long_tasks": list(long_tasks),
+        }
+        return build_third_party_report(SimpleNamespace(execute_async_script=lambda script: data))
+
+    def test_loaf_script_time_used_when_present(self):
+        """Verify LoAF script timings are the main-thread source when there are any"""
+        report = self.report(
+            scripts=[{"source_url": f"{self.THIRD}/tag.js", "duration_ms": 120, "forced_layout_ms": 0}],
+            long_tasks=[{"duration_ms": 400, "container_src": ""}],
+        )
+
+        assert report["main_thread_source"] == "long_animation_frame", "LoAF entries should be the source"
+        assert report["origins"][self.THIRD]["main_thread_ms"] == 120, "Third party should own its script time"
+        assert report["third_party"]["main_thread_share"] == 1.0, "Only the third party ran scripts"
+
+    def test_long_tasks_used_without_loaf_entries(self):
+        """Verify long-task time is the fallback when no LoAF script timings were recorded"""
+        report = self.report(loaf=False, long_tasks=[
+            {"duration_ms": 300, "container_src": ""},
+            {"duration_ms": 100, "container_src": f"{self.THIRD}/frame.html"},
+        ])
+
+        assert report["main_thread_source"] == "longtask", "Long tasks should be the fallback source"
+        assert report["origins"][self.ORIGIN]["main_thread_ms"] == 300, "Page should own unattributed tasks"
+        assert report["third_party"]["main_thread_ms"] == 100, "Iframe task should count for the third party"
+        assert report["third_party"]["main_thread_share"] == 0.25, "Share should use long-task totals"
+
+    def test_main_thread_unmeasured_without_entry_types(self):
+        """Verify main-thread values are None (not 0) when neither entry type is supported"""
+        report = self.report(loaf=False, longtask=False)
+
+        assert report["main_thread_source"] is None, "No main-thread source without LoAF or longtask"
+        assert report["third_party"]["main_thread_ms"] is None, "Unmeasured main-thread time should be None"
@@ -0,0 +1,70 @@
+import os
+import urllib.request
+import pytest
+from utils.metrics_exporter import MetricsExporter, MetricsRegistry
+
+
+class TestMetricsExporter:
+    """Tests for the OpenMetrics exporter used in synthetic monitoring runs"""
+
+    @pytest.fixture
+    def registry(self):
+        """Registry with one blade's results, a duration and command counts"""
+        registry = MetricsRegistry(buckets=(0.5, 1.0))
+        registry.set("blade_up", 1, blade="media_promo")
+        registry.inc("tests", blade="media_promo", outcome="passed")
+        registry.observe("test_duration_seconds", 0.7, test="tests/test_a.py::test_b")
+        registry.inc("webdriver_commands", command="get")
+        registry.inc("webdriver_commands", command="get")
+        return registry
+
+    def test_openmetrics_format(self, registry):
+        """Verify OpenMetrics output: counter families without _total, cumulative buckets, EOF"""
+        text = registry.render(openmetrics=True)
+
+        assert "# TYPE lol_synthetic_tests counter" in text, "Counter family should not carry _total"
+        assert 'lol_synthetic_tests_total{blade="media_promo",outcome="passed"} 1' in text, "Counter sample missing"
+        assert 'lol_synthetic_webdriver_commands_total{command="get"} 2' in text, "Commands should be counted"
+        assert 'lol_synthetic_test_duration_seconds_bucket{test="tests/test_a.py::test_b",le="0.5"} 0' in text
+        assert 'lol_synthetic_test_duration_seconds_bucket{test="tests/test_a.py::test_b",le="1.0"} 1' in text
+        assert 'lol_synthetic_test_duration_seconds_bucket{test="tests/test_a.py::test_b",le="+Inf"} 1' in text
+        assert 'lol_synthetic_blade_up{blade="media_promo"} 1' in text, "Gauge sample missing"
+        assert text.endswith("# EOF\n"), "OpenMetrics exposition must end with # EOF"
+
+    def test_prometheus_format(self, registry):
+        """Verify the textfile format names counter families with _total and has no EOF marker"""
+        text = registry.render(openmetrics=False)
+
+        assert "# TYPE lol_synthetic_tests_total counter" in text, "Prometheus counter family should end in _total"
+        assert "# EOF" not in text, "Prometheus text format has no EOF marker"
+
+    def test_textfile_carries_counters_over_runs(self, registry, tmp_path):
+        """Verify counters and histograms continue from the previous run while gauges start fresh"""
+        textfile = str(tmp_path / "synthetic.prom")
+        MetricsExporter(registry, textfile=textfile).start().stop()
+
+        next_run = MetricsRegistry(buckets=(0.5, 1.0))
+        MetricsExporter(next_run, textfile=textfile).start()
+        next_run.inc("webdriver_commands", command="get")
+
+        assert next_run.get("webdriver_commands", command="get") == 3, "Counter should continue from saved state"
+        assert next_run.get("test_duration_seconds", test="tests/test_a.py::test_b")["count"] == 1, \
+            "Histogram should continue from saved state"
+        assert next_run.get("blade_up", blade="media_promo") is None, "Gauges should not be carried over"
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")], "Temp files should be replaced"
+
+    def test_http_endpoint_negotiates_format(self, registry):
+        """Verify /metrics serves OpenMetrics to scrapers that accept it and Prometheus text otherwise"""
+        exporter = MetricsExporter(registry, port=0).start()
+        try:
+            request = urllib.request.Request(exporter.address, headers={"Accept": "application/openmetrics-text"})
+            with urllib.request.urlopen(request, timeout=5) as response:
+                openmetrics = response.headers["Content-Type"], response.read().decode()
+            with urllib.request.urlopen(exporter.address, timeout=5) as response:
+                plain = response.headers["Content-Type"], response.read().decode()
+        finally:
+            exporter.stop()
+
+        assert openmetrics[0].startswith("application/openmetrics-text"), f"Unexpected type {openmetrics[0]}"
+        assert openmetrics[1].endswith("# EOF\n"), "OpenMetrics body should end with # EOF"
+        assert plain[0].startswith("text/plain"), f"Unexpected type {plain[0]}"
@@ -0,0 +1,126 @@
+import pytest
+from pages.home_page import HomePage
+from utils.tab_pool import isolated_tab
+
+
+# Gives the replay's icon tabs the selection behaviour of the live site: the clicked tab gets aria-selected
+TAB_BEHAVIOUR_SCRIPT = """
+const tabs = [...document.getElementById(arguments[0]).querySelectorAll("[data-testid='slide']")];
+tabs.forEach((tab, index) => {
+    tab.setAttribute('aria-selected', String(index === 0));
+    tab.addEventListener('click', () => tabs.forEach(other => other.setAttribute('aria-selected', String(other === tab))));
+});
+"""
+
+
+class TestPageCheckpoint:
+    """Tests for BasePage.checkpoint/restore against the local replay homepage"""
+
+    @pytest.fixture(scope="class")
+    def replay_home(self, session_browser, replay_server):
+        """Load the replay homepage in a separate tab"""
+        with isolated_tab(session_browser, f"{replay_server}/"):
+            session_browser.execute_script(TAB_BEHAVIOUR_SCRIPT, HomePage.ICON_TAB_CHOOSE_CHAMPION[1])
+            yield HomePage(session_browser)
+
+    def test_restores_scroll_and_navigation(self, replay_home):
+        """Verify in-page navigation is undone through history and scroll position is reapplied"""
+        checkpoint = replay_home.checkpoint()
+        replay_home.driver.execute_script("location.hash = 'comments'; window.scrollTo(0, document.body.scrollHeight);")
+
+        reloaded = replay_home.restore(checkpoint)
+        state = replay_home.checkpoint()
+
+        assert not reloaded, "Hash navigation should be undone without replacing the document"
+        assert state["url"] == checkpoint["url"], f"URL should be {checkpoint['url']}, got {state['url']}"
+        assert state["scroll"] == checkpoint["scroll"], f"Scroll should be {checkpoint['scroll']}, got {state['scroll']}"
+
+    def test_restores_active_tab(self, replay_home):
+        """Verify a clicked tab is switched back to the checkpointed one"""
+        checkpoint = replay_home.checkpoint()
+        replay_home.get_blade("icon_tab_choose_champion").click_tab_by_index(1)
+        moved = replay_home.checkpoint()["blades"]["icon_tab_choose_champion"]["active_index"]
+
+        replay_home.restore(checkpoint)
+        restored = replay_home.checkpoint()["blades"]["icon_tab_choose_champion"]["active_index"]
+
+        assert checkpoint["blades"]["icon_tab_choose_champion"]["active_index"] == 0, "First tab should start active"
+        assert moved == 1, f"Clicked tab should be active, got {moved}"
+        assert restored == 0, f"Checkpointed tab should be active again, got {restored}"
+
+    def test_closes_windows_opened_since_checkpoint(self, replay_home):
+        """Verify windows opened by the test are closed and focus returns to the page"""
+        checkpoint = replay_home.checkpoint()
+        replay_home.driver.switch_to.new_window("tab")
+
+        replay_home.restore(checkpoint)
+
+        assert replay_home.driver.window_handles == checkpoint["windows"], "New windows should be closed"
+        assert replay_home.driver.current_window_handle == checkpoint["window"], "Checkpointed window should be current"
+
+    def test_reloads_when_active_slide_lost(self, replay_home):
+        """Verify a blade whose slides disappeared is brought back by reloading the page"""
+        root = HomePage.ICON_TAB_CHOOSE_CHAMPION[1]
+        checkpoint = replay_home.checkpoint()
+        replay_home.driver.execute_script(
+            "document.getElementById(arguments[0]).querySelectorAll(\"[data-testid='slide']\").forEach(s => s.remove());",
+            root
+        )
+
+        reloaded = replay_home.restore(checkpoint)
+        restored = replay_home.checkpoint()["blades"]["icon_tab_choose_champion"]
+        replay_home.driver.execute_script(TAB_BEHAVIOUR_SCRIPT, root)
+
+        assert reloaded, "Restore should report the reload so fixtures re-resolve their blades"
+        assert restored["slide_count"] == checkpoint["blades"]["icon_tab_choose_champion"]["slide_count"], \
+            "Reload should bring the slides back"
+        assert restored["active_index"] is not None, "Reloaded blade should have an active slide"
+
+
+class TestCheckpointReruns:
+    """Tests for restoring an interactive test's checkpoint around FlakeEngine reruns, in an inner pytest run"""
+
+    INTERACTIVE_TESTS = """
+import pytest
+from types import SimpleNamespace
+
+EVENTS = []
+
+class FakeHome:
+    driver = None
+
+    def checkpoint(self):
+        EVENTS.append("checkpoint")
+        return {}
+
+    def restore(self, checkpoint):
+        EVENTS.append("restore")
+        return False
+
+@pytest.fixture(scope="session")
+def home_page():
+    return FakeHome()
+
+@pytest.fixture(scope="session")
+def media_promo():
+    return SimpleNamespace(driver=None)
+
+@pytest.mark.interactive
+def test_flaky_click(media_promo):
+    EVENTS.append("call")
+    assert EVENTS.count("call") > 1
+
+def test_zz_events():
+    assert EVENTS == ["checkpoint", "call", "restore", "call", "restore"], EVENTS
+"""
+
+    def test_checkpoint_restored_before_rerun(self, pytester):
+        """Verify the checkpoint is restored before the rerun and again after the test"""
+        pytester.makeconftest("from tests.conftest import *")
+        pytester.makepyfile(test_inner=self.INTERACTIVE_TESTS)
+
+        result = pytester.runpytest_inprocess(
+            "--blade-reruns=1", f"--flake-history={pytester.path / 'history.json'}", "-p", "no:cacheprovider"
+        )
+
+        result.assert_outcomes(passed=2)
@@ -0,0 +1,40 @@
+import os
+import time
+import pytest
+from utils.resource_monitor import ResourceMonitor, summarize_resources
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="Resource monitor reads /proc")
+class TestResourceMonitor:
+    """Tests for the /proc resource monitor, watching the test process itself"""
+
+    @pytest.fixture(scope="class")
+    def monitor(self):
+        """Resource monitor sampling this process tree"""
+        monitor = ResourceMonitor(os.getpid(), interval=0.05).start()
+        yield monitor
+        monitor.stop()
+
+    def test_phase_records_cpu_and_memory(self, monitor):
+        """Verify a busy phase records CPU time, RSS and peaks"""
+        monitor.begin("tests/example.py::test_busy", "call")
+        deadline = time.perf_counter() + 0.3
+        while time.perf_counter() < deadline:
+            pass
+        record = monitor.end()
+
+        assert record["cpu_seconds"] > 0.1, f"Busy loop should use CPU, recorded {record['cpu_seconds']}s"
+        assert record["rss_peak"] >= record["rss_start"] > 0, "RSS should be recorded"
+        assert record["peak_cpu_percent"] > 0, "Background samples should see CPU usage"
+        assert monitor.record_for("tests/example.py::test_busy", "call") is record, "Record should be retrievable"
+
+    def test_summary_attributes_phases_to_tests(self, monitor):
+        """Verify per-phase records are summed per test"""
+        for phase in ("setup", "call", "teardown"):
+            monitor.begin("tests/example.py::test_phases", phase)
+            time.sleep(0.05)
+            monitor.end()
+
+        test = summarize_resources(monitor.records)["tests"]["tests/example.py::test_phases"]
+
+        assert test["wall_seconds"] >= 0.15, f"Three phases should add up, got {test['wall_seconds']}s"
@@ -0,0 +1,103 @@
+import os
+import pytest
+from pages.home_page import HomePage
+from utils.crawler import SiteCrawler, normalize_url, write_crawl_report
+
+
+class TestSiteCrawlerReplay:
+    """Tests for the site crawler against the local replay stand-in"""
+
+    @pytest.fixture(scope="class")
+    def replay_pages(self, session_browser, replay_server):
+        """Crawl replay site two hops deep once for all tests"""
+        crawler = SiteCrawler(session_browser, f"{replay_server}/", max_depth=2, tabs=3)
+        return crawler.crawl()
+
+    def test_crawl_reaches_linked_pages(self, replay_pages, replay_server):
+        """Verify crawler follows CTA and carousel links to other pages"""
+        visited = {page["url"] for page in replay_pages}
+        expected = {
+            f"{replay_server}/",
+            f"{replay_server}/news/",
+            f"{replay_server}/champions/",
+            f"{replay_server}/news/article-one/",
+            f"{replay_server}/news/article-two/",
+        }
+
+        assert visited == expected, f"Crawler should visit {sorted(expected)}, got {sorted(visited)}"
+
+    def test_visited_urls_are_unique(self, replay_pages):
+        """Verify each page is visited once (fragments and duplicates collapsed)"""
+        urls = [normalize_url(page["url"]) for page in replay_pages]
+
+        assert len(urls) == len(set(urls)), f"Crawler should not revisit pages, got {urls}"
+
+    def test_crawl_stays_in_domain(self, replay_pages, replay_server):
+        """Verify external CTA links are not followed"""
+        external = [page["url"] for page in replay_pages if not page["url"].startswith(replay_server)]
+
+        assert not external, f"Crawler should stay on the crawled host, visited {external}"
+
+    def test_home_blades_detected_by_id(self, replay_pages, replay_server):
+        """Verify all registered homepage blades are found on the start page"""
+        home = next(page for page in replay_pages if page["url"] == f"{replay_server}/")
+        names = {blade["name"] for blade in home["blades"]}
+
+        assert names == set(HomePage.BLADES), f"Start page should have {sorted(HomePage.BLADES)}, got {sorted(names)}"
+
+    def test_blades_detected_by_signature(self, replay_pages, replay_server):
+        """Verify blades with unregistered ids are recognized by their component signature"""
+        news = next(page for page in replay_pages if page["url"] == f"{replay_server}/news/")
+        components = {blade["component"] for blade in news["blades"]}
+
+        assert "ArticleCardCarouselBlade" in components, \
+            f"News page carousel should be detected, got {components}"
+
+    def test_detected_blades_pass_structural_checks(self, replay_pages):
+        """Verify every detected blade is visible and has its critical selectors"""
+        for page in replay_pages:
+            for blade in page["blades"]:
+                assert blade["visible"], f"Blade '{blade['name']}' on {page['url']} should be visible"
+                assert not blade["missing_critical"], \
+                    f"Blade '{blade['name']}' on {page['url']} is missing {blade['missing_critical']}"
+
+    def test_every_page_has_timing(self, replay_pages):
+        """Verify per-page load and scan timing is recorded"""
+        for page in replay_pages:
+            assert page.get("load_seconds") is not None, f"{page['url']} should have load timing"
+            assert page.get("timing"), f"{page['url']} should have navigation timing"
+
+
+@pytest.mark.crawl
+class TestSiteCrawlerLive:
+    """Crawl of the live site from the homepage (depth and tabs set by --crawl-depth/--crawl-tabs)"""
+
+    @pytest.fixture(scope="class")
+    def live_pages(self, request, session_browser):
+        """Crawl live site once and save results to the reports folder"""
+        crawler = SiteCrawler(
+            session_browser,
+            HomePage.URL,
+            max_depth=request.config.getoption("--crawl-depth"),
+            tabs=request.config.getoption("--crawl-tabs"),
+        )
+        pages = crawler.crawl()
+        write_crawl_report(pages, os.path.join("reports", "crawl.json"))
+        return pages
+
+    def test_all_pages_loaded(self, live_pages):
+        """Verify every crawled page finished loading"""
+        failed = [page["url"] for page in live_pages if page.get("error")]
+
+        assert not failed, f"Pages should load, failed: {failed}"
+
+    def test_detected_blades_pass_structural_checks(self, live_pages):
+        """Verify every detected blade across the site is visible and has its critical selectors"""
+        broken = [
+            f"{page['url']} {blade['name']}: visible={blade['visible']} missing={blade['missing_critical']}"
+            for page in live_pages
+            for blade in page["blades"]
+            if not blade["visible"] or blade["missing_critical"]
+        ]
+
+        assert not broken, "Blades should pass structural checks:\n" + "\n".join(broken)
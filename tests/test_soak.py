@@ -0,0 +1,69 @@
+import os
+import pytest
+from pages.home_page import HomePage
+from utils.soak import SOAK_METRICS, SoakRunner, build_scenarios, detect_growth, write_soak_report
+from utils.tab_pool import isolated_tab
+
+
+@pytest.mark.soak
+class TestSoak:
+    """Memory and latency drift while looping blade interactions on the Homepage"""
+
+    # Allowed growth from the first to the last quarter of the run
+    TOLERANCES = {"heap_bytes": 0.2, "rss_bytes": 0.25, "command_ms": 0.5}
+
+    @pytest.fixture(scope="session")
+    def soak_minutes(self, request):
+        """Soak duration from --soak-minutes (skips before a tab is opened when unset)"""
+        minutes = request.config.getoption("--soak-minutes")
+        if not minutes:
+            pytest.skip("Run with --soak-minutes=N to soak the homepage")
+        return minutes
+
+    @pytest.fixture(scope="session")
+    def soak_page(self, request, soak_minutes, session_browser):
+        """Homepage loaded in its own tab, so the soak loop leaves the shared page untouched"""
+        with isolated_tab(session_browser):
+            page = HomePage(session_browser)
+            page.load()
+            page.dismiss_cookie_banner()
+            page.dismiss_riot_alert()
+            if request.config.getoption("--freeze-animations"):
+                page.freeze_animations()
+            yield page
+
+    @pytest.fixture(scope="session")
+    def soak_run(self, soak_minutes, soak_page):
+        """Loop interaction scenarios for --soak-minutes and save samples and drift charts"""
+        seconds = soak_minutes * 60
+        runner = SoakRunner(
+            soak_page.driver, build_scenarios(soak_page), seconds, sample_interval=min(30, max(5, seconds / 20))
+        )
+        samples = runner.run()
+        growth = {metric: detect_growth(samples, metric, self.TOLERANCES[metric]) for metric in SOAK_METRICS}
+        write_soak_report(
+            samples,
+            growth,
+            runner.errors,
+            os.path.join("reports", "soak.json"),
+            os.path.join("reports", "soak.html"),
+        )
+        return {"samples": samples, "growth": growth, "errors": runner.errors}
+
+    def test_scenarios_run_without_errors(self, soak_run):
+        """Verify interaction scenarios keep working for the whole run"""
+        errors = [f"#{error['iteration']} {error['scenario']}: {error['error']}" for error in soak_run["errors"]]
+
+        assert not errors, f"{len(errors)} scenario iterations failed:\n" + "\n".join(errors[:10])
+
+    @pytest.mark.parametrize("metric", SOAK_METRICS)
+    def test_no_sustained_growth(self, soak_run, metric):
+        """Verify metric does not grow steadily over the run"""
+        result = soak_run["growth"][metric]
+        if result is None:
+            pytest.skip(f"No '{metric}' samples on this backend")
+
+        assert not result["sustained"], (
+            f"{metric} grew {result['growth']:.1%} from {result['first_quarter']} to {result['last_quarter']} "
+            f"({result['slope_per_minute']}/min), tolerance {result['tolerance']:.0%}"
+        )
@@ -0,0 +1,147 @@
+import base64
+import os
+from types import SimpleNamespace
+import pytest_html
+from utils.stream_report import AttachmentStore, StreamingReporter, iter_records, render_index
+
+
+def phase_report(nodeid, when, outcome="passed", extras=(), longrepr=None):
+    """Minimal stand-in for a pytest TestReport"""
+    return SimpleNamespace(
+        nodeid=nodeid, when=when, outcome=outcome, duration=0.1, longrepr=longrepr, extras=list(extras),
+        user_properties=[], passed=outcome == "passed", failed=outcome == "failed", skipped=outcome == "skipped",
+    )
+
+
+def run_test(reporter, nodeid, call_outcome="passed", extras=()):
+    """Feed setup, call and teardown reports of one test"""
+    reporter.add_report(phase_report(nodeid, "setup"))
+    reporter.add_report(phase_report(
+        nodeid, "call", call_outcome, extras, longrepr="AssertionError" if call_outcome == "failed" else None
+    ))
+    reporter.add_report(phase_report(nodeid, "teardown"))
+
+
+class TestStreamReport:
+    """Tests for the streaming JSONL reporter, attachment store and paginated index"""
+
+    def test_record_written_after_teardown(self, tmp_path):
+        """Verify phases merge into one record that is on disk once the test finishes"""
+        reporter = StreamingReporter(str(tmp_path))
+        reporter.add_report(phase_report("tests/test_a.py::test_b", "setup"))
+        reporter.add_report(phase_report("tests/test_a.py::test_b", "call", "failed", longrepr="AssertionError"))
+
+        assert list(iter_records(str(tmp_path))) == [], "Record should wait for teardown"
+
+        reporter.add_report(phase_report("tests/test_a.py::test_b", "teardown"))
+        records = list(iter_records(str(tmp_path)))
+        reporter.close()
+
+        assert len(records) == 1, f"Expected one record, got {len(records)}"
+        assert records[0]["outcome"] == "failed", "Failed call should fail the test"
+        assert records[0]["longrepr"] == "AssertionError", "Failure details should be kept"
+
+    def test_attachments_deduplicated_by_content(self, tmp_path):
+        """Verify identical screenshots are stored once and referenced by path"""
+        screenshot = pytest_html.extras.png(base64.b64encode(b"fake png").decode())
+        reporter = StreamingReporter(str(tmp_path))
+        run_test(reporter, "tests/test_a.py::test_one", "failed", [screenshot])
+        run_test(reporter, "tests/test_a.py::test_two", "failed", [screenshot])
+        reporter.close()
+
+        paths = [record["attachments"][0]["path"] for record in iter_records(str(tmp_path))]
+        stored = [name for _, _, names in os.walk(tmp_path / "attachments") for name in names]
+
+        assert paths[0] == paths[1], "Same content should map to the same attachment"
+        assert len(stored) == 1, f"Attachment should be stored once, found {stored}"
+        assert (tmp_path / paths[0]).read_bytes() == b"fake png", "Attachment should hold decoded bytes"
+
+    def test_index_merges_shards_and_paginates(self, tmp_path):
+        """Verify worker shards are merged and split into pages"""
+        for shard in ("gw0", "gw1"):
+            reporter = StreamingReporter(str(tmp_path), shard)
+            for index in range(3):
+                run_test(reporter, f"tests/test_{shard}.py::test_{index}", "failed" if index == 0 else "passed")
+            reporter.close()
+
+        totals = render_index(str(tmp_path), page_size=4)
+        index = (tmp_path / "index.html").read_text(encoding="utf-8")
+
+        assert totals == {"failed": 2, "passed": 4}, f"Unexpected totals {totals}"
+        assert sorted(name for name in os.listdir(tmp_path) if name.startswith("page-")) == \
+            ["page-0001.html", "page-0002.html"], "Six tests at four per page should give two pages"
+        assert "page-0002.html" in index, "Index should link every page"
+
+    def test_attachment_store_keeps_urls_as_links(self, tmp_path):
+        """Verify URL extras are linked instead of stored"""
+        entry = AttachmentStore(str(tmp_path)).put_extra(pytest_html.extras.url("https://example.com", name="Site"))
+
+        assert entry == {"name": "Site", "url": "https://example.com"}, f"Unexpected entry {entry}"
+
+    def test_stored_extra_references_file(self, tmp_path):
+        """Verify stored extras keep only the file path and are not stored twice"""
+        store = AttachmentStore(str(tmp_path))
+        screenshot = store.stored_extra(pytest_html.extras.png(base64.b64encode(b"fake png").decode()))
+        har = store.stored_extra(pytest_html.extras.json({"log": {"entries": []}}, name="HAR"))
+
+        assert screenshot["format_type"] == "image", "Screenshot should stay an image extra"
+        assert open(screenshot["content"], "rb").read() == b"fake png", "Screenshot content should be its file path"
+        assert har["format_type"] == "url" and har["content"].endswith(".json"), f"HAR should become a link, got {har}"
+        assert store.put_extra(screenshot)["path"] == store.stored_path(screenshot["content"]), \
+            "Stored extra should map back to its attachment"
+        stored = [name for _, _, names in os.walk(tmp_path / "attachments") for name in names]
+        assert len(stored) == 2, f"Each attachment should be stored once, found {stored}"
+
+
+    def test_screenshot_path_copied(self, tmp_path):
+        """Verify a screenshot attached by file path is copied into the store without base64"""
+        screenshot = tmp_path / "failure.png"
+        screenshot.write_bytes(b"fake png")
+        store = AttachmentStore(str(tmp_path / "stream"))
+        stored = store.stored_extra(pytest_html.extras.png(str(screenshot)))
+
+        assert stored["format_type"] == "image", "Screenshot should stay an image extra"
+        assert stored["content"] != str(screenshot), "Screenshot should be copied into the attachment store"
+        assert open(stored["content"], "rb").read() == b"fake png", "Stored screenshot should keep its bytes"
+
+
+class TestStreamingResults:
+    """Tests for the --stream-report plugin in an inner pytest run"""
+
+    FAILING_TEST = """
+import base64
+import pytest_html
+
+def test_with_screenshot(extras):
+    extras.append(pytest_html.extras.png(base64.b64encode(b"x" * 100000).decode()))
+    assert False
+"""
+
+    def test_report_extras_hold_paths(self, pytester):
+        """Verify report extras reference the stored attachment instead of holding its content"""
+        pytester.makeconftest("from tests.conftest import *")
+        pytester.makepyfile(test_inner=self.FAILING_TEST)
+
+        result = pytester.runpytest_inprocess("--stream-report=stream", "-p", "no:cacheprovider")
+        report = next(
+            report for report in result.reprec.getreports("pytest_runtest_logreport") if report.when == "call"
+        )
+        content = report.extras[0]["content"]
+
+        assert len(content) < 1000, "Report should hold a path, not the base64 screenshot"
+        assert content.startswith(str(pytester.path / "stream" / "attachments")), f"Unexpected path {content}"
+        assert (pytester.path / "stream" / "index.html").exists(), "Streaming index should be written"
+
+    def test_plugin_skipped_when_collecting_only(self, pytester):
+        """Verify --collect-only neither clears shards nor writes a report"""
+        pytester.makeconftest("from tests.conftest import *")
+        pytester.makepyfile(test_inner=self.FAILING_TEST)
+        shard = pytester.path / "stream" / "results-main.jsonl"
+        shard.parent.mkdir()
+        shard.write_text("{}\n")
+
+        result = pytester.runpytest_inprocess("--stream-report=stream", "--collect-only", "-p", "no:cacheprovider")
+
+        assert result.ret == 0, "Collection should succeed"
+        assert shard.exists(), "Collect-only run should leave the previous shards alone"
+        assert not (pytester.path / "stream" / "index.html").exists(), "Collect-only run should not render a report"
@@ -0,0 +1,97 @@
+import pytest
+from pages.home_page import HomePage
+from tests.conftest import tab_key
+from utils.tab_pool import TabPool, isolated_tab
+
+
+class TestTabPool:
+    """Tests for the tab pool against the local replay stand-in"""
+
+    @pytest.fixture(scope="class")
+    def loaded_pool(self, session_browser, replay_server):
+        """Open three tabs and load the replay homepage in all of them concurrently"""
+        pool = TabPool(session_browser, 3).open()
+        loads = pool.load_all([f"{replay_server}/"] * 3)
+        yield pool, loads
+        pool.close()
+
+    def test_all_tabs_finish_loading(self, loaded_pool):
+        """Verify every tab reports the page as loaded"""
+        _, loads = loaded_pool
+        not_ready = [url for _, url, seconds in loads if seconds is None]
+
+        assert not not_ready, f"Every tab should finish loading, still loading: {not_ready}"
+
+    def test_tabs_are_distinct_windows(self, loaded_pool, session_browser):
+        """Verify pool tabs are separate window handles"""
+        pool, _ = loaded_pool
+
+        assert len(set(pool.handles)) == 3, f"Pool should have 3 distinct tabs, got {pool.handles}"
+        assert set(pool.handles) <= set(session_browser.window_handles), "Pool tabs should be open in the browser"
+
+    def test_dispatch_runs_health_probe_in_every_tab(self, loaded_pool):
+        """Verify dispatcher runs a step in each tab and returns per-tab results"""
+        pool, _ = loaded_pool
+        results = pool.dispatch(
+            [(handle, lambda driver: HomePage(driver).check_blade_health(timeout=1)) for handle in pool.handles]
+        )
+
+        for handle, (health, _) in zip(pool.handles, results):
+            assert health is not None, f"Tab {handle} should return health probe results"
+            broken = {name: missing for name, missing in health.items() if missing}
+            assert not broken, f"Tab {handle} blades should be healthy, missing: {broken}"
+
+    def test_classes_spread_across_tabs(self, loaded_pool):
+        """Verify test classes are pinned to the least used tab"""
+        pool, _ = loaded_pool
+        handles = [pool.handle_for(f"TestClass{i}") for i in range(6)]
+
+        assert all(handles.count(handle) == 2 for handle in pool.handles), \
+            f"Six classes should spread two per tab, got {handles}"
+
+    def test_isolated_tab_closed_on_exit(self, session_browser, replay_server):
+        """Verify an isolated tab is current inside the block, then closed with the original tab restored"""
+        origin = session_browser.current_window_handle
+        with isolated_tab(session_browser, f"{replay_server}/") as handle:
+            current = session_browser.current_window_handle
+            url = session_browser.current_url
+
+        assert current == handle != origin, "Isolated tab should be current inside the block"
+        assert url.startswith(replay_server), f"Isolated tab should load the given URL, got {url}"
+        assert handle not in session_browser.window_handles, "Isolated tab should be closed on exit"
+        assert session_browser.current_window_handle == origin, "Original tab should be current again"
+
+
+class TestTabKeys:
+    """Tests for pinning test classes to pool tabs"""
+
+    # Same class name in two modules; one class also has an interactive test
+    CLASSES = """
+import pytest
+
+class TestBlade:
+    def test_read(self):
+        pass
+
+    @pytest.mark.interactive
+    def test_click(self):
+        pass
+
+class TestOther:
+    def test_read(self):
+        pass
+"""
+
+    def test_keys_unique_and_interactive_classes_unpinned(self, pytester):
+        """Verify same-named classes in different modules get separate keys and interactive classes none"""
+        pytester.makeconftest("from tests.conftest import *")
+        pytester.makepyfile(test_first=self.CLASSES, test_second=self.CLASSES.replace("@pytest.mark.interactive", ""))
+        items, _ = pytester.inline_genitems("-p", "no:cacheprovider")
+        keys = {item.nodeid: tab_key(item) for item in items}
+
+        assert keys["test_first.py::TestBlade::test_read"] is None, "Class with an interactive test should not be pinned"
+        assert keys["test_first.py::TestOther::test_read"] == "test_first.TestOther", \
+            f"Key should name the class with its module, got {keys['test_first.py::TestOther::test_read']}"
+        assert keys["test_second.py::TestBlade::test_read"] == "test_second.TestBlade", \
+            "Same-named class in another module should get its own key"
+
@@ -0,0 +1,104 @@
+import time
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.wait import WebDriverWait
+from utils.tracing import (
+    OtlpCollector, Tracer, critical_path, export_otlp, summarize_critical_path, write_trace_viewer
+)
+
+
+class FakePage:
+    """Page object stand-in for instrumentation tests"""
+
+    LOGO = (By.ID, "logo")
+
+    def find(self, locator):
+        return WebDriverWait(object(), 1).until(lambda driver: locator)
+
+    def fail(self):
+        raise ValueError("broken")
+
+
+def span(span_id, parent, start, end, name=None):
+    """Finished span dict with millisecond times"""
+    return {
+        "trace_id": "t", "span_id": span_id, "parent_span_id": parent, "name": name or span_id, "kind": "internal",
+        "start_ns": start * 1_000_000, "end_ns": end * 1_000_000, "attributes": {}, "status": 1,
+    }
+
+
+class TestTracing:
+    """Tests for session tracing: span nesting, instrumentation, OTLP export and critical path"""
+
+    @pytest.fixture
+    def tracer(self):
+        """Tracer with FakePage and WebDriverWait instrumented"""
+        tracer = Tracer().instrument([FakePage])
+        yield tracer
+        tracer.uninstrument()
+
+    def test_instrumented_calls_nest(self, tracer):
+        """Verify page object methods, waits and recorded commands become nested spans"""
+        with tracer.span("test"):
+            FakePage().find(FakePage.LOGO)
+            tracer.record_command("findElement", {"using": "css selector", "value": "#logo"}, time.perf_counter(), 0.01)
+        spans = {span["name"]: span for span in tracer.spans}
+
+        assert spans["FakePage.find"]["parent_span_id"] == spans["test"]["span_id"], "Method should nest under test"
+        assert spans["WebDriverWait.until"]["parent_span_id"] == spans["FakePage.find"]["span_id"], \
+            "Wait should nest under the method that waited"
+        assert spans["FakePage.find"]["attributes"]["locator"] == "id=logo", "Locator argument should be recorded"
+        assert spans["webdriver findElement"]["kind"] == "client", "Commands should be client spans"
+        assert spans["webdriver findElement"]["attributes"]["locator"] == "css selector=#logo", \
+            "Command locator should be recorded"
+
+    def test_exceptions_mark_span_as_error(self, tracer):
+        """Verify a raising method ends its span with error status"""
+        with pytest.raises(ValueError):
+            FakePage().fail()
+
+        assert tracer.spans[-1]["status"] == 2, "Span should have error status"
+        assert tracer.spans[-1]["attributes"]["exception.type"] == "ValueError", "Exception type should be recorded"
+
+    def test_uninstrument_restores_methods(self):
+        """Verify uninstrument() puts the original functions back"""
+        original, original_until = FakePage.find, WebDriverWait.until
+        Tracer().instrument([FakePage]).uninstrument()
+
+        assert FakePage.find is original, "Original method should be restored"
+        assert WebDriverWait.until is original_until, "WebDriverWait.until should be restored"
+
+    def test_critical_path_skips_overlapped_work(self):
+        """Verify the critical path follows the last-finishing chain and skips overlapped siblings"""
+        spans = [
+            span("root", None, 0, 100),
+            span("a", "root", 10, 40),
+            span("b", "root", 20, 30),  # overlapped by a
+            span("c", "root", 50, 90),
+            span("c1", "c", 55, 85),
+        ]
+        segments = critical_path(spans)
+        on_path = {segment["span_id"] for segment in segments}
+
+        assert on_path == {"root", "a", "c", "c1"}, f"Unexpected critical path {on_path}"
+        assert sum(segment["end_ns"] - segment["start_ns"] for segment in segments) == 100_000_000, \
+            "Segments should cover the root exactly once"
+        assert summarize_critical_path(segments)[0] == {"name": "root", "ms": 30.0, "segments": 3}, \
+            "Root's own time is the gaps between a and c"
+
+    def test_export_to_collector_and_viewer(self, tracer, tmp_path):
+        """Verify OTLP/JSON export round-trips through the collector stand-in and renders in the viewer"""
+        with tracer.span("session"):
+            with tracer.span("test"):
+                FakePage().find(FakePage.LOGO)
+        collector = OtlpCollector().start()
+        try:
+            status = export_otlp(tracer.spans, collector.endpoint)
+        finally:
+            collector.stop()
+        write_trace_viewer(collector.spans, tmp_path / "trace.html")
+
+        assert status == 200, f"Collector should accept the export, got {status}"
+        assert {span["span_id"] for span in collector.spans} == {span["span_id"] for span in tracer.spans}, \
+            "Collector should receive every span"
+        assert "FakePage.find" in (tmp_path / "trace.html").read_text(encoding="utf-8"), "Viewer should list spans"
@@ -0,0 +1,182 @@
+import json
+import statistics
+import time
+from html import escape
+
+
+# Navigation Timing plus per-resource cache status: deliveryType where the browser reports it,
+# otherwise transferSize 0 with a body = served from cache, transferSize below the body size =
+# revalidated (304), all sizes 0 = cross-origin without Timing-Allow-Origin
+LOAD_METRICS_SCRIPT = """
+const navigation = performance.getEntriesByType('navigation')[0];
+if (!navigation || !navigation.loadEventEnd) return null;
+
+function cacheStatus(entry) {
+    if (entry.deliveryType === 'cache') return 'cache';
+    if (!entry.transferSize && !entry.encodedBodySize && !entry.decodedBodySize) return 'opaque';
+    if (entry.transferSize === 0) return 'cache';
+    if (entry.encodedBodySize && entry.transferSize < entry.encodedBodySize) return 'revalidated';
+    return 'network';
+}
+
+const entries = [navigation, ...performance.getEntriesByType('resource')];
+return {
+    navigation: {
+        ttfb_ms: Math.round(navigation.responseStart),
+        dom_content_loaded_ms: Math.round(navigation.domContentLoadedEventEnd),
+        load_ms: Math.round(navigation.loadEventEnd),
+    },
+    resources: entries.map(entry => ({
+        url: entry.name,
+        initiator_type: entry.initiatorType,
+        status: cacheStatus(entry),
+        transfer_bytes: entry.transferSize,
+        encoded_bytes: entry.encodedBodySize,
+        duration_ms: Math.round(entry.duration),
+    })),
+};
+"""
+
+# Firefox chrome-context cache clear (needs -remote-allow-system-access on recent Firefox)
+FIREFOX_CLEAR_CACHE_SCRIPT = """
+Services.cache2.clear();
+try {
+    Cc['@mozilla.org/image/tools;1'].getService(Ci.imgITools).getImgCacheForDocument(null).clearCache(false);
+} catch (e) {}
+"""
+
+
+def clear_browser_cache(driver):
+    """Clear the browser HTTP cache (CDP on Chromium/Edge, chrome context on Firefox)
+
+    Returns:
+        True if the cache was cleared, False when the backend offers no way to do it
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        return True
+    if hasattr(driver, "context"):
+        try:
+            with driver.context(driver.CONTEXT_CHROME):
+                driver.execute_script(FIREFOX_CLEAR_CACHE_SCRIPT)
+            return True
+        except Exception:
+            return False
+    return False
+
+
+def collect_load_metrics(driver, timeout=30):
+    """Wait for the load event of the current document and collect its timing and cache status"""
+    deadline = time.perf_counter() + timeout
+    while True:
+        metrics = driver.execute_script(LOAD_METRICS_SCRIPT)
+        if metrics or time.perf_counter() >= deadline:
+            return metrics
+        time.sleep(0.1)
+
+
+def summarize_load(kind, metrics, cache_cleared=None):
+    """Reduce one load's metrics to transfer and cache totals"""
+    resources = metrics["resources"] if metrics else []
+    by_status = {}
+    for resource in resources:
+        entry = by_status.setdefault(resource["status"], {"requests": 0, "encoded_bytes": 0})
+        entry["requests"] += 1
+        entry["encoded_bytes"] += resource["encoded_bytes"]
+
+    return {
+        "kind": kind,
+        "cache_cleared": cache_cleared,
+        "navigation": metrics["navigation"] if metrics else None,
+        "requests": len(resources),
+        "transfer_bytes": sum(resource["transfer_bytes"] for resource in resources),
+        "encoded_bytes": sum(resource["encoded_bytes"] for resource in resources),
+        "by_status": by_status,
+        "resources": resources,
+    }
+
+
+def compare_cache_loads(driver, url, warm_reloads=3):
+    """Load url cold, then warm_reloads repeat visits with the cache kept, then again after a cache clear
+
+    Returns:
+        dict with "loads" (per-load summaries in order) and "summary" (cold vs warm savings)
+    """
+    loads = []
+
+    cleared = clear_browser_cache(driver)
+    driver.get(url)
+    loads.append(summarize_load("cold", collect_load_metrics(driver), cleared))
+
+    for _ in range(warm_reloads):
+        driver.get(url)
+        loads.append(summarize_load("warm", collect_load_metrics(driver)))
+
+    cleared = clear_browser_cache(driver)
+    driver.get(url)
+    loads.append(summarize_load("revisit_after_clear", collect_load_metrics(driver), cleared))
+
+    return {"url": url, "loads": loads, "summary": summarize_cache_comparison(loads)}
+
+
+def summarize_cache_comparison(loads):
+    """Compute cacheable share and repeat-visit savings from cold and warm loads (None if the cache was not cleared)"""
+    cold = next(load for load in loads if load["kind"] == "cold")
+    warm = [load for load in loads if load["kind"] == "warm" and load["navigation"]]
+    if not cold["cache_cleared"] or not cold["navigation"] or not warm:
+        return None
+
+    def median(values):
+        return round(statistics.median(values), 1)
+
+    cached_bytes = [load["by_status"].get("cache", {}).get("encoded_bytes", 0) for load in warm]
+    cold_load_ms = cold["navigation"]["load_ms"]
+    warm_load_ms = median([load["navigation"]["load_ms"] for load in warm])
+    return {
+        "cold_transfer_bytes": cold["transfer_bytes"],
+        "warm_transfer_bytes": median([load["transfer_bytes"] for load in warm]),
+        "cacheable_share": round(median(cached_bytes) / cold["encoded_bytes"], 3) if cold["encoded_bytes"] else None,
+        "cold_load_ms": cold_load_ms,
+        "warm_load_ms": warm_load_ms,
+        "load_ms_saved": round(cold_load_ms - warm_load_ms, 1),
+        "cold_ttfb_ms": cold["navigation"]["ttfb_ms"],
+        "warm_ttfb_ms": median([load["navigation"]["ttfb_ms"] for load in warm]),
+    }
+
+
+def write_cache_report(report, json_path, html_path):
+    """Write cache comparison as JSON and an HTML table"""
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    rows = []
+    for load in report["loads"]:
+        navigation = load["navigation"] or {}
+        statuses = ", ".join(
+            f"{status}: {entry['requests']}" for status, entry in sorted(load["by_status"].items())
+        )
+        rows.append(
+            "<tr>"
+            f"<td>{escape(load['kind'])}</td>"
+            f"<td>{navigation.get('ttfb_ms', '-')}</td>"
+            f"<td>{navigation.get('load_ms', '-')}</td>"
+            f"<td>{load['transfer_bytes'] / 1024:.1f}</td>"
+            f"<td>{load['requests']}</td>"
+            f"<td>{escape(statuses)}</td>"
+            "</tr>"
+        )
+
+    summary = report["summary"] or {}
+    html = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Cold vs warm cache</title>"
+        "<style>table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}</style>"
+        f"</head><body><h1>Cold vs warm cache: {escape(report['url'])}</h1>"
+        f"<p>Cacheable share of cold bytes: {summary.get('cacheable_share', '-')}; "
+        f"load time saved on warm visits: {summary.get('load_ms_saved', '-')} ms</p><table>"
+        "<tr><th>Load</th><th>TTFB (ms)</th><th>Load (ms)</th><th>Transfer (KiB)</th>"
+        "<th>Requests</th><th>Cache status</th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(html)
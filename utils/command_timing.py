@@ -0,0 +1,121 @@
+import json
+import os
+import statistics
+import time
+from collections import defaultdict
+from html import escape
+
+
+class CommandRecorder:
+    """Records duration of every WebDriver command sent by a driver (by wrapping driver.execute)"""
+
+    def __init__(self):
+        self.durations = defaultdict(list)
+        self.listeners = []
+        self._driver = None
+        self._original_execute = None
+
+    def install(self, driver):
+        """Start recording commands sent by driver"""
+        self._driver = driver
+        self._original_execute = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return self._original_execute(driver_command, params)
+            finally:
+                elapsed = time.perf_counter() - started
+                self.durations[driver_command].append(elapsed)
+                for listener in self.listeners:
+                    listener(driver_command, params, started, elapsed)
+
+        driver.execute = timed_execute
+        return self
+
+    def uninstall(self):
+        """Stop recording and restore original driver.execute"""
+        if self._driver is not None:
+            self._driver.execute = self._original_execute
+            self._driver = None
+
+    def add_listener(self, listener):
+        """Call listener(command, params, started, elapsed) after every command"""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Stop calling listener"""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    @property
+    def command_count(self):
+        """Total number of commands recorded"""
+        return sum(len(durations) for durations in self.durations.values())
+
+    @property
+    def total_time(self):
+        """Total time spent waiting on commands (seconds)"""
+        return sum(sum(durations) for durations in self.durations.values())
+
+    def summary(self):
+        """Get per-command count, mean, p50 and p95 latency (milliseconds)"""
+        summary = {}
+        for command, durations in sorted(self.durations.items()):
+            ordered = sorted(durations)
+            summary[command] = {
+                "count": len(ordered),
+                "mean_ms": round(statistics.mean(ordered) * 1000, 2),
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+            }
+        return summary
+
+
+def record_backend_run(path, backend, recorder, suite_seconds):
+    """Merge one run's command latency into the backend comparison file (each backend keeps its latest run)"""
+    runs = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            runs = json.load(f)
+
+    runs[backend] = {
+        "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "suite_seconds": round(suite_seconds, 2),
+        "command_count": recorder.command_count,
+        "command_seconds": round(recorder.total_time, 2),
+        "mean_command_ms": round(recorder.total_time / recorder.command_count * 1000, 2) if recorder.command_count else None,
+        "commands": recorder.summary(),
+    }
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(runs, f, indent=2)
+    return runs
+
+
+def render_backend_comparison(runs, path):
+    """Render backend comparison as an HTML table, fastest suite first"""
+    rows = []
+    for backend, run in sorted(runs.items(), key=lambda item: item[1]["suite_seconds"]):
+        rows.append(
+            "<tr>"
+            f"<td>{escape(backend)}</td>"
+            f"<td>{run['suite_seconds']}</td>"
+            f"<td>{run['command_count']}</td>"
+            f"<td>{run['command_seconds']}</td>"
+            f"<td>{run['mean_command_ms']}</td>"
+            f"<td>{escape(run['recorded_at'])}</td>"
+            "</tr>"
+        )
+
+    html = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Browser backend comparison</title>"
+        "<style>table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}</style>"
+        "</head><body><h1>Browser backend comparison</h1><table>"
+        "<tr><th>Backend</th><th>Suite (s)</th><th>Commands</th><th>Command time (s)</th>"
+        "<th>Mean command (ms)</th><th>Recorded</th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
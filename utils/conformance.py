@@ -0,0 +1,66 @@
+def blade_capabilities(page_class, name):
+    """Capabilities of a registered blade: its component class's CAPABILITIES with the page's overrides"""
+    _, blade_class = page_class.BLADES[name]
+    return {**blade_class.CAPABILITIES, **page_class.CAPABILITY_OVERRIDES.get(name, {})}
+
+
+def conformance_checks(capabilities):
+    """Names of the checks that apply to a blade with these capabilities, in report order"""
+    checks = ["visible"]
+    backdrop = capabilities.get("backdrop")
+    if backdrop:
+        checks += ["backdrop", "backdrop_background"]
+        if backdrop[2]:
+            checks.append(f"backdrop_{backdrop[2]}")
+    checks += [f"header_{field}" for field in capabilities.get("header", {})]
+    for slot in capabilities.get("ctas", {}):
+        checks += [f"cta_{slot}_visible", f"cta_{slot}_text", f"cta_{slot}_href", f"cta_{slot}_target"]
+    checks += [f"carousel_{part}" for part in capabilities.get("carousel", {})]
+    return checks
+
+
+def check_conformance(check, snapshot, capabilities):
+    """Evaluate one check against a blade's conformance snapshot (see BaseBlade.get_conformance_snapshot)
+
+    Returns:
+        Failure message, None when the check passes
+    """
+    if check == "visible":
+        return None if snapshot["visible"] else "Blade should be visible"
+
+    if check.startswith("backdrop"):
+        backdrop = snapshot["backdrop"]
+        if check == "backdrop":
+            return None if backdrop["present"] else "Blade should have backdrop"
+        if check == "backdrop_background":
+            return None if backdrop["background"] else "Backdrop should have background layer"
+        media = check[len("backdrop_"):]
+        return None if backdrop[media] else f"Backdrop background should contain {media}"
+
+    if check.startswith("header_"):
+        field = check[len("header_"):]
+        return None if snapshot["header"].get(field) else f"Blade {field} should have text"
+
+    if check.startswith("cta_"):
+        slot, aspect = check[len("cta_"):].rsplit("_", 1)
+        cta = snapshot["ctas"].get(slot)
+        if cta is None:
+            return f"Blade {slot} CTA not found"
+        if aspect == "visible":
+            return None if cta["visible"] else f"Blade {slot} CTA should be visible"
+        if aspect == "text":
+            return None if cta["text"] else f"Blade {slot} CTA should have text"
+        if aspect == "href":
+            href = cta["href"]
+            return None if href and href.startswith("http") else f"Blade {slot} CTA should link to an http/https URL, got '{href}'"
+        expected = capabilities["ctas"][slot][1]
+        if expected:
+            return None if cta["target"] == expected else \
+                f"Blade {slot} CTA target should be '{expected}', got '{cta['target']}'"
+        return None if not cta["target"] else f"Blade {slot} CTA should open in the same tab, got target '{cta['target']}'"
+
+    if check.startswith("carousel_"):
+        part = check[len("carousel_"):]
+        return None if snapshot["carousel"].get(part) else f"Carousel should have {part.replace('_', ' ')}"
+
+    raise ValueError(f"Unknown conformance check '{check}'")
@@ -0,0 +1,203 @@
+import json
+import time
+from urllib.parse import urldefrag, urljoin, urlsplit, urlunsplit
+
+from components.base_blade import BaseBlade
+from pages.home_page import HomePage
+from utils.locator_index import collect_declared_locators
+from utils.locators import to_css
+from utils.tab_pool import TabPool
+
+
+# Finds known blades (by registered root id, otherwise by component signature), counts their
+# critical selectors, and collects CTA/carousel links and navigation timing in one round trip
+PAGE_SCAN_SCRIPT = """
+const [knownRoots, signatures, linkSelectors, candidateSelector] = arguments;
+const blades = [];
+const claimed = new Set();
+
+function criticalCounts(root, selectors) {
+    return selectors.map(selector => root.querySelectorAll(selector).length);
+}
+
+for (const [name, blade] of Object.entries(knownRoots)) {
+    const root = document.querySelector(blade.root);
+    if (!root) continue;
+    claimed.add(root);
+    blades.push({name, component: blade.component, element: root, id: root.id,
+                 counts: criticalCounts(root, signatures[blade.component])});
+}
+
+for (const root of document.querySelectorAll(candidateSelector)) {
+    if (claimed.has(root)) continue;
+    for (const [component, selectors] of Object.entries(signatures)) {
+        const counts = criticalCounts(root, selectors);
+        if (selectors.length && counts.every(count => count > 0)) {
+            claimed.add(root);
+            blades.push({name: root.id || component, component, element: root, id: root.id, counts});
+            break;
+        }
+    }
+}
+
+const links = new Set();
+for (const blade of blades) {
+    for (const selector of linkSelectors) {
+        for (const element of blade.element.querySelectorAll(selector)) {
+            const anchor = element.closest('a') || element.querySelector('a');
+            if (anchor && anchor.href) links.add(anchor.href);
+        }
+    }
+}
+
+const navigation = performance.getEntriesByType('navigation')[0];
+return {
+    url: location.href,
+    title: document.title,
+    blades,
+    links: [...links],
+    timing: navigation ? {
+        dom_content_loaded_ms: Math.round(navigation.domContentLoadedEventEnd),
+        load_ms: Math.round(navigation.loadEventEnd),
+        transfer_bytes: navigation.transferSize,
+    } : null,
+};
+"""
+
+# Sections that may be blades on pages whose blade ids are not registered
+BLADE_CANDIDATES = "section[id], [data-testid$='blade']"
+
+
+def normalize_url(url):
+    """Normalize url for visited-set deduplication (no fragment, lowercase host, no empty path)"""
+    url, _ = urldefrag(url)
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+
+def blade_signatures(blades):
+    """Map component class name -> critical CSS selectors, most specific signature first"""
+    classes = {blade_class for _, blade_class in blades.values()}
+    ordered = sorted(classes, key=lambda blade_class: (-len(blade_class.CRITICAL_LOCATORS), blade_class.__name__))
+    return {
+        blade_class.__name__: [to_css(locator) for locator in blade_class.CRITICAL_LOCATORS]
+        for blade_class in ordered
+    }
+
+
+def link_selectors(blades):
+    """CSS selectors for CTA and carousel slide links declared by the blade classes"""
+    selectors = {to_css(BaseBlade.SLIDES)}
+    for _, blade_class in blades.values():
+        for name, (locator, _) in collect_declared_locators(blade_class).items():
+            if "CTA" in name:
+                selectors.add(to_css(locator))
+    return sorted(selectors)
+
+
+class SiteCrawler:
+    """Breadth-first crawler that follows in-domain CTA and carousel links from a start page"""
+
+    def __init__(self, driver, start_url=HomePage.URL, max_depth=1, tabs=4, max_pages=50, blades=None):
+        """
+        Args:
+            driver: WebDriver instance
+            start_url: First page to visit
+            max_depth: How many link hops to follow from start_url
+            tabs: Number of tabs loading pages concurrently
+            max_pages: Upper bound on pages visited
+            blades: Blade registry (name -> (root locator, class)), defaults to HomePage.BLADES
+        """
+        self.driver = driver
+        self.start_url = start_url
+        self.max_depth = max_depth
+        self.tabs = tabs
+        self.max_pages = max_pages
+        self.blades = blades or HomePage.BLADES
+        self.domain = urlsplit(start_url).netloc.lower()
+        self.components = {blade_class.__name__: blade_class for _, blade_class in self.blades.values()}
+
+    def is_in_domain(self, url):
+        """Check if url is on the crawled host"""
+        parts = urlsplit(url)
+        return parts.scheme in ("http", "https") and parts.netloc.lower() == self.domain
+
+    def crawl(self):
+        """Crawl from start_url
+
+        Returns:
+            list of page records in visit order
+        """
+        known_roots = {
+            name: {"root": to_css(locator), "component": blade_class.__name__}
+            for name, (locator, blade_class) in self.blades.items()
+        }
+        signatures = blade_signatures(self.blades)
+        selectors = link_selectors(self.blades)
+
+        visited = set()
+        pages = []
+        frontier = [normalize_url(self.start_url)]
+        visited.add(frontier[0])
+
+        with TabPool(self.driver, self.tabs) as pool:
+            for depth in range(self.max_depth + 1):
+                next_frontier = []
+                for start in range(0, len(frontier), self.tabs):
+                    batch = frontier[start:start + self.tabs]
+                    for handle, url, ready_seconds in pool.load_all(batch):
+                        pool.switch_to(handle)
+                        page = self.scan_page(url, depth, ready_seconds, known_roots, signatures, selectors)
+                        pages.append(page)
+
+                        for link in page["links"]:
+                            link = normalize_url(urljoin(url, link))
+                            if (self.is_in_domain(link) and link not in visited
+                                    and len(visited) < self.max_pages):
+                                visited.add(link)
+                                next_frontier.append(link)
+                frontier = next_frontier
+                if not frontier:
+                    break
+
+        return pages
+
+    def scan_page(self, url, depth, ready_seconds, known_roots, signatures, selectors):
+        """Scan the current tab for blades and links, then run blade structural checks"""
+        started = time.perf_counter()
+        if ready_seconds is None:
+            return {"url": url, "depth": depth, "error": "Page did not finish loading", "blades": [], "links": []}
+
+        scan = self.driver.execute_script(PAGE_SCAN_SCRIPT, known_roots, signatures, selectors, BLADE_CANDIDATES)
+
+        blades = []
+        for found in scan["blades"]:
+            blade = self.components[found["component"]](self.driver, found["element"])
+            missing = [
+                selector for selector, count in zip(signatures[found["component"]], found["counts"]) if not count
+            ]
+            blades.append({
+                "name": found["name"],
+                "component": found["component"],
+                "id": found["id"],
+                "visible": blade.is_visible(),
+                "missing_critical": missing,
+            })
+
+        return {
+            "url": url,
+            "final_url": scan["url"],
+            "title": scan["title"],
+            "depth": depth,
+            "load_seconds": round(ready_seconds, 3),
+            "scan_seconds": round(time.perf_counter() - started, 3),
+            "timing": scan["timing"],
+            "blades": blades,
+            "links": scan["links"],
+        }
+
+
+def write_crawl_report(pages, path):
+    """Write crawl results as JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(pages, f, indent=2)
@@ -0,0 +1,166 @@
+import json
+
+from selenium.webdriver.common.bidi.common import command_builder
+from selenium.webdriver.common.bidi.network import NetworkEvent
+
+
+# Runs a function declaration through classic execute_async_script
+CLASSIC_EVALUATE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const [functionDeclaration, args] = arguments;
+Promise.resolve((0, eval)('(' + functionDeclaration + ')')(...args))
+    .then(value => done({ok: true, value}), error => done({ok: false, error: String(error)}));
+"""
+
+
+class DevToolsChannel:
+    """Optional low-latency channel (BiDi or CDP) next to classic WebDriver, falling back to classic"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.network_events = []
+        self.network_listeners = []
+        self._network_subscribed = False
+
+        if driver.caps.get("webSocketUrl"):
+            self.kind = "bidi"
+        elif hasattr(driver, "execute_cdp_cmd"):
+            self.kind = "cdp"
+        else:
+            self.kind = "classic"
+
+    # Batched evaluation
+
+    def evaluate(self, function_declaration, *args):
+        """Call a JS function declaration (may be async) with JSON-serializable args, return its value"""
+        if self.kind == "bidi":
+            result = self.driver.script.execute(function_declaration, *args)
+            return from_remote_value(result)
+
+        if self.kind == "cdp":
+            expression = f"({function_declaration})(...{json.dumps(list(args))})"
+            result = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": expression,
+                "awaitPromise": True,
+                "returnByValue": True,
+            })
+            if "exceptionDetails" in result:
+                raise RuntimeError(f"Script failed: {result['exceptionDetails'].get('text')}")
+            return result["result"].get("value")
+
+        result = self.driver.execute_async_script(CLASSIC_EVALUATE_SCRIPT, function_declaration, list(args))
+        if not result["ok"]:
+            raise RuntimeError(f"Script failed: {result['error']}")
+        return result["value"]
+
+    # Preload scripts
+
+    def add_preload_script(self, function_declaration):
+        """Run a JS function declaration in every new document before the page's own scripts
+
+        Returns:
+            id for remove_preload_script(), or None when the backend cannot preload (classic)
+        """
+        if self.kind == "bidi":
+            return self.driver.script.pin(function_declaration)
+        if self.kind == "cdp":
+            result = self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": f"({function_declaration})();"}
+            )
+            return result["identifier"]
+        return None
+
+    def remove_preload_script(self, script_id):
+        """Stop running a script added with add_preload_script()"""
+        if self.kind == "bidi":
+            self.driver.script.unpin(script_id)
+        elif self.kind == "cdp":
+            self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_id})
+
+    # Network events
+
+    def start_network_capture(self, listener=None):
+        """Collect finished requests (responses and fetch errors) into network_events (BiDi only)
+
+        Args:
+            listener: Also called with each event as it is collected
+        Returns:
+            True if capture started, False when the backend has no event channel
+        """
+        if self.kind != "bidi":
+            return False
+        if listener:
+            self.network_listeners.append(listener)
+        if self._network_subscribed:
+            return True
+
+        connection = self.driver.network.conn
+        # beforeRequestSent timestamp (epoch ms) per request id and redirect hop
+        request_started = {}
+
+        def on_request(event):
+            key = (event.params.get("request", {}).get("request"), event.params.get("redirectCount", 0))
+            request_started[key] = event.params.get("timestamp")
+
+        def on_finished(event):
+            request = event.params.get("request", {})
+            response = event.params.get("response") or {}
+            key = (request.get("request"), event.params.get("redirectCount", 0))
+            record = {
+                "url": request.get("url"),
+                "method": request.get("method"),
+                "status": response.get("status"),
+                "mime_type": response.get("mimeType"),
+                "from_cache": response.get("fromCache"),
+                "bytes_received": response.get("bytesReceived"),
+                "timings": request.get("timings"),
+                "context": event.params.get("context"),
+                "started": request_started.pop(key, event.params.get("timestamp")),
+                "finished": event.params.get("timestamp"),
+                "request_headers": request.get("headers", []),
+                "request_headers_size": request.get("headersSize"),
+                "request_body_size": request.get("bodySize"),
+                "status_text": response.get("statusText", ""),
+                "protocol": response.get("protocol", ""),
+                "response_headers": response.get("headers", []),
+                "response_headers_size": response.get("headersSize"),
+                "response_body_size": response.get("bodySize"),
+                "content_size": (response.get("content") or {}).get("size"),
+                "error": event.params.get("errorText"),
+            }
+            self.network_events.append(record)
+            for callback in self.network_listeners:
+                callback(record)
+
+        connection.add_callback(NetworkEvent("network.beforeRequestSent"), on_request)
+        connection.add_callback(NetworkEvent("network.responseCompleted"), on_finished)
+        connection.add_callback(NetworkEvent("network.fetchError"), on_finished)
+        connection.execute(command_builder("session.subscribe", {
+            "events": ["network.beforeRequestSent", "network.responseCompleted", "network.fetchError"]
+        }))
+        self._network_subscribed = True
+        return True
+
+def from_remote_value(value):
+    """Convert a WebDriver BiDi RemoteValue to a plain Python value"""
+    if not isinstance(value, dict) or "type" not in value:
+        return value
+
+    value_type = value["type"]
+    if value_type in ("undefined", "null"):
+        return None
+    if value_type in ("string", "boolean"):
+        return value["value"]
+    if value_type == "number":
+        number = value["value"]
+        if isinstance(number, str):
+            return {"NaN": float("nan"), "Infinity": float("inf"), "-Infinity": float("-inf"), "-0": -0.0}[number]
+        return number
+    if value_type in ("array", "set"):
+        return [from_remote_value(item) for item in value.get("value", [])]
+    if value_type in ("object", "map"):
+        return {
+            key if isinstance(key, str) else from_remote_value(key): from_remote_value(item)
+            for key, item in value.get("value", [])
+        }
+    return value.get("value")
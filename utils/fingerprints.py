@@ -0,0 +1,118 @@
+import json
+import os
+from datetime import datetime
+
+
+def load_fingerprints(path):
+    """Get blade fingerprints of the last green run (empty when there is none)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("blades", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def unchanged_blades(current, previous):
+    """Names of blades whose fingerprint matches the last green run"""
+    return {
+        name for name, fingerprint in current.items()
+        if fingerprint is not None and previous.get(name) == fingerprint
+    }
+
+
+def merge_green_fingerprints(current, previous, green_blades, failed_blades):
+    """Fingerprints to store after a run: green blades updated, failed blades dropped, the rest kept"""
+    merged = {name: fingerprint for name, fingerprint in previous.items() if name not in failed_blades}
+    for name in green_blades - failed_blades:
+        if current.get(name) is not None:
+            merged[name] = current[name]
+    return merged
+
+
+def save_fingerprints(path, fingerprints):
+    """Write blade fingerprints with the time they were recorded"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"recorded": datetime.now().isoformat(timespec="seconds"), "blades": fingerprints}, f, indent=2)
+
+
+class IncrementalRun:
+    """Carries over blades whose fingerprint matches the last green run (see HomePage.fingerprint_blades)"""
+
+    def __init__(self, path, blade_of):
+        """
+        Args:
+            path: Fingerprint file of the last green run
+            blade_of: Returns the blade name a test item covers, None for page-level tests
+        """
+        self.path = path
+        self.blade_of = blade_of
+        self.previous = load_fingerprints(path)
+        self.current = {}
+        self.unchanged = set()
+        self.carried_over = set()
+        self.blades = {}
+        self.selected = {}
+        self.deselected = set()
+        self.passed = set()
+        self.failed = set()
+
+    def fingerprint(self, home_page):
+        """Fingerprint the loaded homepage's blades and find the unchanged ones"""
+        self.current = home_page.fingerprint_blades()
+        self.unchanged = unchanged_blades(self.current, self.previous)
+
+    def carry_over(self, blade_name):
+        """Check if blade_name is unchanged since the last green run, recording it as carried over"""
+        if blade_name not in self.unchanged:
+            return False
+        self.carried_over.add(blade_name)
+        return True
+
+    def green_blades(self):
+        """Carried-over blades plus blades whose every selected test passed, with none deselected"""
+        complete = {
+            blade for blade, nodeids in self.selected.items()
+            if blade not in self.deselected and nodeids <= self.passed
+        }
+        return complete | self.carried_over
+
+    def pytest_deselected(self, items):
+        for item in items:
+            blade = self.blade_of(item)
+            if blade:
+                self.deselected.add(blade)
+
+    def pytest_collection_finish(self, session):
+        for item in session.items:
+            blade = self.blade_of(item)
+            self.blades[item.nodeid] = blade
+            if blade:
+                self.selected.setdefault(blade, set()).add(item.nodeid)
+
+    def pytest_runtest_logreport(self, report):
+        blade = self.blades.get(report.nodeid)
+        if not blade:
+            return
+        if report.failed:
+            self.failed.add(blade)
+        elif report.when == "call" and report.passed:
+            self.passed.add(report.nodeid)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.carried_over:
+            terminalreporter.write_line(
+                f"Carried over (unchanged since last green run): {', '.join(sorted(self.carried_over))}"
+            )
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if not self.current:
+            return
+        try:
+            save_fingerprints(
+                self.path, merge_green_fingerprints(self.current, self.previous, self.green_blades(), self.failed)
+            )
+        except Exception as e:
+            print(f"\n❌ Fingerprint save error: {e}")
@@ -0,0 +1,153 @@
+import json
+import os
+import pytest
+from datetime import datetime
+
+
+# Outcomes kept per test; flake rates are computed over this window
+HISTORY_WINDOW = 20
+
+
+class FlakeHistory:
+    """Per-test outcome history across runs, used to compute flake rates and quarantine tests"""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: JSON file the history is loaded from and saved to
+        """
+        self.path = path
+        self.tests = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.tests = json.load(f).get("tests", {})
+        except (OSError, ValueError):
+            pass
+
+    def record(self, nodeid, outcome):
+        """Append an outcome to the test's history"""
+        entry = self.tests.setdefault(nodeid, {"outcomes": []})
+        entry["outcomes"] = (entry["outcomes"] + [outcome])[-HISTORY_WINDOW:]
+        entry["last_run"] = datetime.now().isoformat(timespec="seconds")
+
+    def flake_rate(self, nodeid):
+        """Share of the test's recorded runs that were flaky, None without history"""
+        outcomes = self.tests.get(nodeid, {}).get("outcomes", [])
+        return outcomes.count("flaky") / len(outcomes) if outcomes else None
+
+    def quarantined(self, threshold, min_runs=5):
+        """Tests whose flake rate over at least min_runs runs reaches threshold
+
+        Returns:
+            dict of nodeid -> flake rate
+        """
+        return {
+            nodeid: self.flake_rate(nodeid)
+            for nodeid, entry in self.tests.items()
+            if len(entry["outcomes"]) >= min_runs and self.flake_rate(nodeid) >= threshold
+        }
+
+    def save(self):
+        """Write the history with each test's current flake rate"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        for nodeid, entry in self.tests.items():
+            entry["flake_rate"] = round(self.flake_rate(nodeid), 3)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"window": HISTORY_WINDOW, "tests": dict(sorted(self.tests.items()))}, f, indent=2)
+
+
+class FlakeEngine:
+    """Reruns failed blade tests in-session, tracks flake rates and quarantines flaky tests"""
+
+    def __init__(self, config, blade_fixtures, restore_checkpoint):
+        """
+        Args:
+            config: pytest config with the --blade-reruns/--flake-history options
+            blade_fixtures: Blade fixture name -> HomePage.BLADES name
+            restore_checkpoint: Restores an item's page checkpoint before its rerun
+        """
+        self.blade_fixtures = blade_fixtures
+        self.restore_checkpoint = restore_checkpoint
+        self.reruns = config.getoption("--blade-reruns")
+        self.scroll = config.getoption("--rerun-scroll")
+        self.history = FlakeHistory(config.getoption("--flake-history"))
+        threshold = config.getoption("--quarantine-threshold")
+        self.quarantine = self.history.quarantined(threshold) if threshold > 0 else {}
+        self.attempts = {}
+        self.flaky = []
+
+    def pytest_collection_modifyitems(self, items):
+        for item in items:
+            rate = self.quarantine.get(item.nodeid)
+            if rate is not None:
+                item.add_marker(pytest.mark.xfail(reason=f"Quarantined: flake rate {rate:.0%}", strict=False))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        fixture = next((name for name in self.blade_fixtures if name in item.funcargs), None)
+        if fixture:
+            run_once = item.runtest
+            item.runtest = lambda: self.run_with_reruns(item, run_once, fixture)
+        yield
+        if fixture:
+            del item.runtest
+
+    def run_with_reruns(self, item, run_once, fixture):
+        """Run the test, refreshing its blade and retrying on failure"""
+        from pages.home_page import HomePage
+        blade = item.funcargs[fixture]
+        for attempt in range(self.reruns + 1):
+            self.attempts[item.nodeid] = attempt + 1
+            try:
+                return run_once()
+            except (Exception, pytest.fail.Exception) as e:
+                if attempt == self.reruns:
+                    raise
+                print(f"\n🔁 Rerunning {item.name} ({attempt + 1}/{self.reruns}) after {type(e).__name__}")
+            try:
+                # Interactive tests start their rerun from the page state they were checkpointed at
+                self.restore_checkpoint(item)
+            except Exception as e:
+                print(f"\n❌ Checkpoint restore error: {e}")
+            try:
+                page = HomePage(blade.driver)
+                page.try_dismiss_overlays()
+                page.refresh_blade(blade, self.blade_fixtures[fixture], scroll=self.scroll)
+            except Exception as e:
+                print(f"\n❌ Blade refresh error: {e}")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when == "call" and self.attempts.get(item.nodeid, 1) > 1:
+            report.user_properties.append(("reruns", self.attempts[item.nodeid] - 1))
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "call":
+            return
+        attempts = self.attempts.pop(report.nodeid, 1)
+        if report.passed:
+            self.history.record(report.nodeid, "flaky" if attempts > 1 else "passed")
+            if attempts > 1:
+                self.flaky.append(f"{report.nodeid} (passed after {attempts - 1} rerun(s))")
+        elif report.failed or hasattr(report, "wasxfail"):
+            self.history.record(report.nodeid, "failed")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.flaky:
+            terminalreporter.section("flaky tests")
+            for line in self.flaky:
+                terminalreporter.write_line(line)
+        if self.quarantine:
+            terminalreporter.section("quarantined tests")
+            for nodeid, rate in sorted(self.quarantine.items()):
+                terminalreporter.write_line(f"{nodeid}: flake rate {rate:.0%}")
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        try:
+            self.history.save()
+        except Exception as e:
+            print(f"\n❌ Flake history save error: {e}")
@@ -0,0 +1,511 @@
+import http.client
+import json
+import select
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+
+# Headers that apply to one connection and are not forwarded
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "proxy-connection",
+    "te", "trailer", "transfer-encoding", "upgrade",
+}
+
+# Network conditions applied by the proxy: added latency per round trip and link bandwidth (kbit/s, None = unlimited)
+UNTHROTTLED = {"latency_ms": 0, "download_kbps": None, "upload_kbps": None}
+
+# Named throttling profiles (latency is per request round trip); values follow the
+# DevTools/Lighthouse presets, high-latency approximates a satellite link
+NETWORK_PROFILES = {
+    "fast-3G": {"latency_ms": 563, "download_kbps": 1475, "upload_kbps": 675},
+    "slow-4G": {"latency_ms": 150, "download_kbps": 1638, "upload_kbps": 675},
+    "high-latency": {"latency_ms": 600, "download_kbps": 10000, "upload_kbps": 2000},
+}
+
+CHUNK_SIZE = 16 * 1024
+
+
+def iso_now(timestamp=None):
+    """Time (epoch seconds, default now) as an ISO 8601 string for HAR timestamps"""
+    moment = datetime.now(timezone.utc) if timestamp is None else datetime.fromtimestamp(timestamp, timezone.utc)
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def har_headers(headers):
+    """Convert (name, value) pairs to HAR header objects"""
+    return [{"name": name, "value": value} for name, value in headers]
+
+
+def cache_status(status, headers):
+    """Classify a response as CDN/proxy cache hit, miss or revalidated from its headers"""
+    if status == 304:
+        return "revalidated"
+    values = {name.lower(): value for name, value in headers}
+    for name in ("x-cache", "cf-cache-status", "x-cache-status", "x-proxy-cache"):
+        value = values.get(name, "").upper()
+        if "HIT" in value:
+            return "hit"
+        if "MISS" in value or "EXPIRED" in value:
+            return "miss"
+    if values.get("age", "0").strip() not in ("", "0"):
+        return "hit"
+    return "unknown"
+
+
+def timing_phase(timings, start, end):
+    """Milliseconds between two BiDi fetch timing marks, -1 when either was not reached"""
+    if not timings.get(start) or not timings.get(end) or timings[end] < timings[start]:
+        return -1
+    return round(timings[end] - timings[start], 1)
+
+
+def browser_har_entry(event):
+    """HAR entry for one request captured from browser network events (DevToolsChannel)"""
+    timings = event.get("timings") or {}
+    request_headers = [(header["name"], header["value"].get("value", "")) for header in event["request_headers"]]
+    response_headers = [(header["name"], header["value"].get("value", "")) for header in event["response_headers"]]
+    values = {name.lower(): value for name, value in response_headers}
+    url = urlsplit(event["url"] or "")
+    status = event["status"] or 0
+    # Queued from fetch start until the first network phase the request reached
+    connection_start = next(
+        (timings[mark] for mark in ("dnsStart", "connectStart", "requestStart") if timings.get(mark)), 0
+    )
+    blocked = -1
+    if connection_start and timings.get("fetchStart"):
+        blocked = round(connection_start - timings["fetchStart"], 1)
+
+    har_timings = {
+        "blocked": blocked,
+        "dns": timing_phase(timings, "dnsStart", "dnsEnd"),
+        "connect": timing_phase(timings, "connectStart", "connectEnd"),
+        "ssl": timing_phase(timings, "tlsStart", "connectEnd"),
+        "send": 0,
+        "wait": max(0, timing_phase(timings, "requestStart", "responseStart")),
+        "receive": max(0, timing_phase(timings, "responseStart", "responseEnd")),
+    }
+    if event.get("started") and event.get("finished"):
+        total_ms = round(event["finished"] - event["started"], 1)
+    else:
+        total_ms = sum(value for name, value in har_timings.items() if value > 0 and name != "ssl")
+
+    entry = {
+        "startedDateTime": iso_now(event["started"] / 1000 if event.get("started") else None),
+        "time": total_ms,
+        "request": {
+            "method": event["method"],
+            "url": event["url"],
+            "httpVersion": event.get("protocol") or "",
+            "headers": har_headers(request_headers),
+            "queryString": [{"name": name, "value": value} for name, value in parse_qsl(url.query)],
+            "cookies": [],
+            "headersSize": event.get("request_headers_size") or -1,
+            "bodySize": event.get("request_body_size") or 0,
+        },
+        "response": {
+            "status": status,
+            "statusText": event.get("status_text") or "",
+            "httpVersion": event.get("protocol") or "",
+            "headers": har_headers(response_headers),
+            "cookies": [],
+            "content": {
+                "size": event.get("content_size") or 0,
+                "mimeType": event.get("mime_type") or values.get("content-type", ""),
+            },
+            "redirectURL": values.get("location", ""),
+            "headersSize": event.get("response_headers_size") or -1,
+            "bodySize": event.get("response_body_size") or 0,
+        },
+        "cache": {},
+        "timings": har_timings,
+        "_transferSize": event.get("bytes_received") or 0,
+        "_cacheStatus": "browser" if event.get("from_cache") else cache_status(status, response_headers),
+    }
+    if event.get("error"):
+        entry["_error"] = event["error"]
+    return entry
+
+
+class Throttle:
+    """Link shared by all connections in one direction, delaying chunks to fit its bandwidth"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.next_free = 0.0
+
+    def transmit(self, size, kbps):
+        """Block until size bytes would have crossed a kbps link; returns seconds waited"""
+        if not kbps or not size:
+            return 0.0
+        with self.lock:
+            start = max(time.perf_counter(), self.next_free)
+            self.next_free = start + size * 8 / (kbps * 1000)
+            done = self.next_free
+        delay = max(0.0, done - time.perf_counter())
+        time.sleep(delay)
+        return delay
+
+
+class ProxyHandler(BaseHTTPRequestHandler):
+    """Forwards proxied HTTP requests and tunnels HTTPS (CONNECT), recording each exchange"""
+
+    def log_message(self, format, *args):
+        pass
+
+    # HTTPS tunnels
+
+    def do_CONNECT(self):
+        proxy = self.server.proxy
+        host, _, port = self.path.rpartition(":")
+        started, started_at = time.perf_counter(), iso_now()
+
+        blocked = proxy.add_latency()
+        try:
+            connect_started = time.perf_counter()
+            upstream = socket.create_connection((host, int(port or 443)), timeout=30)
+            connect_ms = (time.perf_counter() - connect_started) * 1000
+        except OSError as e:
+            self.send_error(502, f"Tunnel to {self.path} failed: {e}")
+            proxy.close_tunnel(proxy.open_tunnel(host, port, started, started_at, blocked * 1000, -1), 502)
+            return
+
+        tunnel = proxy.open_tunnel(host, port, started, started_at, blocked * 1000, connect_ms)
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        try:
+            self.relay(upstream, tunnel)
+        finally:
+            upstream.close()
+            proxy.close_tunnel(tunnel, 200)
+
+    def relay(self, upstream, tunnel):
+        """Copy bytes both ways until either side closes, counting them and throttling each chunk"""
+        proxy = self.server.proxy
+        sockets = [self.connection, upstream]
+        direction = None
+        while True:
+            readable, _, errored = select.select(sockets, [], sockets, 30)
+            if errored or not readable:
+                return
+            for source in readable:
+                try:
+                    data = source.recv(CHUNK_SIZE)
+                except OSError:
+                    data = b""
+                if not data:
+                    return
+                if source is self.connection:
+                    # Client speaking again after a response approximates a new request round trip
+                    if direction != "up":
+                        proxy.add_latency()
+                        direction = "up"
+                    proxy.uplink.transmit(len(data), proxy.profile["upload_kbps"])
+                    tunnel["sent"] += len(data)
+                    upstream.sendall(data)
+                else:
+                    direction = "down"
+                    proxy.downlink.transmit(len(data), proxy.profile["download_kbps"])
+                    tunnel["received"] += len(data)
+                    self.connection.sendall(data)
+
+    # Plain HTTP
+
+    def do_GET(self):
+        self.forward()
+
+    do_POST = do_PUT = do_DELETE = do_PATCH = do_HEAD = do_OPTIONS = do_GET
+
+    def forward(self):
+        proxy = self.server.proxy
+        url = urlsplit(self.path)
+        if url.scheme != "http" or not url.hostname:
+            self.send_error(400, "Proxy requests need an absolute http:// URL")
+            return
+
+        started, started_at = time.perf_counter(), iso_now()
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0) or 0))
+        request_headers = [
+            (name, value) for name, value in self.headers.items() if name.lower() not in HOP_BY_HOP_HEADERS
+        ]
+
+        blocked = proxy.add_latency() + proxy.uplink.transmit(len(body), proxy.profile["upload_kbps"])
+        connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=30)
+        try:
+            mark = time.perf_counter()
+            connection.connect()
+            connect = time.perf_counter() - mark
+
+            mark = time.perf_counter()
+            path = (url.path or "/") + (f"?{url.query}" if url.query else "")
+            connection.putrequest(self.command, path, skip_host=True, skip_accept_encoding=True)
+            for name, value in request_headers:
+                connection.putheader(name, value)
+            connection.endheaders(body or None)
+            send = time.perf_counter() - mark
+
+            mark = time.perf_counter()
+            response = connection.getresponse()
+            wait = time.perf_counter() - mark
+        except OSError as e:
+            connection.close()
+            self.send_error(502, f"Upstream request failed: {e}")
+            return
+
+        response_headers = [
+            (name, value) for name, value in response.getheaders() if name.lower() not in HOP_BY_HOP_HEADERS
+        ]
+        self.send_response_only(response.status, response.reason)
+        for name, value in response_headers:
+            self.send_header(name, value)
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        mark = time.perf_counter()
+        size = 0
+        while self.command != "HEAD":
+            chunk = response.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            proxy.downlink.transmit(len(chunk), proxy.profile["download_kbps"])
+            self.wfile.write(chunk)
+            size += len(chunk)
+        receive = time.perf_counter() - mark
+        connection.close()
+
+        values = {name.lower(): value for name, value in response_headers}
+        proxy.record({
+            "startedDateTime": started_at,
+            "time": round((time.perf_counter() - started) * 1000, 1),
+            "request": {
+                "method": self.command,
+                "url": self.path,
+                "httpVersion": self.request_version,
+                "headers": har_headers(request_headers),
+                "queryString": [{"name": name, "value": value} for name, value in parse_qsl(url.query)],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": len(body),
+            },
+            "response": {
+                "status": response.status,
+                "statusText": response.reason,
+                "httpVersion": f"HTTP/{response.version / 10:.1f}",
+                "headers": har_headers(response_headers),
+                "cookies": [],
+                "content": {"size": size, "mimeType": values.get("content-type", "")},
+                "redirectURL": values.get("location", ""),
+                "headersSize": -1,
+                "bodySize": size,
+            },
+            "cache": {},
+            "timings": {
+                "blocked": round(blocked * 1000, 1),
+                "dns": -1,
+                "connect": round(connect * 1000, 1),
+                "ssl": -1,
+                "send": round(send * 1000, 1),
+                "wait": round(wait * 1000, 1),
+                "receive": round(receive * 1000, 1),
+            },
+            "_cacheStatus": cache_status(response.status, response_headers),
+            "_started": started,
+        })
+
+
+class RecordingProxy:
+    """In-process HTTP proxy that records a HAR of the traffic it carries and can throttle it"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        """
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+        """
+        self.server = ThreadingHTTPServer((host, port), ProxyHandler)
+        self.server.daemon_threads = True
+        self.server.proxy = self
+        self.profile = dict(UNTHROTTLED)
+        self.uplink = Throttle()
+        self.downlink = Throttle()
+        self.entries = []
+        self.browser_entries = []
+        self.pages = []
+        self.tunnels = []
+        self.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def address(self):
+        """host:port the browser should use as its HTTP and SSL proxy"""
+        host, port = self.server.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self):
+        """Start serving in a background thread"""
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket"""
+        if self._thread:
+            self.server.shutdown()
+        self.server.server_close()
+
+    # Network conditions
+
+    def set_profile(self, profile=None):
+        """Apply latency/bandwidth limits from the next chunk or round trip on (None removes them)"""
+        self.profile = {**UNTHROTTLED, **(profile or {})}
+
+    def add_latency(self):
+        """Sleep one round trip of the current profile's latency; returns seconds slept"""
+        delay = self.profile["latency_ms"] / 1000
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    # Recording
+
+    def record(self, entry):
+        """Store one HAR entry (with its perf_counter start in _started)"""
+        with self.lock:
+            self.entries.append(entry)
+
+    def record_browser_event(self, event):
+        """Store a request captured from browser network events (DevToolsChannel listener)"""
+        entry = browser_har_entry(event)
+        # Event timestamps are epoch ms while pages and proxy entries use perf_counter
+        age = time.time() - event["started"] / 1000 if event.get("started") else 0
+        entry["_started"] = time.perf_counter() - age
+        entry["_context"] = event.get("context")
+        with self.lock:
+            self.browser_entries.append(entry)
+
+    def open_tunnel(self, host, port, started, started_at, blocked_ms, connect_ms):
+        """Register a CONNECT tunnel; its sent/received counts grow until close_tunnel"""
+        tunnel = {
+            "host": host, "port": port, "started": started, "started_at": started_at,
+            "blocked_ms": blocked_ms, "connect_ms": connect_ms, "sent": 0, "received": 0,
+        }
+        with self.lock:
+            self.tunnels.append(tunnel)
+        return tunnel
+
+    def close_tunnel(self, tunnel, status):
+        """Store a finished tunnel as a HAR entry"""
+        with self.lock:
+            self.tunnels = [other for other in self.tunnels if other is not tunnel]
+            self.entries.append(self.tunnel_entry(tunnel, status))
+
+    @staticmethod
+    def tunnel_entry(tunnel, status, still_open=False):
+        """HAR entry for a CONNECT tunnel with the bytes it has carried so far"""
+        total_ms = (time.perf_counter() - tunnel["started"]) * 1000
+        blocked_ms, connect_ms = tunnel["blocked_ms"], tunnel["connect_ms"]
+        entry = {
+            "startedDateTime": tunnel["started_at"],
+            "time": round(total_ms, 1),
+            "request": {
+                "method": "CONNECT",
+                "url": f"https://{tunnel['host']}:{tunnel['port']}/",
+                "httpVersion": "HTTP/1.1",
+                "headers": [],
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": tunnel["sent"],
+            },
+            "response": {
+                "status": status,
+                "statusText": "Connection Established" if status == 200 else "Bad Gateway",
+                "httpVersion": "HTTP/1.1",
+                "headers": [],
+                "cookies": [],
+                "content": {"size": tunnel["received"], "mimeType": "application/octet-stream"},
+                "redirectURL": "",
+                "headersSize": -1,
+                "bodySize": tunnel["received"],
+            },
+            "cache": {},
+            "timings": {
+                "blocked": round(blocked_ms, 1),
+                "dns": -1,
+                "connect": round(connect_ms, 1),
+                "ssl": -1,
+                "send": 0,
+                "wait": 0,
+                "receive": round(max(0, total_ms - blocked_ms - max(connect_ms, 0)), 1),
+            },
+            "_cacheStatus": "unknown",
+            "_tunnel": True,
+            "_started": tunnel["started"],
+        }
+        if still_open:
+            entry["_open"] = True
+        return entry
+
+    def mark_page(self, title, started=None, load_ms=-1, context=None):
+        """Start a new HAR page; entries starting after started (perf_counter) in context belong to it"""
+        with self.lock:
+            page_id = f"page_{len(self.pages) + 1}"
+            self.pages.append({
+                "startedDateTime": iso_now(),
+                "id": page_id,
+                "title": title,
+                "pageTimings": {"onContentLoad": -1, "onLoad": round(load_ms, 1)},
+                "_started": time.perf_counter() if started is None else started,
+                "_context": context,
+            })
+        return page_id
+
+    def clear(self):
+        """Drop recorded entries and pages"""
+        with self.lock:
+            self.entries = []
+            self.browser_entries = []
+            self.pages = []
+
+    def har(self, page_id=None):
+        """Build a HAR 1.2 log, optionally limited to one page's entries"""
+        with self.lock:
+            pages = list(self.pages)
+            if self.browser_entries:
+                entries = list(self.browser_entries)
+            else:
+                entries = self.entries + [self.tunnel_entry(tunnel, 200, still_open=True) for tunnel in self.tunnels]
+        entries.sort(key=lambda entry: entry["_started"])
+
+        exported = []
+        for entry in entries:
+            owner = None
+            context = entry.get("_context")
+            for page in pages:
+                same_context = not context or not page["_context"] or page["_context"] == context
+                if page["_started"] <= entry["_started"] and same_context:
+                    owner = page["id"]
+            if page_id and owner != page_id:
+                continue
+            entry = {key: value for key, value in entry.items() if key not in ("_started", "_context")}
+            if owner:
+                entry["pageref"] = owner
+            exported.append(entry)
+
+        return {"log": {
+            "version": "1.2",
+            "creator": {"name": "leagueoflegends-automation", "version": "1.0"},
+            "pages": [
+                {key: value for key, value in page.items() if key not in ("_started", "_context")}
+                for page in pages if not page_id or page["id"] == page_id
+            ],
+            "entries": exported,
+        }}
+
+    def write_har(self, path, page_id=None):
+        """Write har() to path"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.har(page_id), f, indent=2)
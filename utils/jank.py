@@ -0,0 +1,135 @@
+import time
+
+
+# Starts long-task and layout-shift observers (where the browser supports them) and a
+# requestAnimationFrame sampler; entries are attributed to segments by start time at collection.
+# Without layout-shift entries (Firefox) the sampler also tracks the document position of each
+# blade (arguments[0]) and scores frames where blades moved as impact fraction x distance fraction.
+JANK_INSTALL_SCRIPT = """
+const supported = PerformanceObserver.supportedEntryTypes || [];
+const jank = window.__jank = {
+    segments: [], longTasks: [], shifts: [], frames: [], observers: [], sampling: true,
+    supported: {longtask: supported.includes('longtask'), layout_shift: supported.includes('layout-shift')},
+};
+
+if (jank.supported.longtask) {
+    const observer = new PerformanceObserver(list => {
+        for (const entry of list.getEntries()) jank.longTasks.push({start: entry.startTime, duration: entry.duration});
+    });
+    observer.observe({type: 'longtask'});
+    jank.observers.push(observer);
+}
+if (jank.supported.layout_shift) {
+    const observer = new PerformanceObserver(list => {
+        for (const entry of list.getEntries()) {
+            if (!entry.hadRecentInput) jank.shifts.push({start: entry.startTime, value: entry.value});
+        }
+    });
+    observer.observe({type: 'layout-shift'});
+    jank.observers.push(observer);
+}
+
+const blades = jank.supported.layout_shift ? [] : arguments[0] || [];
+let positions = blades.map(blade => blade.getBoundingClientRect().top + scrollY);
+function sampleShift(now) {
+    const viewport = innerWidth * innerHeight;
+    let impact = 0, distance = 0;
+    positions = blades.map((blade, index) => {
+        const rect = blade.getBoundingClientRect();
+        const moved = Math.abs(rect.top + scrollY - positions[index]);
+        if (moved >= 1) {
+            const visibleHeight = Math.max(0, Math.min(rect.bottom, innerHeight) - Math.max(rect.top, 0));
+            const visibleWidth = Math.max(0, Math.min(rect.right, innerWidth) - Math.max(rect.left, 0));
+            impact += visibleHeight * visibleWidth / viewport;
+            distance = Math.max(distance, moved);
+        }
+        return rect.top + scrollY;
+    });
+    if (impact) jank.shifts.push({start: now, value: Math.min(1, impact) * distance / Math.max(innerWidth, innerHeight)});
+}
+
+let last = performance.now();
+(function sample(now) {
+    if (!jank.sampling) return;
+    if (now !== undefined) {
+        jank.frames.push({start: last, duration: now - last});
+        last = now;
+        if (blades.length) sampleShift(now);
+    }
+    requestAnimationFrame(sample);
+})();
+"""
+
+JANK_MARK_SCRIPT = """
+window.__jank.segments.push({name: arguments[0], start: performance.now()});
+"""
+
+# Stops sampling and reduces entries to per-segment long tasks, total blocking time
+# (time beyond 50ms per long task), dropped frames and layout shift. Without longtask entries
+# (Firefox) frames longer than 50ms stand in for long tasks: the main thread was busy for the gap.
+JANK_COLLECT_SCRIPT = """
+const jank = window.__jank;
+jank.sampling = false;
+for (const observer of jank.observers) {
+    for (const entry of observer.takeRecords()) {
+        if (entry.entryType === 'longtask') jank.longTasks.push({start: entry.startTime, duration: entry.duration});
+        else if (!entry.hadRecentInput) jank.shifts.push({start: entry.startTime, value: entry.value});
+    }
+    observer.disconnect();
+}
+if (!jank.supported.longtask) jank.longTasks = jank.frames.filter(frame => frame.duration > 50);
+
+const durations = jank.frames.map(frame => frame.duration).sort((a, b) => a - b);
+const interval = Math.max(durations.length ? durations[Math.floor(durations.length / 2)] : 16.7, 1000 / 240);
+const end = performance.now();
+
+const segments = {};
+jank.segments.forEach((segment, index) => {
+    const until = index + 1 < jank.segments.length ? jank.segments[index + 1].start : end;
+    const within = entry => entry.start >= segment.start && entry.start < until;
+    const longTasks = jank.longTasks.filter(within);
+    const frames = jank.frames.filter(within);
+    const shifts = jank.shifts.filter(within);
+    segments[segment.name] = {
+        duration_ms: Math.round(until - segment.start),
+        long_tasks: longTasks.length,
+        total_blocking_time_ms: Math.round(longTasks.reduce((sum, task) => sum + Math.max(0, task.duration - 50), 0)),
+        frames: frames.length,
+        dropped_frames: frames.reduce((sum, frame) => sum + Math.max(0, Math.round(frame.duration / interval) - 1), 0),
+        worst_frame_ms: Math.round(Math.max(0, ...frames.map(frame => frame.duration))),
+        layout_shift: Math.round(shifts.reduce((sum, shift) => sum + shift.value, 0) * 10000) / 10000,
+    };
+});
+return {
+    supported: jank.supported,
+    sources: {
+        blocking: jank.supported.longtask ? 'longtask' : 'frame_gaps',
+        layout_shift: jank.supported.layout_shift ? 'layout-shift' : 'blade_positions',
+    },
+    frame_interval_ms: Math.round(interval * 10) / 10,
+    segments,
+};
+"""
+
+
+def measure_scroll_jank(driver, blades, dwell=1.5):
+    """Scroll through blades in order while sampling long tasks, frames and layout shifts
+
+    Args:
+        driver: WebDriver instance with the page loaded
+        blades: list of (name, blade component) in page order
+        dwell: Seconds to stay on each blade after scrolling it into view
+
+    Returns:
+        dict with "supported" entry types, "sources" of blocking time and layout shift
+        (observer entries, or frame gaps and blade positions where unsupported),
+        "frame_interval_ms" (estimated refresh interval) and "segments" (blade name ->
+        long tasks, total blocking time, dropped frames, worst frame, layout shift)
+    """
+    driver.execute_script("window.scrollTo(0, 0);")
+    driver.execute_script(JANK_INSTALL_SCRIPT, [blade.blade for _, blade in blades])
+    for name, blade in blades:
+        driver.execute_script(JANK_MARK_SCRIPT, name)
+        blade.scroll_into_view()
+        time.sleep(dwell)
+    return driver.execute_script(JANK_COLLECT_SCRIPT)
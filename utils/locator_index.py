@@ -0,0 +1,188 @@
+import difflib
+import json
+import re
+
+from selenium.webdriver.common.by import By
+
+from components.base_blade import BaseBlade
+from utils.locators import to_css
+
+
+LOCATOR_STRATEGIES = {
+    value for name, value in vars(By).items() if not name.startswith("_") and isinstance(value, str)
+}
+
+# Counts every declared locator inside each blade root (CSS with querySelectorAll, XPath with
+# document.evaluate in the root's context, as find_element on the blade does) and collects the
+# data-testids/classes that still exist, so misses can be matched against surviving names in Python
+LOCATOR_INDEX_SCRIPT = """
+const spec = arguments[0];
+const count = (root, [kind, selector]) => kind === 'xpath'
+    ? document.evaluate(selector, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength
+    : root.querySelectorAll(selector).length;
+const index = {};
+let anyRootMissing = false;
+
+for (const [name, blade] of Object.entries(spec)) {
+    const root = document.querySelector(blade.root);
+    const entry = {root_found: !!root, counts: {}, testids: [], classes: []};
+
+    if (root) {
+        for (const [locatorName, locator] of Object.entries(blade.locators)) {
+            try {
+                entry.counts[locatorName] = count(root, locator);
+            } catch (e) {
+                entry.counts[locatorName] = -1;
+            }
+        }
+        const testids = new Set();
+        const classes = new Set();
+        for (const element of root.querySelectorAll('*')) {
+            if (element.dataset.testid) testids.add(element.dataset.testid);
+            for (const cls of element.classList) classes.add(cls);
+        }
+        entry.testids = [...testids];
+        entry.classes = [...classes];
+    } else {
+        anyRootMissing = true;
+    }
+    index[name] = entry;
+}
+
+const ids = anyRootMissing ? [...document.querySelectorAll('[id]')].map(element => element.id) : [];
+return {blades: index, document_ids: ids};
+"""
+
+TESTID_PATTERN = re.compile(r"\[data-testid\*?=['\"]([^'\"]+)['\"]\]")
+CLASS_PATTERN = re.compile(r"\.([A-Za-z0-9_-]+)")
+ID_PATTERN = re.compile(r"\[id=['\"]([^'\"]+)['\"]\]")
+
+
+def is_locator(value):
+    """Check if class attribute value is a (By, selector) locator tuple"""
+    return (
+        isinstance(value, tuple)
+        and len(value) == 2
+        and value[0] in LOCATOR_STRATEGIES
+        and isinstance(value[1], str)
+    )
+
+
+def collect_declared_locators(blade_class):
+    """Collect every locator constant visible on a blade class
+
+    Returns:
+        dict of locator name -> (locator, declaring class); subclass overrides win
+    """
+    declared = {}
+    for cls in reversed(blade_class.__mro__):
+        for name, value in vars(cls).items():
+            if name.isupper() and is_locator(value):
+                declared[name] = (value, cls)
+    return declared
+
+
+def nearest_names(selector, testids, classes, limit=3):
+    """Suggest surviving data-testids/classes closest to a selector that no longer matches"""
+    suggestions = []
+    for testid in TESTID_PATTERN.findall(selector):
+        suggestions += [f"[data-testid='{match}']" for match in difflib.get_close_matches(testid, testids, n=limit, cutoff=0.5)]
+    for cls in CLASS_PATTERN.findall(selector):
+        suggestions += [f".{match}" for match in difflib.get_close_matches(cls, classes, n=limit, cutoff=0.5)]
+    return suggestions[:limit]
+
+
+def locator_spec(locator):
+    """In-page form of a locator: ("xpath", expression) for XPath, else ("css", selector)"""
+    if locator[0] == By.XPATH:
+        return ("xpath", locator[1])
+    return ("css", to_css(locator))
+
+
+def build_locator_index(driver, blades):
+    """Evaluate every declared locator of every blade against the live DOM in one script
+
+    Args:
+        driver: WebDriver instance with the page loaded
+        blades: dict of blade name -> (root locator, component class), e.g. HomePage.BLADES
+
+    Returns:
+        dict of blade name -> report with root status, per-locator match counts and
+        misses (with suggestions) for locators the blade class itself relies on
+    """
+    declared = {}
+    spec = {}
+    for name, (root_locator, blade_class) in blades.items():
+        declared[name] = collect_declared_locators(blade_class)
+        spec[name] = {
+            "root": to_css(root_locator),
+            "locators": {
+                locator_name: locator_spec(locator)
+                for locator_name, (locator, _) in declared[name].items()
+            },
+        }
+
+    result = driver.execute_script(LOCATOR_INDEX_SCRIPT, spec)
+    document_ids = result["document_ids"]
+
+    index = {}
+    for name, (root_locator, blade_class) in blades.items():
+        live = result["blades"][name]
+        report = {
+            "component": blade_class.__name__,
+            "root": spec[name]["root"],
+            "root_found": live["root_found"],
+            "locators": {},
+            "misses": [],
+        }
+
+        if not live["root_found"]:
+            root_id = ID_PATTERN.findall(spec[name]["root"])
+            report["misses"].append({
+                "locator": "ROOT",
+                "selector": spec[name]["root"],
+                "suggestions": [
+                    f"[id='{match}']" for match in difflib.get_close_matches(root_id[0], document_ids, n=3, cutoff=0.5)
+                ] if root_id else [],
+            })
+            index[name] = report
+            continue
+
+        critical = set(blade_class.CRITICAL_LOCATORS)
+        optional = set(blade_class.OPTIONAL_LOCATORS)
+        for locator_name, (locator, declaring_class) in declared[name].items():
+            kind, selector = spec[name]["locators"][locator_name]
+            count = live["counts"].get(locator_name)
+            # Locators inherited from BaseBlade are optional unless the blade marks them critical
+            required = (declaring_class is not BaseBlade and locator not in optional) or locator in critical
+            report["locators"][locator_name] = {
+                "selector": selector,
+                "declared_by": declaring_class.__name__,
+                "matches": count,
+                "required": required,
+            }
+            if required and (count is None or count <= 0):
+                report["misses"].append({
+                    "locator": locator_name,
+                    "selector": selector,
+                    # Suggestions match data-testid/class names in CSS syntax only
+                    "suggestions": nearest_names(selector, live["testids"], live["classes"]) if kind == "css" else [],
+                })
+        index[name] = report
+
+    return index
+
+
+def format_misses(report):
+    """Format a blade report's misses as readable lines"""
+    lines = []
+    for miss in report["misses"]:
+        hint = f" (did you mean {', '.join(miss['suggestions'])}?)" if miss["suggestions"] else ""
+        lines.append(f"{report['component']}.{miss['locator']} {miss['selector']} matched nothing{hint}")
+    return lines
+
+
+def write_locator_index(index, path):
+    """Write locator index report as JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
@@ -0,0 +1,19 @@
+from selenium.webdriver.common.by import By
+
+
+def to_css(locator):
+    """Convert a (By, value) locator tuple to an equivalent CSS selector for in-page scripts"""
+    strategy, value = locator
+
+    if strategy == By.CSS_SELECTOR:
+        return value
+    if strategy == By.ID:
+        return f"[id='{value}']"
+    if strategy == By.TAG_NAME:
+        return value
+    if strategy == By.CLASS_NAME:
+        return f".{value}"
+    if strategy == By.NAME:
+        return f"[name='{value}']"
+
+    raise ValueError(f"Locator {locator} has no CSS equivalent")
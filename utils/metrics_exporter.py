@@ -0,0 +1,288 @@
+import json
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Test durations range from sub-second assertions to page loads under throttling
+DURATION_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# name -> (type, help); counters and histograms are carried over between runs via the state file
+METRICS = {
+    "blade_up": ("gauge", "1 when every executed test of the blade passed in the latest run"),
+    "tests": ("counter", "Finished tests by blade and outcome"),
+    "test_duration_seconds": ("histogram", "Duration of the test call phase"),
+    "page_load_seconds": ("gauge", "Homepage Navigation Timing milestones of the latest run"),
+    "webdriver_commands": ("counter", "WebDriver commands sent"),
+    "webdriver_command_seconds": ("counter", "Time spent waiting on WebDriver commands"),
+    "last_run_timestamp_seconds": ("gauge", "Unix time the latest run finished"),
+    "last_run_success": ("gauge", "1 when the latest run had no failed tests"),
+}
+CARRIED_OVER = {name for name, (kind, _) in METRICS.items() if kind in ("counter", "histogram")}
+
+
+def escape_label(value):
+    """Escape a label value for the text exposition formats"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels):
+    """Render a label tuple of (name, value) pairs as {name="value",...}"""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in labels) + "}"
+
+
+def format_value(value):
+    """Render a sample value (integers without a decimal point, infinities as +Inf)"""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Thread-safe store of gauge, counter and histogram samples keyed by label set"""
+
+    def __init__(self, prefix="lol_synthetic_", buckets=DURATION_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self.samples = {name: {} for name in METRICS}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _key(labels):
+        return tuple(sorted(labels.items()))
+
+    def set(self, name, value, **labels):
+        """Set a gauge"""
+        with self.lock:
+            self.samples[name][self._key(labels)] = value
+
+    def inc(self, name, amount=1, **labels):
+        """Increase a counter"""
+        key = self._key(labels)
+        with self.lock:
+            self.samples[name][key] = self.samples[name].get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        """Add an observation to a histogram"""
+        key = self._key(labels)
+        with self.lock:
+            histogram = self.samples[name].setdefault(key, {"buckets": [0] * len(self.buckets), "count": 0, "sum": 0.0})
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram["buckets"][index] += 1
+            histogram["count"] += 1
+            histogram["sum"] += value
+
+    def get(self, name, **labels):
+        """Current value of a sample, None when it was never set"""
+        with self.lock:
+            return self.samples[name].get(self._key(labels))
+
+    def render(self, openmetrics=True):
+        """Serialise all samples
+
+        Args:
+            openmetrics: OpenMetrics 1.0 text (counter families without _total, # EOF);
+                otherwise Prometheus text format 0.0.4, as read by node_exporter's textfile collector
+        """
+        lines = []
+        with self.lock:
+            for name, (kind, help_text) in METRICS.items():
+                series = self.samples[name]
+                if not series:
+                    continue
+                family = f"{self.prefix}{name}"
+                if kind == "counter" and not openmetrics:
+                    family += "_total"
+                lines.append(f"# HELP {family} {help_text}")
+                lines.append(f"# TYPE {family} {kind}")
+                for key, value in sorted(series.items()):
+                    if kind == "histogram":
+                        for bound, count in zip(self.buckets + (math.inf,), value["buckets"] + [value["count"]]):
+                            bucket_labels = key + (("le", "+Inf" if bound == math.inf else repr(float(bound))),)
+                            lines.append(f"{self.prefix}{name}_bucket{format_labels(bucket_labels)} {count}")
+                        lines.append(f"{self.prefix}{name}_count{format_labels(key)} {value['count']}")
+                        lines.append(f"{self.prefix}{name}_sum{format_labels(key)} {format_value(value['sum'])}")
+                    elif kind == "counter":
+                        lines.append(f"{self.prefix}{name}_total{format_labels(key)} {format_value(value)}")
+                    else:
+                        lines.append(f"{family}{format_labels(key)} {format_value(value)}")
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def dump_state(self):
+        """Counters and histograms as JSON-serialisable data"""
+        with self.lock:
+            return {
+                "buckets": list(self.buckets),
+                "samples": {
+                    name: [[list(map(list, key)), value] for key, value in self.samples[name].items()]
+                    for name in CARRIED_OVER
+                },
+            }
+
+    def load_state(self, state):
+        """Restore counters and histograms saved by dump_state (ignored if the buckets changed)"""
+        if tuple(state.get("buckets", ())) != self.buckets:
+            return
+        with self.lock:
+            for name, series in state.get("samples", {}).items():
+                if name in CARRIED_OVER:
+                    for key, value in series:
+                        self.samples[name][tuple(map(tuple, key))] = value
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serves the registry at /metrics, OpenMetrics when the scraper accepts it"""
+
+    registry = None
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+        body = self.registry.render(openmetrics=openmetrics).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsExporter:
+    """Publishes a MetricsRegistry to a textfile-collector file and/or a local HTTP endpoint"""
+
+    def __init__(self, registry=None, textfile=None, port=None, host="127.0.0.1"):
+        """
+        Args:
+            registry: MetricsRegistry to publish (a new one by default)
+            textfile: Path of the .prom file to write, e.g. in node_exporter's textfile directory
+            port: Serve /metrics on this port (0 picks a free one)
+            host: Interface the endpoint listens on
+        """
+        self.registry = registry or MetricsRegistry()
+        self.textfile = textfile
+        self.state_path = f"{textfile}.state.json" if textfile else None
+        self.port = port
+        self.host = host
+        self.server = None
+
+    @property
+    def address(self):
+        """URL of the metrics endpoint, None when not serving"""
+        if not self.server:
+            return None
+        return f"http://{self.host}:{self.server.server_address[1]}/metrics"
+
+    def start(self):
+        """Load carried-over state and start serving"""
+        if self.state_path and os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, encoding="utf-8") as f:
+                    self.registry.load_state(json.load(f))
+            except (OSError, ValueError):
+                pass
+        if self.port is not None:
+            handler = type("BoundMetricsHandler", (MetricsHandler,), {"registry": self.registry})
+            self.server = ThreadingHTTPServer((self.host, self.port), handler)
+            threading.Thread(target=self.server.serve_forever, name="metrics-exporter", daemon=True).start()
+        return self
+
+    def flush(self):
+        """Rewrite the textfile and state file from the current registry"""
+        if not self.textfile:
+            return
+        directory = os.path.dirname(os.path.abspath(self.textfile))
+        os.makedirs(directory, exist_ok=True)
+        # The collector must never read a half-written file
+        for path, content in (
+            (self.state_path, json.dumps(self.registry.dump_state())),
+            (self.textfile, self.registry.render(openmetrics=False)),
+        ):
+            temp = f"{path}.{os.getpid()}.tmp"
+            with open(temp, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(temp, path)
+
+    def stop(self):
+        """Flush and stop serving"""
+        self.flush()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+class SyntheticMetrics:
+    """Feeds test results, homepage load timing and WebDriver commands into the metrics exporter"""
+
+    def __init__(self, exporter, blade_of):
+        """
+        Args:
+            exporter: Started MetricsExporter
+            blade_of: Returns the blade name a test item covers, None for page-level tests
+        """
+        self.exporter = exporter
+        self.blade_of = blade_of
+        self.registry = exporter.registry
+        self.blades = {}
+        self.results = {}
+        self.failed = False
+
+    def pytest_collection_modifyitems(self, items):
+        for item in items:
+            self.blades[item.nodeid] = self.blade_of(item) or "none"
+
+    def pytest_runtest_logreport(self, report):
+        result = self.results.setdefault(report.nodeid, {"outcome": "passed", "duration": None})
+        if report.failed:
+            result["outcome"] = "failed"
+        elif report.skipped and result["outcome"] == "passed":
+            result["outcome"] = "skipped"
+        if report.when == "call":
+            result["duration"] = report.duration
+        if report.when != "teardown":
+            return
+
+        del self.results[report.nodeid]
+        blade = self.blades.get(report.nodeid, "none")
+        self.registry.inc("tests", blade=blade, outcome=result["outcome"])
+        if result["duration"] is not None:
+            self.registry.observe("test_duration_seconds", result["duration"], test=report.nodeid)
+        if result["outcome"] == "failed":
+            self.failed = True
+        if blade != "none" and result["outcome"] != "skipped":
+            up = self.registry.get("blade_up", blade=blade)
+            self.registry.set("blade_up", 0 if result["outcome"] == "failed" else (1 if up is None else up), blade=blade)
+        self.exporter.flush()
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.registry.set("last_run_timestamp_seconds", round(time.time()))
+        self.registry.set("last_run_success", 0 if self.failed else 1)
+        self.exporter.stop()
+
+    def record_command(self, command, params, started, elapsed):
+        """CommandRecorder listener counting commands and their latency"""
+        self.registry.inc("webdriver_commands", command=command)
+        self.registry.inc("webdriver_command_seconds", elapsed, command=command)
+
+    def record_page_load(self, metrics):
+        """Set page load gauges from collect_load_metrics() output"""
+        if not metrics:
+            return
+        for milestone, ms in metrics["navigation"].items():
+            self.registry.set("page_load_seconds", ms / 1000, milestone=milestone.removesuffix("_ms"))
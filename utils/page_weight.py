@@ -0,0 +1,163 @@
+import json
+from html import escape
+
+from utils.locators import to_css
+
+
+# Joins Resource Timing entries with the URLs each blade subtree references (img/srcset, video,
+# poster, source, iframe, script, link and CSS background images) and sums them per blade
+PAGE_WEIGHT_SCRIPT = """
+const roots = arguments[0];
+const absolute = url => { try { return new URL(url, location.href).href; } catch (e) { return null; } };
+const srcsetUrls = srcset => (srcset || '').split(',').map(part => part.trim().split(/\\s+/)[0]).filter(Boolean);
+const backgroundUrls = element => [...getComputedStyle(element).backgroundImage.matchAll(/url\\(["']?([^"')]+)["']?\\)/g)].map(m => m[1]);
+
+function referencedUrls(root) {
+    const urls = new Set();
+    for (const element of [root, ...root.querySelectorAll('*')]) {
+        const candidates = [
+            element.currentSrc, element.getAttribute('src'), element.getAttribute('poster'),
+            element.tagName === 'LINK' ? element.getAttribute('href') : null,
+            ...srcsetUrls(element.getAttribute('srcset')),
+            ...backgroundUrls(element),
+        ];
+        for (const candidate of candidates) {
+            const url = candidate && absolute(candidate);
+            if (url) urls.add(url);
+        }
+    }
+    return urls;
+}
+
+function resourceType(entry) {
+    const path = entry.name.split('?')[0].toLowerCase();
+    if (/\\.(woff2?|ttf|otf|eot)$/.test(path)) return 'font';
+    if (entry.initiatorType === 'video' || /\\.(mp4|webm|m3u8|mov)$/.test(path)) return 'video';
+    if (entry.initiatorType === 'img' || entry.initiatorType === 'image' || /\\.(png|jpe?g|gif|webp|avif|svg)$/.test(path)) return 'image';
+    if (entry.initiatorType === 'script' || /\\.m?js$/.test(path)) return 'script';
+    if (entry.initiatorType === 'css' || entry.initiatorType === 'link' || /\\.css$/.test(path)) return 'css';
+    return 'other';
+}
+
+const bladeUrls = {};
+for (const [name, selector] of Object.entries(roots)) {
+    const root = document.querySelector(selector);
+    bladeUrls[name] = root ? referencedUrls(root) : new Set();
+}
+
+const resources = performance.getEntriesByType('resource').map(entry => {
+    const owners = Object.keys(bladeUrls).filter(name => bladeUrls[name].has(entry.name));
+    return {
+        url: entry.name,
+        type: resourceType(entry),
+        initiator_type: entry.initiatorType,
+        owner: owners.length === 1 ? owners[0] : (owners.length ? 'shared' : 'page'),
+        owners,
+        transfer_bytes: entry.transferSize,
+        encoded_bytes: entry.encodedBodySize,
+        start_ms: Math.round(entry.startTime),
+        end_ms: Math.round(entry.responseEnd),
+        duration_ms: Math.round(entry.duration),
+    };
+});
+
+return {found: Object.fromEntries(Object.entries(roots).map(([name, selector]) => [name, !!document.querySelector(selector)])), resources};
+"""
+
+
+def build_page_weight_report(driver, blades):
+    """Attribute every loaded resource to the blade that references it
+
+    Args:
+        driver: WebDriver instance with the page loaded
+        blades: dict of blade name -> (root locator, component class), e.g. HomePage.BLADES
+
+    Returns:
+        dict with per-owner totals ("blades") and the attributed resource list ("resources");
+        owners are blade names, "shared" (referenced by several blades) or "page"
+    """
+    roots = {name: to_css(locator) for name, (locator, _) in blades.items()}
+    result = driver.execute_script(PAGE_WEIGHT_SCRIPT, roots)
+
+    totals = {}
+    for owner in list(blades) + ["shared", "page"]:
+        owned = [resource for resource in result["resources"] if resource["owner"] == owner]
+        by_type = {}
+        for resource in owned:
+            entry = by_type.setdefault(resource["type"], {"requests": 0, "transfer_bytes": 0})
+            entry["requests"] += 1
+            entry["transfer_bytes"] += resource["transfer_bytes"]
+
+        totals[owner] = {
+            "found": result["found"].get(owner, True),
+            "requests": len(owned),
+            "transfer_bytes": sum(resource["transfer_bytes"] for resource in owned),
+            "encoded_bytes": sum(resource["encoded_bytes"] for resource in owned),
+            # Cross-origin responses without Timing-Allow-Origin report 0 bytes
+            "opaque_requests": sum(1 for resource in owned if not resource["transfer_bytes"] and not resource["encoded_bytes"]),
+            "load_ms": (
+                max(resource["end_ms"] for resource in owned) - min(resource["start_ms"] for resource in owned)
+                if owned else 0
+            ),
+            "by_type": by_type,
+        }
+
+    return {"blades": totals, "resources": result["resources"]}
+
+
+def check_budget(totals, budget):
+    """Compare a blade's totals to its budget
+
+    Args:
+        totals: Per-blade totals from build_page_weight_report()
+        budget: dict with any of transfer_bytes, requests, load_ms
+
+    Returns:
+        list of human-readable budget violations
+    """
+    violations = []
+    for metric, limit in budget.items():
+        if totals.get(metric, 0) > limit:
+            violations.append(f"{metric} {totals[metric]} exceeds budget {limit}")
+    return violations
+
+
+def load_budgets(path):
+    """Load per-blade budgets from a JSON file (blade name -> {metric: limit})"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_page_weight_report(report, json_path, html_path, budgets=None):
+    """Write page weight report as JSON and an HTML table"""
+    budgets = budgets or {}
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"budgets": budgets, **report}, f, indent=2)
+
+    rows = []
+    for owner, totals in sorted(report["blades"].items(), key=lambda item: item[1]["transfer_bytes"], reverse=True):
+        violations = check_budget(totals, budgets.get(owner, {}))
+        types = ", ".join(f"{kind}: {entry['requests']}" for kind, entry in sorted(totals["by_type"].items()))
+        rows.append(
+            f"<tr class='{'over' if violations else ''}'>"
+            f"<td>{escape(owner)}</td>"
+            f"<td>{totals['transfer_bytes'] / 1024:.1f}</td>"
+            f"<td>{totals['requests']}</td>"
+            f"<td>{totals['opaque_requests']}</td>"
+            f"<td>{totals['load_ms']}</td>"
+            f"<td>{escape(types)}</td>"
+            f"<td>{(escape('; '.join(violations)) or 'ok') if owner in budgets else '-'}</td>"
+            "</tr>"
+        )
+
+    html = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Page weight per blade</title>"
+        "<style>table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}"
+        ".over{background:#fdd}</style></head><body><h1>Page weight per blade</h1><table>"
+        "<tr><th>Blade</th><th>Transfer (KiB)</th><th>Requests</th><th>Opaque</th>"
+        "<th>Load (ms)</th><th>By type</th><th>Budget</th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(html)
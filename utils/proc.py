@@ -0,0 +1,80 @@
+import os
+
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def driver_pid(driver):
+    """PID of the local driver service process (geckodriver, chromedriver...), None for remote drivers"""
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    return getattr(process, "pid", None)
+
+
+def read_stat(pid):
+    """Parse /proc/<pid>/stat
+
+    Returns:
+        dict with name, ppid, cpu_seconds (user + system), threads and rss_bytes,
+        or None if the process is gone or /proc is unavailable
+    """
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+            stat = f.read()
+    except OSError:
+        return None
+
+    # comm is parenthesised and may itself contain spaces or parentheses
+    name = stat[stat.index("(") + 1:stat.rindex(")")]
+    fields = stat[stat.rindex(")") + 2:].split()
+    return {
+        "pid": pid,
+        "name": name,
+        "ppid": int(fields[1]),
+        "cpu_seconds": (int(fields[11]) + int(fields[12])) / CLOCK_TICKS,
+        "threads": int(fields[17]),
+        "rss_bytes": int(fields[21]) * PAGE_SIZE,
+    }
+
+
+def process_tree(root_pid):
+    """Stats of root_pid and all its descendants (empty when /proc is unavailable)"""
+    if root_pid is None or not os.path.isdir("/proc"):
+        return []
+
+    stats = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            stat = read_stat(int(entry))
+            if stat:
+                stats[stat["pid"]] = stat
+
+    children = {}
+    for stat in stats.values():
+        children.setdefault(stat["ppid"], []).append(stat["pid"])
+
+    tree, pending = [], [root_pid]
+    while pending:
+        pid = pending.pop()
+        if pid in stats:
+            tree.append(stats[pid])
+            pending.extend(children.get(pid, []))
+    return tree
+
+
+def sample_tree(root_pid):
+    """Summed CPU time, RSS and thread count of a process tree
+
+    Returns:
+        dict with processes, cpu_seconds, rss_bytes and threads, or None when nothing was found
+    """
+    tree = process_tree(root_pid)
+    if not tree:
+        return None
+    return {
+        "processes": len(tree),
+        "cpu_seconds": round(sum(stat["cpu_seconds"] for stat in tree), 3),
+        "rss_bytes": sum(stat["rss_bytes"] for stat in tree),
+        "threads": sum(stat["threads"] for stat in tree),
+    }
@@ -0,0 +1,207 @@
+import json
+from html import escape
+
+from utils.locators import to_css
+
+
+# Injected at the start of every navigation (function declaration, __BLADE_ROOTS__ replaced
+# with name -> root selector). Tags blade subtrees with elementtiming as they are parsed,
+# watches them with IntersectionObserver and records when their eager media has loaded and decoded
+RENDER_TIMELINE_PRELOAD_SCRIPT = """
+() => {
+    if (window.__bladeTimeline) return;
+    const roots = __BLADE_ROOTS__;
+    const timeline = window.__bladeTimeline = {
+        installed_ms: Math.round(performance.now()),
+        element_timing: typeof PerformanceElementTiming !== 'undefined',
+        blades: {},
+    };
+    for (const name of Object.keys(roots)) {
+        timeline.blades[name] = {attached_ms: null, first_visible_ms: null, first_render_ms: null, media_complete_ms: null};
+    }
+    const tracked = new Map();
+
+    const visibility = typeof IntersectionObserver !== 'undefined' ? new IntersectionObserver(entries => {
+        for (const entry of entries) {
+            const blade = timeline.blades[tracked.get(entry.target)];
+            if (entry.isIntersecting && blade.first_visible_ms === null) blade.first_visible_ms = Math.round(entry.time);
+        }
+    }) : null;
+
+    if (timeline.element_timing) {
+        new PerformanceObserver(list => {
+            for (const entry of list.getEntries()) {
+                const blade = timeline.blades[entry.identifier];
+                const time = Math.round(entry.renderTime || entry.loadTime);
+                if (blade && (blade.first_render_ms === null || time < blade.first_render_ms)) blade.first_render_ms = time;
+            }
+        }).observe({type: 'element', buffered: true});
+    }
+
+    function mark(element, name) {
+        for (const node of [element, ...element.querySelectorAll('*')]) {
+            if (!node.hasAttribute('elementtiming')) node.setAttribute('elementtiming', name);
+        }
+    }
+
+    function checkMedia(name, root) {
+        const blade = timeline.blades[name];
+        if (blade.media_complete_ms !== null) return;
+        const images = [...root.querySelectorAll('img')].filter(img => img.loading !== 'lazy');
+        const videos = [...root.querySelectorAll('video')].filter(video => video.preload !== 'none');
+        if (!images.every(img => img.complete && img.naturalWidth > 0) || !videos.every(video => video.readyState >= 2)) return;
+        Promise.all(images.map(img => img.decode().catch(() => null))).then(() => {
+            if (blade.media_complete_ms === null) blade.media_complete_ms = Math.round(performance.now());
+        });
+    }
+
+    function scan(added) {
+        for (const [name, selector] of Object.entries(roots)) {
+            if (timeline.blades[name].attached_ms !== null) continue;
+            const root = document.querySelector(selector);
+            if (!root) continue;
+            tracked.set(root, name);
+            timeline.blades[name].attached_ms = Math.round(performance.now());
+            mark(root, name);
+            if (visibility) visibility.observe(root);
+            checkMedia(name, root);
+        }
+        for (const node of added) {
+            if (node.nodeType !== Node.ELEMENT_NODE) continue;
+            for (const [root, name] of tracked) {
+                if (root !== node && root.contains(node)) mark(node, name);
+            }
+        }
+    }
+
+    new MutationObserver(records => scan(records.flatMap(record => [...record.addedNodes])))
+        .observe(document, {childList: true, subtree: true});
+    const onMedia = event => {
+        for (const [root, name] of tracked) {
+            if (root.contains(event.target)) checkMedia(name, root);
+        }
+    };
+    document.addEventListener('load', onMedia, true);
+    document.addEventListener('loadeddata', onMedia, true);
+    scan([]);
+}
+"""
+
+RENDER_TIMELINE_COLLECT_SCRIPT = """
+const timeline = window.__bladeTimeline;
+if (!timeline) return null;
+const navigation = performance.getEntriesByType('navigation')[0];
+return {
+    ...timeline,
+    dom_content_loaded_ms: navigation ? Math.round(navigation.domContentLoadedEventEnd) : null,
+    load_ms: navigation ? Math.round(navigation.loadEventEnd) : null,
+};
+"""
+
+
+class RenderTimeline:
+    """Per-blade render timeline recorded by a script injected at the start of every navigation"""
+
+    def __init__(self, devtools, blades):
+        """
+        Args:
+            devtools: DevToolsChannel of the session
+            blades: dict of blade name -> (root locator, component class), e.g. HomePage.BLADES
+        """
+        self.devtools = devtools
+        self.driver = devtools.driver
+        roots = {name: to_css(locator) for name, (locator, _) in blades.items()}
+        self.source = RENDER_TIMELINE_PRELOAD_SCRIPT.replace("__BLADE_ROOTS__", json.dumps(roots))
+        self.script_id = None
+
+    @property
+    def preloaded(self):
+        """True when the script runs before page scripts in every new document"""
+        return self.script_id is not None
+
+    def install(self):
+        """Preload the timeline script into new documents (no-op on classic WebDriver)"""
+        self.script_id = self.devtools.add_preload_script(self.source)
+        return self.preloaded
+
+    def uninstall(self):
+        """Stop injecting the timeline script"""
+        if self.script_id is not None:
+            self.devtools.remove_preload_script(self.script_id)
+            self.script_id = None
+
+    def ensure_installed(self):
+        """Install into the current document if the preload did not (classic WebDriver)"""
+        self.driver.execute_script(f"({self.source})();")
+
+    def collect(self):
+        """Get the timeline of the current document
+
+        Returns:
+            dict with installed_ms, load_ms, element_timing support and per-blade
+            attached/first_visible/first_render/media_complete ms since navigation start;
+            first_render falls back to first_visible where Element Timing is unsupported
+        """
+        self.ensure_installed()
+        timeline = self.driver.execute_script(RENDER_TIMELINE_COLLECT_SCRIPT)
+        for blade in timeline["blades"].values():
+            if blade["first_render_ms"] is None:
+                blade["first_render_ms"] = blade["first_visible_ms"]
+        timeline["preloaded"] = self.preloaded
+        return timeline
+
+
+def render_timeline_html(timeline):
+    """Render the timeline as an HTML fragment with one SVG row per blade (attached -> media complete)"""
+    marks = ("attached_ms", "first_visible_ms", "first_render_ms", "media_complete_ms")
+    colors = {"attached_ms": "#999", "first_visible_ms": "#39c", "first_render_ms": "#2a2", "media_complete_ms": "#c60"}
+    values = [blade[mark] for blade in timeline["blades"].values() for mark in marks if blade[mark] is not None]
+    end = max(values + [timeline.get("load_ms") or 0, 1])
+    width, row, label = 900, 28, 200
+    scale = (width - label - 20) / end
+
+    rows = []
+    for index, (name, blade) in enumerate(timeline["blades"].items()):
+        y = index * row + 10
+        rows.append(f"<text x='0' y='{y + 14}' font-size='12'>{escape(name)}</text>")
+        start, stop = blade["attached_ms"], blade["media_complete_ms"] or blade["first_render_ms"]
+        if start is not None and stop is not None:
+            rows.append(
+                f"<rect x='{label + start * scale:.1f}' y='{y + 6}' width='{max(1, (stop - start) * scale):.1f}' "
+                f"height='6' fill='#ddd'/>"
+            )
+        for mark in marks:
+            if blade[mark] is not None:
+                rows.append(
+                    f"<circle cx='{label + blade[mark] * scale:.1f}' cy='{y + 9}' r='4' fill='{colors[mark]}'>"
+                    f"<title>{mark}: {blade[mark]} ms</title></circle>"
+                )
+    if timeline.get("load_ms"):
+        x = label + timeline["load_ms"] * scale
+        rows.append(f"<line x1='{x:.1f}' x2='{x:.1f}' y1='0' y2='{len(timeline['blades']) * row + 10}' stroke='#c00'/>")
+
+    legend = " ".join(
+        f"<span style='color:{color}'>&#9679; {mark[:-3].replace('_', ' ')}</span>" for mark, color in colors.items()
+    )
+    return (
+        f"<div><p>{legend} <span style='color:#c00'>| load event</span> "
+        f"(0 - {end} ms, preloaded: {timeline.get('preloaded')})</p>"
+        f"<svg xmlns='http://www.w3.org/2000/svg' width='{width}' height='{len(timeline['blades']) * row + 20}'>"
+        + "".join(rows)
+        + "</svg></div>"
+    )
+
+
+def write_render_timeline(timeline, json_path, html_path):
+    """Write render timeline as JSON and an HTML page"""
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(timeline, f, indent=2)
+
+    html = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Blade render timeline</title></head>"
+        "<body style='font-family:sans-serif'><h1>Blade render timeline</h1>"
+        + render_timeline_html(timeline)
+        + "</body></html>"
+    )
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(html)
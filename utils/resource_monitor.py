@@ -0,0 +1,181 @@
+import json
+import os
+import threading
+import time
+
+from utils.proc import sample_tree
+
+
+class ResourceMonitor:
+    """Background thread sampling a process tree through /proc and attributing usage to test phases"""
+
+    def __init__(self, root_pid, interval=0.25):
+        """
+        Args:
+            root_pid: Root of the process tree to watch (e.g. the driver service pid)
+            interval: Seconds between background samples
+        """
+        self.root_pid = root_pid
+        self.interval = interval
+        self.records = []
+        self.lock = threading.Lock()
+        self._phase = None
+        self._last = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        """True between start() and stop()"""
+        return self._thread is not None and not self._stop.is_set()
+
+    def start(self):
+        """Start sampling in a daemon thread"""
+        self._last = self._sample()
+        self._thread = threading.Thread(target=self._run, name="resource-monitor", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop sampling (closing any open phase)"""
+        self.end()
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval * 4)
+
+    def _sample(self):
+        tree = sample_tree(self.root_pid)
+        return {"time": time.perf_counter(), **tree} if tree else None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            sample = self._sample()
+            if not sample:
+                continue
+            with self.lock:
+                if self._phase and self._last:
+                    seconds = sample["time"] - self._last["time"]
+                    if seconds > 0:
+                        cpu_percent = (sample["cpu_seconds"] - self._last["cpu_seconds"]) / seconds * 100
+                        self._phase["peak_cpu_percent"] = max(self._phase["peak_cpu_percent"], cpu_percent)
+                    self._phase["rss_peak"] = max(self._phase["rss_peak"], sample["rss_bytes"])
+                    self._phase["threads_peak"] = max(self._phase["threads_peak"], sample["threads"])
+                self._last = sample
+
+    def begin(self, nodeid, phase):
+        """Start attributing usage to nodeid's phase"""
+        self.end()
+        sample = self._sample()
+        if not sample:
+            return
+        with self.lock:
+            self._last = sample
+            self._phase = {
+                "nodeid": nodeid,
+                "phase": phase,
+                "start": sample,
+                "peak_cpu_percent": 0.0,
+                "rss_peak": sample["rss_bytes"],
+                "threads_peak": sample["threads"],
+            }
+
+    def end(self):
+        """Close the current phase and store its record
+
+        Returns:
+            the record, or None when no phase was open
+        """
+        with self.lock:
+            phase, self._phase = self._phase, None
+        if not phase:
+            return None
+        sample = self._sample() or phase["start"]
+        start = phase["start"]
+        wall = sample["time"] - start["time"]
+        cpu = sample["cpu_seconds"] - start["cpu_seconds"]
+        record = {
+            "nodeid": phase["nodeid"],
+            "phase": phase["phase"],
+            "wall_seconds": round(wall, 3),
+            "cpu_seconds": round(cpu, 3),
+            "cpu_percent": round(cpu / wall * 100, 1) if wall > 0 else 0.0,
+            "peak_cpu_percent": round(phase["peak_cpu_percent"], 1),
+            "rss_start": start["rss_bytes"],
+            "rss_end": sample["rss_bytes"],
+            "rss_peak": max(phase["rss_peak"], sample["rss_bytes"]),
+            "threads_peak": max(phase["threads_peak"], sample["threads"]),
+            "processes": sample["processes"],
+        }
+        with self.lock:
+            self.records.append(record)
+        return record
+
+    def record_for(self, nodeid, phase):
+        """Get the latest record of nodeid's phase"""
+        with self.lock:
+            for record in reversed(self.records):
+                if record["nodeid"] == nodeid and record["phase"] == phase:
+                    return record
+        return None
+
+
+def summarize_resources(records):
+    """Totals per test and the tree's average core usage across all recorded phases"""
+    tests = {}
+    for record in records:
+        test = tests.setdefault(record["nodeid"], {"wall_seconds": 0.0, "cpu_seconds": 0.0, "rss_peak": 0,
+                                                   "peak_cpu_percent": 0.0})
+        test["wall_seconds"] = round(test["wall_seconds"] + record["wall_seconds"], 3)
+        test["cpu_seconds"] = round(test["cpu_seconds"] + record["cpu_seconds"], 3)
+        test["rss_peak"] = max(test["rss_peak"], record["rss_peak"])
+        test["peak_cpu_percent"] = max(test["peak_cpu_percent"], record["peak_cpu_percent"])
+
+    wall = sum(test["wall_seconds"] for test in tests.values())
+    cpu = sum(test["cpu_seconds"] for test in tests.values())
+    return {
+        "cpu_count": os.cpu_count(),
+        "wall_seconds": round(wall, 3),
+        "cpu_seconds": round(cpu, 3),
+        # Cores the browser tree keeps busy per worker: cpu_count / this bounds xdist workers
+        "average_cores": round(cpu / wall, 2) if wall else None,
+        "peak_rss": max((test["rss_peak"] for test in tests.values()), default=0),
+        "heaviest": sorted(tests, key=lambda nodeid: tests[nodeid]["cpu_seconds"], reverse=True)[:5],
+        "tests": tests,
+    }
+
+
+def write_resource_report(records, path):
+    """Write per-phase records and per-test summary as JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"summary": summarize_resources(records), "records": records}, f, indent=2)
+
+
+class ResourceReportColumns:
+    """pytest-html columns and summary for browser process usage recorded by ResourceMonitor"""
+
+    def __init__(self, get_monitor):
+        """
+        Args:
+            get_monitor: Returns the session's ResourceMonitor (None until the browser starts)
+        """
+        self.get_monitor = get_monitor
+
+    def pytest_html_results_table_header(self, cells):
+        cells.insert(2, "<th>Browser CPU (s)</th>")
+        cells.insert(3, "<th>Peak RSS (MB)</th>")
+
+    def pytest_html_results_table_row(self, report, cells):
+        record = dict(report.user_properties).get("browser_resources")
+        cells.insert(2, f"<td>{record['cpu_seconds'] if record else ''}</td>")
+        cells.insert(3, f"<td>{round(record['rss_peak'] / 1048576) if record else ''}</td>")
+
+    def pytest_html_results_summary(self, prefix, summary, postfix, session):
+        monitor = self.get_monitor()
+        if not monitor or not monitor.records:
+            return
+        totals = summarize_resources(monitor.records)
+        prefix.append(
+            f"<p>Browser processes used {totals['cpu_seconds']} CPU-s over {totals['wall_seconds']} s of tests "
+            f"(~{totals['average_cores']} of {totals['cpu_count']} cores), peak RSS "
+            f"{round(totals['peak_rss'] / 1048576)} MB. Heaviest: {', '.join(totals['heaviest'])}</p>"
+        )
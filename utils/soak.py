@@ -0,0 +1,197 @@
+import json
+import statistics
+import time
+from html import escape
+
+from components.icon_tab_blade import IconTabBlade
+from utils.proc import driver_pid, sample_tree
+
+
+# JS heap in use: measureUserAgentSpecificMemory where the page is cross-origin isolated,
+# otherwise the non-standard performance.memory (Chromium), otherwise null
+HEAP_SCRIPT = """
+const done = arguments[arguments.length - 1];
+if (window.crossOriginIsolated && performance.measureUserAgentSpecificMemory) {
+    performance.measureUserAgentSpecificMemory()
+        .then(result => done({bytes: result.bytes, source: 'measureUserAgentSpecificMemory'}))
+        .catch(() => done(null));
+} else if (performance.memory) {
+    done({bytes: performance.memory.usedJSHeapSize, source: 'performance.memory'});
+} else {
+    done(null);
+}
+"""
+
+# Metrics sampled during a soak run, in chart order
+SOAK_METRICS = ("heap_bytes", "rss_bytes", "command_ms")
+
+
+def build_scenarios(home_page):
+    """Interaction scenarios over the registered blades as (name, step()) pairs; pass a page in its own tab"""
+    blades = [home_page.get_blade(name) for name in home_page.BLADES]
+    icon_tabs = [blade for blade in blades if isinstance(blade, IconTabBlade)]
+    carousels = [blade for blade in blades if blade.find_elements_in_blade(blade.NEXT_BUTTON)]
+    counter = {"tab": 0}
+
+    def icon_tab_cycle():
+        for blade in icon_tabs:
+            count = blade.get_slide_count()
+            if count:
+                blade.click_tab_by_index(counter["tab"] % count)
+        counter["tab"] += 1
+
+    def carousel_cycle():
+        for blade in carousels:
+            blade.scroll_into_view()
+            blade.find_element_in_blade(blade.NEXT_BUTTON).click()
+            blade.settle()
+
+    def scroll_through():
+        for blade in blades:
+            blade.scroll_into_view()
+
+    return [("icon_tab_cycle", icon_tab_cycle), ("carousel_cycle", carousel_cycle), ("scroll_through", scroll_through)]
+
+
+class SoakRunner:
+    """Loops interaction scenarios for a fixed duration and samples memory and latency drift"""
+
+    def __init__(self, driver, scenarios, duration_seconds, sample_interval=30):
+        """
+        Args:
+            driver: WebDriver instance (with command_recorder installed for latency samples)
+            scenarios: list of (name, step()) run round-robin
+            duration_seconds: How long to keep looping
+            sample_interval: Seconds between samples
+        """
+        self.driver = driver
+        self.scenarios = scenarios
+        self.duration_seconds = duration_seconds
+        self.sample_interval = sample_interval
+        self.samples = []
+        self.errors = []
+        self._window = []
+
+    def _record_command(self, command, params, started, elapsed):
+        self._window.append(elapsed)
+
+    def sample(self, elapsed, iterations):
+        """Take one sample of heap, RSS and command latency"""
+        heap = self.driver.execute_async_script(HEAP_SCRIPT)
+        tree = sample_tree(driver_pid(self.driver))
+        window, self._window = self._window, []
+        self.samples.append({
+            "elapsed_seconds": round(elapsed, 1),
+            "iterations": iterations,
+            "heap_bytes": heap["bytes"] if heap else None,
+            "heap_source": heap["source"] if heap else None,
+            "rss_bytes": tree["rss_bytes"] if tree else None,
+            "processes": tree["processes"] if tree else None,
+            "command_ms": round(statistics.mean(window) * 1000, 2) if window else None,
+        })
+
+    def run(self):
+        """Loop scenarios until duration_seconds have passed
+
+        Returns:
+            list of samples (elapsed_seconds, iterations, heap_bytes, rss_bytes, command_ms)
+        """
+        recorder = getattr(self.driver, "command_recorder", None)
+        if recorder:
+            recorder.add_listener(self._record_command)
+
+        started = time.perf_counter()
+        next_sample = started
+        iterations = 0
+        try:
+            while True:
+                now = time.perf_counter()
+                if now >= next_sample:
+                    self.sample(now - started, iterations)
+                    next_sample = now + self.sample_interval
+                if now - started >= self.duration_seconds:
+                    break
+                name, step = self.scenarios[iterations % len(self.scenarios)]
+                try:
+                    step()
+                except Exception as e:
+                    self.errors.append({"iteration": iterations, "scenario": name, "error": str(e).splitlines()[0]})
+                iterations += 1
+        finally:
+            if recorder:
+                recorder.remove_listener(self._record_command)
+        return self.samples
+
+
+def detect_growth(samples, metric, tolerance):
+    """Check a metric for sustained growth (later quarter's median higher and trend rising) over a soak run
+
+    Returns:
+        dict with first/last quarter medians, growth ratio, slope per minute and sustained flag,
+        or None when fewer than 4 samples have the metric
+    """
+    points = [(sample["elapsed_seconds"], sample[metric]) for sample in samples if sample.get(metric) is not None]
+    if len(points) < 4:
+        return None
+
+    quarter = max(1, len(points) // 4)
+    first = statistics.median(value for _, value in points[:quarter])
+    last = statistics.median(value for _, value in points[-quarter:])
+    times = [elapsed for elapsed, _ in points]
+    values = [value for _, value in points]
+    mean_time, mean_value = statistics.mean(times), statistics.mean(values)
+    variance = sum((elapsed - mean_time) ** 2 for elapsed in times)
+    slope = sum((elapsed - mean_time) * (value - mean_value) for elapsed, value in points) / variance if variance else 0.0
+    growth = (last - first) / first if first else 0.0
+
+    return {
+        "metric": metric,
+        "first_quarter": first,
+        "last_quarter": last,
+        "growth": round(growth, 3),
+        "slope_per_minute": round(slope * 60, 2),
+        "tolerance": tolerance,
+        "sustained": growth > tolerance and slope > 0,
+    }
+
+
+def drift_chart_svg(samples, metric, width=600, height=160):
+    """Line chart of metric over elapsed time as inline SVG"""
+    points = [(sample["elapsed_seconds"], sample[metric]) for sample in samples if sample.get(metric) is not None]
+    if len(points) < 2:
+        return f"<p>{escape(metric)}: not enough samples</p>"
+
+    max_time = max(elapsed for elapsed, _ in points) or 1
+    low, high = min(value for _, value in points), max(value for _, value in points)
+    span = (high - low) or 1
+    path = " ".join(
+        f"{elapsed / max_time * (width - 10) + 5:.1f},{height - 5 - (value - low) / span * (height - 10):.1f}"
+        for elapsed, value in points
+    )
+    return (
+        f"<h3>{escape(metric)} ({low:g} - {high:g})</h3>"
+        f"<svg xmlns='http://www.w3.org/2000/svg' width='{width}' height='{height}' style='border:1px solid #ccc'>"
+        f"<polyline fill='none' stroke='#0a6' stroke-width='2' points='{path}'/></svg>"
+    )
+
+
+def write_soak_report(samples, growth, errors, json_path, html_path):
+    """Write soak samples and growth verdicts as JSON and an HTML page with drift charts"""
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"growth": growth, "errors": errors, "samples": samples}, f, indent=2)
+
+    verdicts = "".join(
+        f"<li>{escape(metric)}: "
+        + (f"growth {result['growth']:.1%}, {'SUSTAINED' if result['sustained'] else 'ok'}" if result else "no data")
+        + "</li>"
+        for metric, result in growth.items()
+    )
+    html = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Soak drift</title></head>"
+        "<body style='font-family:sans-serif'><h1>Soak drift</h1>"
+        f"<p>{len(samples)} samples, {len(errors)} scenario errors</p><ul>{verdicts}</ul>"
+        + "".join(drift_chart_svg(samples, metric) for metric in SOAK_METRICS)
+        + "</body></html>"
+    )
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(html)
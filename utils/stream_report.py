@@ -0,0 +1,282 @@
+import base64
+import glob
+import hashlib
+import json
+import os
+import pytest
+import sys
+import time
+from html import escape
+
+
+# Extension used for stored attachments by pytest-html extra format, when the extra has none
+FORMAT_EXTENSIONS = {"html": "html", "json": "json", "text": "txt", "image": "png", "video": "mp4"}
+
+# Attachments held as base64 (or a file path) in pytest-html extras
+BINARY_FORMATS = ("image", "video")
+
+PAGE_SIZE = 200
+
+
+class AttachmentStore:
+    """Content-addressed attachment files: identical content is stored once, under its sha256"""
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory: Report directory; files go to <directory>/attachments/<2 hex>/<sha256>.<ext>
+        """
+        self.directory = directory
+
+    def put(self, data, extension):
+        """Store bytes and get the path relative to the report directory"""
+        digest = hashlib.sha256(data).hexdigest()
+        relative = os.path.join("attachments", digest[:2], f"{digest}.{extension}")
+        path = os.path.join(self.directory, relative)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Workers may store the same content concurrently; the rename is atomic
+            temp = f"{path}.{os.getpid()}.tmp"
+            with open(temp, "wb") as f:
+                f.write(data)
+            os.replace(temp, path)
+        return relative.replace(os.sep, "/")
+
+    def stored_path(self, path):
+        """Path relative to the report directory if path points at a stored attachment, else None"""
+        relative = os.path.relpath(os.path.abspath(path), os.path.abspath(self.directory))
+        if not relative.startswith("attachments" + os.sep) or not os.path.isfile(path):
+            return None
+        return relative.replace(os.sep, "/")
+
+    def put_extra(self, extra):
+        """Store a pytest-html extra and get its attachment entry (URLs stay links, media may be file paths)"""
+        format_type = extra.get("format_type")
+        content = extra.get("content")
+        stored = self.stored_path(content) if isinstance(content, str) else None
+        if stored:
+            return {"name": extra.get("name") or format_type, "path": stored, "mime_type": extra.get("mime_type")}
+        if format_type == "url":
+            return {"name": extra.get("name") or "URL", "url": content}
+        if format_type in BINARY_FORMATS and isinstance(content, str) and os.path.isfile(content):
+            # Media attached by file path (screenshots when streaming) are copied without a base64 round trip
+            with open(content, "rb") as f:
+                data = f.read()
+        elif format_type in BINARY_FORMATS:
+            data = base64.b64decode(content)
+        elif isinstance(content, (dict, list)):
+            data = json.dumps(content, indent=2).encode("utf-8")
+        else:
+            data = str(content).encode("utf-8")
+        extension = extra.get("extension") or FORMAT_EXTENSIONS.get(format_type, "bin")
+        return {
+            "name": extra.get("name") or format_type,
+            "path": self.put(data, extension),
+            "mime_type": extra.get("mime_type"),
+        }
+
+
+    def stored_extra(self, extra):
+        """Store a pytest-html extra and get a copy whose content is the stored file's path (non-media become URLs)"""
+        entry = self.put_extra(extra)
+        if "path" not in entry:
+            return extra
+        path = os.path.abspath(os.path.join(self.directory, entry["path"]))
+        if extra.get("format_type") in BINARY_FORMATS:
+            return {**extra, "content": path}
+        return {**extra, "format_type": "url", "content": path}
+
+
+class StreamingReporter:
+    """Appends one JSON line per finished test to this process's shard of the result log"""
+
+    def __init__(self, directory, shard="main"):
+        """
+        Args:
+            directory: Report directory shared by all shards
+            shard: Name of this process's shard (the xdist worker id, or "main")
+        """
+        self.directory = directory
+        self.shard = shard
+        self.attachments = AttachmentStore(directory)
+        self.pending = {}
+        self.count = 0
+        os.makedirs(directory, exist_ok=True)
+        self.file = open(os.path.join(directory, f"results-{shard}.jsonl"), "a", encoding="utf-8", buffering=1)
+
+    def add_report(self, report):
+        """Merge a phase report into its test's record and write the record after teardown"""
+        record = self.pending.setdefault(report.nodeid, {
+            "nodeid": report.nodeid,
+            "shard": self.shard,
+            "outcome": "passed",
+            "duration": 0.0,
+            "phases": {},
+            "longrepr": None,
+            "attachments": [],
+            "properties": {},
+        })
+        record["duration"] = round(record["duration"] + report.duration, 3)
+        record["phases"][report.when] = report.outcome
+        if report.failed:
+            record["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped and record["outcome"] == "passed":
+            record["outcome"] = "xfailed" if hasattr(report, "wasxfail") else "skipped"
+        if report.longrepr and (report.failed or report.skipped):
+            record["longrepr"] = str(report.longrepr)
+        for extra in getattr(report, "extras", []):
+            try:
+                record["attachments"].append(self.attachments.put_extra(extra))
+            except Exception as e:
+                record["attachments"].append({"name": extra.get("name"), "error": str(e)})
+        for name, value in report.user_properties:
+            record["properties"][name] = value
+
+        if report.when == "teardown":
+            del self.pending[report.nodeid]
+            record["finished"] = time.time()
+            self.file.write(json.dumps(record, default=str) + "\n")
+            self.count += 1
+
+    def close(self):
+        """Close the shard"""
+        self.file.close()
+
+
+def clear_shards(directory):
+    """Remove result shards of a previous run (attachments are kept and deduplicated)"""
+    for path in glob.glob(os.path.join(directory, "results-*.jsonl")):
+        os.remove(path)
+
+
+def iter_records(directory):
+    """Yield test records from every shard, one line at a time"""
+    for path in sorted(glob.glob(os.path.join(directory, "results-*.jsonl"))):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+OUTCOME_COLORS = {"passed": "#2a2", "failed": "#c22", "error": "#c22", "skipped": "#999", "xfailed": "#e90"}
+PAGE_STYLE = (
+    "<style>body{font-family:sans-serif}table{border-collapse:collapse;width:100%}"
+    "td,th{border:1px solid #ccc;padding:4px 8px;text-align:left;vertical-align:top}"
+    "pre{white-space:pre-wrap;font-size:12px}img{max-width:480px}</style>"
+)
+
+
+def render_row(record):
+    """HTML table row of one test record"""
+    attachments = []
+    for attachment in record["attachments"]:
+        name = escape(str(attachment.get("name")))
+        if "url" in attachment:
+            attachments.append(f"<a href='{escape(attachment['url'])}'>{name}</a>")
+        elif "path" in attachment:
+            path = escape(attachment["path"])
+            if (attachment.get("mime_type") or "").startswith("image/"):
+                attachments.append(f"<a href='{path}'><img loading='lazy' src='{path}' alt='{name}'></a>")
+            else:
+                attachments.append(f"<a href='{path}'>{name}</a>")
+    details = f"<details><summary>details</summary><pre>{escape(record['longrepr'])}</pre></details>" \
+        if record["longrepr"] else ""
+    color = OUTCOME_COLORS.get(record["outcome"], "#000")
+    return (
+        f"<tr><td>{escape(record['nodeid'])}{details}</td>"
+        f"<td style='color:{color}'>{record['outcome']}</td><td>{record['duration']}</td>"
+        f"<td>{' '.join(attachments)}</td></tr>"
+    )
+
+
+def render_index(directory, page_size=PAGE_SIZE):
+    """Render index.html and page-NNNN.html from the result shards, one page of rows at a time
+
+    Returns:
+        dict of outcome -> count
+    """
+    for path in glob.glob(os.path.join(directory, "page-*.html")):
+        os.remove(path)
+    totals = {}
+    pages = []
+    rows, failures = [], 0
+
+    def flush_page():
+        number = len(pages) + 1
+        name = f"page-{number:04d}.html"
+        with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+            f.write(
+                f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Results page {number}</title>"
+                f"{PAGE_STYLE}</head><body><p><a href='index.html'>Index</a></p><h1>Results page {number}</h1>"
+                "<table><tr><th>Test</th><th>Outcome</th><th>Duration (s)</th><th>Attachments</th></tr>"
+                + "".join(rows)
+                + "</table></body></html>"
+            )
+        pages.append((name, len(rows), failures))
+
+    for record in iter_records(directory):
+        totals[record["outcome"]] = totals.get(record["outcome"], 0) + 1
+        rows.append(render_row(record))
+        failures += record["outcome"] in ("failed", "error")
+        if len(rows) == page_size:
+            flush_page()
+            rows, failures = [], 0
+    if rows or not pages:
+        flush_page()
+
+    summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(totals.items())) or "no results"
+    links = "".join(
+        f"<li><a href='{name}'>{name}</a> - {count} tests"
+        + (f", <span style='color:#c22'>{failed} failed</span>" if failed else "")
+        + "</li>"
+        for name, count, failed in pages
+    )
+    with open(os.path.join(directory, "index.html"), "w", encoding="utf-8") as f:
+        f.write(
+            f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Test results</title>{PAGE_STYLE}</head>"
+            f"<body><h1>Test results</h1><p>{summary}</p><ul>{links}</ul></body></html>"
+        )
+    return totals
+
+
+class StreamingResults:
+    """Streams test records to a JSONL shard per process and merges the shards into a paginated index"""
+
+    def __init__(self, config):
+        self.directory = config.getoption("--stream-report")
+        worker = getattr(config, "workerinput", None)
+        self.is_worker = worker is not None
+        if not self.is_worker:
+            clear_shards(self.directory)
+        self.reporter = StreamingReporter(self.directory, worker["workerid"] if worker else "main")
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        # Reports stay in memory (terminal summary, pytest-html) until the session ends, so
+        # they keep only paths to the stored screenshots/HARs, not the content
+        extras = getattr(report, "extras", None)
+        if extras:
+            report.extras = [self.reporter.attachments.stored_extra(extra) for extra in extras]
+
+    def pytest_runtest_logreport(self, report):
+        # Reports relayed from xdist workers carry their node and are already in the worker's shard
+        if getattr(report, "node", None) is None:
+            self.reporter.add_report(report)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.reporter.close()
+        if not self.is_worker:
+            try:
+                render_index(self.directory)
+            except Exception as e:
+                print(f"\n❌ Streaming report error: {e}")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_line(f"Streaming report: {os.path.join(self.directory, 'index.html')}")
+
+
+if __name__ == "__main__":
+    # Re-render the index on demand: python -m utils.stream_report reports/stream
+    print(render_index(sys.argv[1] if len(sys.argv) > 1 else os.path.join("reports", "stream")))
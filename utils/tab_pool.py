@@ -0,0 +1,168 @@
+import asyncio
+import time
+from contextlib import contextmanager
+
+
+# Marks the current document so readiness polling can tell it apart from the next one
+MARK_PENDING_SCRIPT = """
+window.__tabPoolPending = true;
+window.location.href = arguments[0];
+"""
+
+READY_STATE_SCRIPT = """
+return !window.__tabPoolPending && location.href !== 'about:blank' && document.readyState === 'complete';
+"""
+
+
+class TabPool:
+    """Pool of browser tabs inside one WebDriver session that load and poll pages concurrently"""
+
+    def __init__(self, driver, size, include_current=False):
+        """
+        Args:
+            driver: WebDriver instance
+            size: Number of tabs in the pool
+            include_current: Use the current tab as the pool's first tab (it is not closed by close())
+        """
+        self.driver = driver
+        self.size = size
+        self.include_current = include_current
+        self.handles = []
+        self.origin_handle = None
+        self.assignments = {}
+
+    def open(self):
+        """Open pool tabs, remembering the tab that was active before"""
+        self.origin_handle = self.driver.current_window_handle
+        if self.include_current:
+            self.handles.append(self.origin_handle)
+        while len(self.handles) < self.size:
+            self.driver.switch_to.new_window("tab")
+            self.handles.append(self.driver.current_window_handle)
+        self.driver.switch_to.window(self.origin_handle)
+        return self
+
+    def close(self):
+        """Close pool tabs and switch back to the original tab"""
+        for handle in self.handles:
+            if handle == self.origin_handle:
+                continue
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                pass
+        self.handles = []
+        self.assignments = {}
+        if self.origin_handle:
+            self.driver.switch_to.window(self.origin_handle)
+
+    def switch_to(self, handle):
+        """Make handle the current tab (skipped when it already is)"""
+        if self.driver.current_window_handle != handle:
+            self.driver.switch_to.window(handle)
+
+    # Work assignment
+
+    def assign(self, key, handle):
+        """Pin key (e.g. a test class name) to handle"""
+        self.assignments[key] = handle
+
+    def handle_for(self, key):
+        """Get the tab pinned to key, pinning it to the least used tab on first request"""
+        if key not in self.assignments:
+            load = {handle: 0 for handle in self.handles}
+            for handle in self.assignments.values():
+                load[handle] += 1
+            self.assignments[key] = min(self.handles, key=lambda handle: load[handle])
+        return self.assignments[key]
+
+    # Concurrent driving
+
+    def dispatch(self, steps, timeout=30, poll=0.1):
+        """Drive polling steps in several tabs concurrently with an asyncio dispatcher
+
+        Args:
+            steps: list of (handle, step); step(driver) runs with its tab current and
+                returns a truthy result when done, falsy to be polled again
+            timeout: Seconds before a step that never finished gives up
+            poll: Seconds between polls of the same step
+
+        Returns:
+            list of (result, seconds until done) per step, result None on timeout
+        """
+        async def drive(handle, step, lock, started):
+            while True:
+                async with lock:
+                    self.switch_to(handle)
+                    result = step(self.driver)
+                elapsed = time.perf_counter() - started
+                if result:
+                    return result, elapsed
+                if elapsed >= timeout:
+                    return None, elapsed
+                await asyncio.sleep(poll)
+
+        async def drive_all():
+            lock = asyncio.Lock()
+            started = time.perf_counter()
+            return await asyncio.gather(*(drive(handle, step, lock, started) for handle, step in steps))
+
+        return asyncio.run(drive_all())
+
+    def start_navigation(self, handle, url):
+        """Start loading url in tab without waiting for it"""
+        self.switch_to(handle)
+        self.driver.execute_script(MARK_PENDING_SCRIPT, url)
+
+    def wait_until_ready(self, handles, timeout=30, poll=0.1):
+        """Wait until each tab has finished loading
+
+        Returns:
+            dict of handle -> seconds until it was seen ready (None if it timed out)
+        """
+        results = self.dispatch(
+            [(handle, lambda driver: driver.execute_script(READY_STATE_SCRIPT)) for handle in handles],
+            timeout,
+            poll,
+        )
+        return {
+            handle: seconds if result else None
+            for handle, (result, seconds) in zip(handles, results)
+        }
+
+    def load_all(self, urls, timeout=30):
+        """Load up to len(handles) urls concurrently, one per tab
+
+        Returns:
+            list of (handle, url, seconds until ready or None)
+        """
+        assigned = list(zip(self.handles, urls))
+        for handle, url in assigned:
+            self.start_navigation(handle, url)
+        ready = self.wait_until_ready([handle for handle, _ in assigned], timeout)
+        return [(handle, url, ready[handle]) for handle, url in assigned]
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@contextmanager
+def isolated_tab(driver, url=None):
+    """Open a separate tab (loading url), yield its handle, then close it and switch back"""
+    origin = driver.current_window_handle
+    driver.switch_to.new_window("tab")
+    handle = driver.current_window_handle
+    try:
+        if url:
+            driver.get(url)
+        yield handle
+    finally:
+        try:
+            driver.switch_to.window(handle)
+            driver.close()
+        finally:
+            driver.switch_to.window(origin)
@@ -0,0 +1,220 @@
+import json
+from html import escape
+from urllib.parse import urlsplit
+
+
+# Collects resource timing plus buffered long-animation-frame script timings and long tasks
+# (each observed only where the browser supports the entry type)
+THIRD_PARTY_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const supported = PerformanceObserver.supportedEntryTypes || [];
+const navigation = performance.getEntriesByType('navigation')[0];
+const result = {
+    page_url: location.href,
+    load_ms: navigation ? Math.round(navigation.loadEventEnd) : null,
+    supported: {long_animation_frame: supported.includes('long-animation-frame'), longtask: supported.includes('longtask')},
+    resources: performance.getEntriesByType('resource').map(entry => ({
+        url: entry.name,
+        initiator_type: entry.initiatorType,
+        start_ms: entry.startTime,
+        end_ms: entry.responseEnd,
+        transfer_bytes: entry.transferSize,
+        encoded_bytes: entry.encodedBodySize,
+    })),
+    scripts: [],
+    long_tasks: [],
+};
+
+const observers = [];
+if (result.supported.long_animation_frame) {
+    const observer = new PerformanceObserver(list => {
+        for (const frame of list.getEntries()) {
+            for (const script of frame.scripts || []) {
+                result.scripts.push({
+                    source_url: script.sourceURL,
+                    invoker: script.invoker,
+                    duration_ms: script.duration,
+                    forced_layout_ms: script.forcedStyleAndLayoutDuration,
+                });
+            }
+        }
+    });
+    observer.observe({type: 'long-animation-frame', buffered: true});
+    observers.push(observer);
+}
+if (result.supported.longtask) {
+    const observer = new PerformanceObserver(list => {
+        for (const task of list.getEntries()) {
+            const attribution = (task.attribution || [])[0];
+            result.long_tasks.push({duration_ms: task.duration, container_src: attribution ? attribution.containerSrc : ''});
+        }
+    });
+    observer.observe({type: 'longtask', buffered: true});
+    observers.push(observer);
+}
+
+// Buffered entries are delivered asynchronously
+setTimeout(() => {
+    observers.forEach(observer => observer.disconnect());
+    done(result);
+}, 200);
+"""
+
+
+def origin_of(url):
+    """scheme://host[:port] of url, or None for non-network URLs (data:, blob:, about:)"""
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc.lower()}"
+
+
+def is_first_party(origin, first_party_domains):
+    """Check if origin's host is one of first_party_domains or a subdomain of one"""
+    host = urlsplit(origin).hostname or ""
+    return any(host == domain or host.endswith(f".{domain}") for domain in first_party_domains)
+
+
+def covered_ms(intervals, window_end=None):
+    """Length of the union of (start, end) intervals, clipped to [0, window_end]"""
+    total, reach = 0.0, 0.0
+    for start, end in sorted(intervals):
+        if window_end is not None:
+            end = min(end, window_end)
+        start = max(start, reach)
+        if end > start:
+            total += end - start
+            reach = end
+    return total
+
+
+def main_thread_source(data):
+    """Entry type main-thread time is taken from: LoAF script timings, else long tasks, else None"""
+    if data["scripts"]:
+        return "long_animation_frame"
+    if data["supported"]["longtask"]:
+        return "longtask"
+    if data["supported"]["long_animation_frame"]:
+        return "long_animation_frame"
+    return None
+
+
+def build_third_party_report(driver, first_party_domains=("leagueoflegends.com",)):
+    """Group network and main-thread cost by origin
+
+    Args:
+        driver: WebDriver instance with the page loaded
+        first_party_domains: Registrable domains counted as first party
+
+    Returns:
+        dict with "origins" (origin -> requests, bytes, network time, load share, script
+        and long-task time, main-thread time and share, third_party flag), "third_party" totals,
+        the page's load_ms, which entry types the browser supports and the main_thread_source
+        (None when neither is supported, main-thread values are then None)
+    """
+    data = driver.execute_async_script(THIRD_PARTY_SCRIPT)
+    load_ms = data["load_ms"] or None
+
+    origins = {}
+
+    def origin_entry(origin):
+        return origins.setdefault(origin, {
+            "third_party": not is_first_party(origin, first_party_domains),
+            "requests": 0,
+            "transfer_bytes": 0,
+            "encoded_bytes": 0,
+            "intervals": [],
+            "script_ms": 0.0,
+            "forced_layout_ms": 0.0,
+            "long_task_ms": 0.0,
+        })
+
+    for resource in data["resources"]:
+        origin = origin_of(resource["url"])
+        if not origin:
+            continue
+        entry = origin_entry(origin)
+        entry["requests"] += 1
+        entry["transfer_bytes"] += resource["transfer_bytes"]
+        entry["encoded_bytes"] += resource["encoded_bytes"]
+        entry["intervals"].append((resource["start_ms"], resource["end_ms"]))
+
+    for script in data["scripts"]:
+        entry = origin_entry(origin_of(script["source_url"]) or origin_of(data["page_url"]))
+        entry["script_ms"] += script["duration_ms"]
+        entry["forced_layout_ms"] += script["forced_layout_ms"] or 0
+
+    # Long tasks only name their source when it is an iframe; the rest stay with the page
+    for task in data["long_tasks"]:
+        entry = origin_entry(origin_of(task["container_src"]) or origin_of(data["page_url"]))
+        entry["long_task_ms"] += task["duration_ms"]
+
+    source = main_thread_source(data)
+    metric = {"long_animation_frame": "script_ms", "longtask": "long_task_ms"}.get(source)
+    total_main_thread_ms = sum(entry[metric] for entry in origins.values()) if metric else 0
+    for entry in origins.values():
+        intervals = entry.pop("intervals")
+        entry["network_ms"] = round(covered_ms(intervals))
+        entry["load_share"] = round(covered_ms(intervals, load_ms) / load_ms, 3) if load_ms else None
+        entry["main_thread_ms"] = round(entry[metric]) if metric else None
+        entry["main_thread_share"] = (
+            round(entry[metric] / total_main_thread_ms, 3) if metric and total_main_thread_ms else None
+        )
+        entry["script_ms"] = round(entry["script_ms"], 1)
+        entry["forced_layout_ms"] = round(entry["forced_layout_ms"], 1)
+        entry["long_task_ms"] = round(entry["long_task_ms"], 1)
+
+    third_party = [entry for entry in origins.values() if entry["third_party"]]
+    totals = {
+        "origins": len(third_party),
+        "requests": sum(entry["requests"] for entry in third_party),
+        "transfer_bytes": sum(entry["transfer_bytes"] for entry in third_party),
+        "main_thread_ms": sum(entry["main_thread_ms"] for entry in third_party) if metric else None,
+        "main_thread_share": (
+            round(sum(entry[metric] for entry in third_party) / total_main_thread_ms, 3)
+            if metric and total_main_thread_ms else None
+        ),
+    }
+
+    return {
+        "page_url": data["page_url"],
+        "load_ms": load_ms,
+        "supported": data["supported"],
+        "main_thread_source": source,
+        "origins": dict(sorted(origins.items(), key=lambda item: item[1]["transfer_bytes"], reverse=True)),
+        "third_party": totals,
+    }
+
+
+def write_third_party_report(report, json_path, html_path):
+    """Write third-party cost report as JSON and an HTML table"""
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    rows = []
+    for origin, entry in report["origins"].items():
+        rows.append(
+            f"<tr class='{'third' if entry['third_party'] else ''}'>"
+            f"<td>{escape(origin)}</td>"
+            f"<td>{entry['requests']}</td>"
+            f"<td>{entry['transfer_bytes'] / 1024:.1f}</td>"
+            f"<td>{entry['network_ms']}</td>"
+            f"<td>{entry['load_share'] if entry['load_share'] is not None else '-'}</td>"
+            f"<td>{entry['main_thread_ms'] if entry['main_thread_ms'] is not None else '-'}</td>"
+            f"<td>{entry['main_thread_share'] if entry['main_thread_share'] is not None else '-'}</td>"
+            "</tr>"
+        )
+
+    html = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Third-party cost by origin</title>"
+        "<style>table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}"
+        ".third{background:#fff4e0}</style></head><body><h1>Third-party cost by origin</h1>"
+        f"<p>Load: {report['load_ms']} ms; third-party main-thread share: "
+        f"{report['third_party']['main_thread_share']}</p><table>"
+        "<tr><th>Origin</th><th>Requests</th><th>Transfer (KiB)</th><th>Network (ms)</th>"
+        "<th>Load share</th><th>Main thread (ms)</th><th>Main-thread share</th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(html)
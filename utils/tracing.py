@@ -0,0 +1,560 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.wait import WebDriverWait
+
+from utils.locator_index import is_locator
+
+
+# OTLP span kinds and status codes (opentelemetry/proto/trace/v1/trace.proto)
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+STATUS_OK, STATUS_ERROR = 1, 2
+
+
+def format_locator(locator):
+    """Render a locator as 'strategy=value'"""
+    return f"{locator[0]}={locator[1]}"
+
+
+def describe_condition(method):
+    """Name of a wait condition and the locator it closes over, if any"""
+    name = getattr(method, "__qualname__", None) or type(method).__name__
+    cells = getattr(method, "__closure__", None) or ()
+    locators = [cell.cell_contents for cell in cells if is_locator(getattr(cell, "cell_contents", None))]
+    return name.replace(".<locals>", ""), (format_locator(locators[0]) if locators else None)
+
+
+class Tracer:
+    """Collects OpenTelemetry-style spans for one test session, nested per thread"""
+
+    def __init__(self, service_name="leagueoflegends-automation"):
+        self.service_name = service_name
+        self.trace_id = os.urandom(16).hex()
+        self.spans = []
+        self.root = None
+        # WebElement id -> locator it was found with, so blade spans can name their blade
+        self.element_names = {}
+        self.lock = threading.Lock()
+        self._local = threading.local()
+        self._patched = []
+        self._offset_ns = time.time_ns() - time.perf_counter_ns()
+
+    # Span lifecycle
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @property
+    def current(self):
+        """Innermost open span of this thread (the session root for threads without one)"""
+        stack = self._stack()
+        return stack[-1] if stack else self.root
+
+    def perf_to_ns(self, perf_seconds):
+        """Convert a time.perf_counter() reading to Unix nanoseconds"""
+        return int(perf_seconds * 1e9) + self._offset_ns
+
+    def start_span(self, name, kind="internal", start_ns=None, **attributes):
+        """Open a span as a child of the current one and make it current"""
+        parent = self.current
+        span = {
+            "trace_id": self.trace_id,
+            "span_id": os.urandom(8).hex(),
+            "parent_span_id": parent["span_id"] if parent else None,
+            "name": name,
+            "kind": kind,
+            "start_ns": start_ns or time.time_ns(),
+            "end_ns": None,
+            "attributes": {key: value for key, value in attributes.items() if value is not None},
+            "status": STATUS_OK,
+        }
+        if self.root is None:
+            self.root = span
+        else:
+            self._stack().append(span)
+        return span
+
+    def end_span(self, span, error=None, end_ns=None):
+        """Close span (and any children left open on this thread)"""
+        stack = self._stack()
+        if any(item is span for item in stack):
+            while stack and stack.pop() is not span:
+                pass
+        span["end_ns"] = end_ns or time.time_ns()
+        if error is not None:
+            span["status"] = STATUS_ERROR
+            span["attributes"]["exception.type"] = type(error).__name__
+            span["attributes"]["exception.message"] = str(error).splitlines()[0] if str(error) else ""
+        if span is self.root:
+            self.root = None
+        with self.lock:
+            self.spans.append(span)
+        return span
+
+    @contextmanager
+    def span(self, name, kind="internal", **attributes):
+        """Context manager around start_span/end_span recording raised exceptions"""
+        span = self.start_span(name, kind, **attributes)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, error=e)
+            raise
+        self.end_span(span)
+
+    def record_span(self, name, start_ns, end_ns, kind="internal", **attributes):
+        """Add an already finished span as a child of the current one"""
+        span = self.start_span(name, kind, start_ns=start_ns, **attributes)
+        return self.end_span(span, end_ns=end_ns)
+
+    # Instrumentation
+
+    def record_command(self, command, params, started, elapsed):
+        """CommandRecorder listener turning each WebDriver command into a client span"""
+        params = params or {}
+        locator = f"{params['using']}={params['value']}" if "using" in params and "value" in params else None
+        start_ns = self.perf_to_ns(started)
+        self.record_span(
+            f"webdriver {command}", start_ns, start_ns + int(elapsed * 1e9), "client",
+            **{
+                "webdriver.command": command,
+                "locator": locator,
+                "url.full": params.get("url"),
+                "element.locator": self.element_names.get(params.get("id")),
+            }
+        )
+
+    def _wrap_method(self, name, function):
+        tracer = self
+
+        @functools.wraps(function)
+        def traced(instance, *args, **kwargs):
+            locator = next((arg for arg in list(args) + list(kwargs.values()) if is_locator(arg)), None)
+            blade = getattr(instance, "blade", None)
+            attributes = {
+                "code.namespace": type(instance).__name__,
+                "code.function": name,
+                "locator": format_locator(locator) if locator else None,
+                "blade.id": tracer.element_names.get(blade.id) if isinstance(blade, WebElement) else None,
+                "blade.name": args[0] if name == "get_blade" and args else None,
+            }
+            with tracer.span(f"{type(instance).__name__}.{name}", **attributes):
+                result = function(instance, *args, **kwargs)
+            if locator and isinstance(result, WebElement):
+                tracer.element_names[result.id] = locator[1] if locator[0] == By.ID else format_locator(locator)
+            return result
+
+        traced.__traced__ = function
+        traced.__tracer__ = tracer
+        return traced
+
+    def _wrap_wait(self, name, function):
+        tracer = self
+
+        @functools.wraps(function)
+        def traced(wait, method, message=""):
+            condition, locator = describe_condition(method)
+            with tracer.span(
+                f"WebDriverWait.{name}",
+                **{"wait.timeout": getattr(wait, "_timeout", None), "wait.condition": condition, "locator": locator}
+            ):
+                return function(wait, method, message)
+
+        traced.__traced__ = function
+        traced.__tracer__ = tracer
+        return traced
+
+    def _wraps(self, function):
+        return getattr(function, "__tracer__", None) is self
+
+    def instrument(self, classes):
+        """Open a span around every public method defined by classes (not inherited ones) and every WebDriverWait"""
+        for cls in classes:
+            for name, function in list(vars(cls).items()):
+                if name.startswith("_") or not inspect.isfunction(function) or self._wraps(function):
+                    continue
+                self._patched.append((cls, name, function))
+                setattr(cls, name, self._wrap_method(name, function))
+        for name in ("until", "until_not"):
+            function = vars(WebDriverWait)[name]
+            if not self._wraps(function):
+                self._patched.append((WebDriverWait, name, function))
+                setattr(WebDriverWait, name, self._wrap_wait(name, function))
+        return self
+
+    def uninstrument(self):
+        """Restore the original methods"""
+        for cls, name, function in reversed(self._patched):
+            setattr(cls, name, function)
+        self._patched = []
+
+
+def page_object_classes():
+    """BasePage, BaseBlade and all their subclasses (importing HomePage registers every blade)"""
+    from pages.base_page import BasePage
+    from pages.home_page import HomePage  # noqa: F401
+    from components.base_blade import BaseBlade
+
+    classes, pending = [], [BasePage, BaseBlade]
+    while pending:
+        cls = pending.pop()
+        if cls not in classes:
+            classes.append(cls)
+            pending.extend(cls.__subclasses__())
+    return classes
+
+
+# Export
+
+def otlp_value(value):
+    """Wrap a Python value as an OTLP AnyValue"""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_json(spans, service_name="leagueoflegends-automation"):
+    """Build an OTLP/JSON ExportTraceServiceRequest"""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": otlp_value(service_name)}]},
+            "scopeSpans": [{
+                "scope": {"name": "tests.conftest"},
+                "spans": [
+                    {
+                        "traceId": span["trace_id"],
+                        "spanId": span["span_id"],
+                        **({"parentSpanId": span["parent_span_id"]} if span["parent_span_id"] else {}),
+                        "name": span["name"],
+                        "kind": SPAN_KINDS[span["kind"]],
+                        "startTimeUnixNano": str(span["start_ns"]),
+                        "endTimeUnixNano": str(span["end_ns"]),
+                        "attributes": [
+                            {"key": key, "value": otlp_value(value)} for key, value in span["attributes"].items()
+                        ],
+                        "status": {"code": span["status"]},
+                    }
+                    for span in spans
+                ],
+            }],
+        }]
+    }
+
+
+def spans_from_otlp(payload):
+    """Flatten an OTLP/JSON request back into span dicts"""
+    kinds = {code: kind for kind, code in SPAN_KINDS.items()}
+    spans = []
+    for resource in payload.get("resourceSpans", []):
+        for scope in resource.get("scopeSpans", []):
+            for span in scope.get("spans", []):
+                spans.append({
+                    "trace_id": span["traceId"],
+                    "span_id": span["spanId"],
+                    "parent_span_id": span.get("parentSpanId"),
+                    "name": span["name"],
+                    "kind": kinds.get(span.get("kind"), "internal"),
+                    "start_ns": int(span["startTimeUnixNano"]),
+                    "end_ns": int(span["endTimeUnixNano"]),
+                    "attributes": {item["key"]: next(iter(item["value"].values())) for item in span.get("attributes", [])},
+                    "status": span.get("status", {}).get("code", STATUS_OK),
+                })
+    return spans
+
+
+def write_otlp(spans, path, service_name="leagueoflegends-automation"):
+    """Write spans as an OTLP/JSON file"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(otlp_json(spans, service_name), f)
+
+
+def export_otlp(spans, endpoint, service_name="leagueoflegends-automation", timeout=10):
+    """POST spans as OTLP/JSON to a collector's /v1/traces endpoint"""
+    request = urllib.request.Request(
+        endpoint,
+        data=json.dumps(otlp_json(spans, service_name)).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.status
+
+
+class OtlpCollectorHandler(BaseHTTPRequestHandler):
+    """Accepts OTLP/JSON POSTs on /v1/traces"""
+
+    collector = None
+
+    def do_POST(self):
+        if self.path != "/v1/traces" or "json" not in self.headers.get("Content-Type", ""):
+            self.send_error(404 if self.path != "/v1/traces" else 415)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            self.collector.receive(json.loads(body))
+        except ValueError:
+            self.send_error(400)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class OtlpCollector:
+    """Local stand-in for an OpenTelemetry collector's OTLP/HTTP JSON receiver"""
+
+    def __init__(self, host="127.0.0.1", port=0, path=None):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.spans = []
+        self.lock = threading.Lock()
+        self.server = None
+
+    @property
+    def endpoint(self):
+        """URL to export traces to"""
+        return f"http://{self.host}:{self.server.server_address[1]}/v1/traces"
+
+    def receive(self, payload):
+        """Store one export request"""
+        spans = spans_from_otlp(payload)
+        with self.lock:
+            self.spans.extend(spans)
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(payload) + "\n")
+
+    def start(self):
+        """Start listening in a daemon thread"""
+        handler = type("BoundOtlpCollectorHandler", (OtlpCollectorHandler,), {"collector": self})
+        self.server = ThreadingHTTPServer((self.host, self.port), handler)
+        threading.Thread(target=self.server.serve_forever, name="otlp-collector", daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stop listening"""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+# Analysis
+
+def critical_path(spans):
+    """Segments of the chain of spans that determined when the root span finished
+
+    Returns:
+        list of {"span_id", "name", "start_ns", "end_ns"} segments in time order
+    """
+    finished = [span for span in spans if span["end_ns"] is not None]
+    ids = {span["span_id"] for span in finished}
+    roots = [span for span in finished if span["parent_span_id"] not in ids]
+    if not roots:
+        return []
+    children = {}
+    for span in finished:
+        children.setdefault(span["parent_span_id"], []).append(span)
+
+    segments = []
+
+    def walk(span, limit):
+        cursor = min(span["end_ns"], limit)
+        for child in sorted(children.get(span["span_id"], []), key=lambda child: child["end_ns"], reverse=True):
+            if child["start_ns"] >= cursor or child["start_ns"] < span["start_ns"]:
+                continue
+            child_end = min(child["end_ns"], cursor)
+            if cursor > child_end:
+                segments.append({"span_id": span["span_id"], "name": span["name"], "start_ns": child_end, "end_ns": cursor})
+            walk(child, child_end)
+            cursor = child["start_ns"]
+        if cursor > span["start_ns"]:
+            segments.append({"span_id": span["span_id"], "name": span["name"], "start_ns": span["start_ns"], "end_ns": cursor})
+
+    walk(max(roots, key=lambda span: span["end_ns"] - span["start_ns"]), float("inf"))
+    return sorted(segments, key=lambda segment: segment["start_ns"])
+
+
+def summarize_critical_path(segments, top=15):
+    """Time on the critical path per span name, largest first"""
+    totals = {}
+    for segment in segments:
+        entry = totals.setdefault(segment["name"], {"name": segment["name"], "ms": 0.0, "segments": 0})
+        entry["ms"] += (segment["end_ns"] - segment["start_ns"]) / 1e6
+        entry["segments"] += 1
+    ranked = sorted(totals.values(), key=lambda entry: entry["ms"], reverse=True)[:top]
+    for entry in ranked:
+        entry["ms"] = round(entry["ms"], 1)
+    return ranked
+
+
+def waterfall_svg(spans, critical_ids, width=1100, row=14, label=360):
+    """Waterfall of spans (depth-first, indented by depth) as inline SVG, critical path in red"""
+    by_id = {span["span_id"]: span for span in spans}
+    children = {}
+    for span in spans:
+        children.setdefault(span["parent_span_id"] if span["parent_span_id"] in by_id else None, []).append(span)
+
+    ordered = []
+
+    def visit(span, depth):
+        ordered.append((span, depth))
+        for child in sorted(children.get(span["span_id"], []), key=lambda child: child["start_ns"]):
+            visit(child, depth + 1)
+
+    for root in sorted(children.get(None, []), key=lambda span: span["start_ns"]):
+        visit(root, 0)
+    if not ordered:
+        return ""
+
+    start = min(span["start_ns"] for span in spans)
+    span_ns = max(span["end_ns"] for span in spans) - start or 1
+    scale = (width - label - 10) / span_ns
+    rows = []
+    for index, (span, depth) in enumerate(ordered):
+        y = index * row
+        duration_ms = (span["end_ns"] - span["start_ns"]) / 1e6
+        color = "#d33" if span["span_id"] in critical_ids else ("#e90" if span["status"] == STATUS_ERROR else "#49c")
+        details = ", ".join(f"{key}={value}" for key, value in span["attributes"].items())
+        rows.append(
+            f"<text x='{depth * 8}' y='{y + 10}' font-size='10'>{escape(span['name'][:60 - depth])}</text>"
+            f"<rect x='{label + (span['start_ns'] - start) * scale:.1f}' y='{y + 2}' "
+            f"width='{max(1, (span['end_ns'] - span['start_ns']) * scale):.1f}' height='{row - 4}' fill='{color}'>"
+            f"<title>{escape(span['name'])} {duration_ms:.1f} ms {escape(details)}</title></rect>"
+        )
+    return (
+        f"<svg xmlns='http://www.w3.org/2000/svg' width='{width}' height='{len(ordered) * row + 4}'>"
+        + "".join(rows)
+        + "</svg>"
+    )
+
+
+def write_trace_viewer(spans, path):
+    """Write a static HTML viewer: critical path summary plus a waterfall per test"""
+    segments = critical_path(spans)
+    critical_ids = {segment["span_id"] for segment in segments}
+    by_id = {span["span_id"]: span for span in spans}
+    root_ids = {span["span_id"] for span in spans if span["parent_span_id"] not in by_id}
+    total_ms = sum((by_id[root_id]["end_ns"] - by_id[root_id]["start_ns"]) / 1e6 for root_id in root_ids)
+
+    # One section per direct child of the root (tests, session-scoped setup)
+    subtrees = {}
+    for span in spans:
+        top = span
+        while top["parent_span_id"] in by_id and top["parent_span_id"] not in root_ids:
+            top = by_id[top["parent_span_id"]]
+        if top["span_id"] not in root_ids:
+            subtrees.setdefault(top["span_id"], []).append(span)
+
+    sections = []
+    for top_id, members in sorted(subtrees.items(), key=lambda item: by_id[item[0]]["start_ns"]):
+        top = by_id[top_id]
+        duration_ms = (top["end_ns"] - top["start_ns"]) / 1e6
+        marker = " &#9679;" if top_id in critical_ids else ""
+        sections.append(
+            f"<details><summary>{escape(top['name'])} - {duration_ms:.0f} ms, {len(members)} spans{marker}</summary>"
+            + waterfall_svg(members, critical_ids)
+            + "</details>"
+        )
+
+    summary_rows = "".join(
+        f"<tr><td>{escape(entry['name'])}</td><td>{entry['ms']}</td><td>{entry['segments']}</td></tr>"
+        for entry in summarize_critical_path(segments)
+    )
+    html = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Test session trace</title>"
+        "<style>table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}"
+        "summary{cursor:pointer;padding:2px}</style></head>"
+        "<body style='font-family:sans-serif'><h1>Test session trace</h1>"
+        f"<p>{len(spans)} spans over {total_ms:.0f} ms. Critical path spans are red, errors orange.</p>"
+        "<h2>Critical path by span</h2><table><tr><th>Span</th><th>Time on path (ms)</th><th>Segments</th></tr>"
+        + summary_rows
+        + "</table><h2>Waterfall</h2>"
+        + "".join(sections)
+        + "</body></html>"
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+
+class SessionTracing:
+    """Spans for the session, each test and its phases, with page objects and waits instrumented"""
+
+    def __init__(self, config):
+        self.config = config
+        self.tracer = Tracer().instrument(page_object_classes())
+        self.session = None
+        self.tests = {}
+
+    def pytest_sessionstart(self, session):
+        self.session = self.tracer.start_span("pytest session", **{"pytest.args": " ".join(self.config.args)})
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        span = self.tracer.start_span(item.nodeid, **{"test.class": item.cls.__name__ if item.cls else None})
+        self.tests[item.nodeid] = span
+        yield
+        self.tracer.end_span(self.tests.pop(item.nodeid))
+
+    def _phase(self, item, phase):
+        span = self.tracer.start_span(f"{phase} {item.name}", **{"pytest.phase": phase})
+        outcome = yield
+        self.tracer.end_span(span, error=outcome.excinfo[1] if outcome.excinfo else None)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        yield from self._phase(item, "setup")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield from self._phase(item, "call")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        yield from self._phase(item, "teardown")
+
+    def pytest_runtest_logreport(self, report):
+        span = self.tests.get(report.nodeid)
+        if span and (report.when == "call" or report.outcome != "passed"):
+            span["attributes"]["test.outcome"] = report.outcome
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.tracer.end_span(self.session)
+        self.tracer.uninstrument()
+        spans = self.tracer.spans
+        if self.config.getoption("--trace-spans"):
+            try:
+                os.makedirs("reports", exist_ok=True)
+                write_otlp(spans, os.path.join("reports", "trace.json"))
+                write_trace_viewer(spans, os.path.join("reports", "trace.html"))
+            except Exception as e:
+                print(f"\n❌ Trace export error: {e}")
+        endpoint = self.config.getoption("--trace-endpoint")
+        if endpoint:
+            try:
+                export_otlp(spans, endpoint)
+            except Exception as e:
+                print(f"\n❌ Trace export to {endpoint} failed: {e}")